@@ -0,0 +1,486 @@
+#!/usr/bin/env python3
+"""
+Asyncio Seeding Engine
+Alternative to the threaded engine in main.py, selected with SEEDER_ENGINE=async.
+
+Every USCCB page, bible-api.com passage and Firestore read/write of a run is
+awaited on one event loop (httpx for HTTP, google.cloud.firestore.AsyncClient
+for Firestore), so hundreds of I/O waits overlap on a single thread.
+Requests, response handling, parsing, the caches and the decision of what to
+write come from main.py, so both engines seed identical documents. An
+AsyncEngine keeps the event loop and clients for a whole invocation.
+"""
+import asyncio
+import contextlib
+import logging
+import os
+import time
+from datetime import date
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import firebase_admin
+import httpx
+from google.cloud import firestore as gcloud_firestore
+
+import main
+
+logger = logging.getLogger(__name__)
+
+# Dates in flight at once; per-host HTTP limits still apply on top of this
+ASYNC_SEED_CONCURRENCY = int(os.environ.get('ASYNC_SEED_CONCURRENCY', '64'))
+
+
+def async_firestore_client(project: str) -> gcloud_firestore.AsyncClient:
+    """
+    AsyncClient for a project, using the credentials initialize_firebase set up
+
+    Args:
+        project: 'primary' or 'secondary'
+    """
+    main.initialize_firebase(project)
+    app = firebase_admin.get_app(project)
+    return gcloud_firestore.AsyncClient(project=app.project_id, credentials=app.credential.get_credential())
+
+
+def async_firestore_clients(has_primary: bool, has_secondary: bool) -> Dict:
+    """AsyncClient per project to seed"""
+    projects = (['primary'] if has_primary else []) + (['secondary'] if has_secondary else [])
+    return {project: async_firestore_client(project) for project in projects}
+
+
+async def close_firestore_clients(databases: Dict):
+    """Close AsyncClients, gRPC channels included (AsyncClient.close() leaves those open)"""
+    for project, db in databases.items():
+        try:
+            api = getattr(db, '_firestore_api_internal', None)
+            if api is not None:
+                await api.transport.close()
+            db.close()
+        except Exception as e:
+            logger.warning(f"⚠️  Could not close the {project} Firestore client: {str(e)}")
+
+
+class AsyncEngine:
+    """
+    Event loop, HTTP client and Firestore AsyncClients of one invocation
+
+    A run seeds its range in chunks; every chunk runs on the same loop with
+    the same clients (both are bound to the loop they were opened on), and
+    close() shuts them down once the run is over.
+    """
+
+    def __init__(self):
+        self._runner = asyncio.Runner()
+        self._http_client = None
+        self._databases = None
+
+    def seed_dates(self, target_dates: List[date], dry_run: bool, has_primary: bool, has_secondary: bool,
+                   is_secondary_function: bool, report: Optional[Dict] = None,
+                   deadline: Optional[main.Deadline] = None) -> List[Optional[Dict]]:
+        """Seed one chunk of dates (see seed_dates)"""
+        return self._runner.run(self._seed_dates(
+            target_dates, dry_run, has_primary, has_secondary, is_secondary_function, report, deadline
+        ))
+
+    async def _seed_dates(self, target_dates, dry_run, has_primary, has_secondary, is_secondary_function,
+                          report, deadline):
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(follow_redirects=True)
+        if self._databases is None:
+            self._databases = async_firestore_clients(has_primary, has_secondary)
+        return await seed_dates(
+            target_dates, dry_run, has_primary, has_secondary, is_secondary_function,
+            http_client=self._http_client, databases=self._databases, report=report, deadline=deadline
+        )
+
+    def close(self):
+        """Close the clients and the event loop"""
+        try:
+            self._runner.run(self._close_clients())
+        finally:
+            self._runner.close()
+
+    async def _close_clients(self):
+        if self._http_client is not None:
+            await self._http_client.aclose()
+        if self._databases is not None:
+            await close_firestore_clients(self._databases)
+
+
+class AsyncWriteBatcher(main.FirestoreWriteBatcher):
+    """main.FirestoreWriteBatcher for AsyncClient, whose commits are awaited"""
+
+    async def flush(self) -> Dict[str, str]:
+        """
+        Commit every queued write
+
+        Returns:
+            Dict of doc_id -> error for the writes that failed
+        """
+        failures = {}
+        for chunk in self._take_chunks():
+            batch = self.db.batch()
+            for doc_ref, doc_id, data, merge, messages in chunk:
+                batch.set(doc_ref, data, merge=merge)
+            try:
+                await batch.commit()
+                self._written(chunk)
+                continue
+            except Exception as e:
+                logger.warning(f"⚠️  Batch commit of {len(chunk)} writes failed - retrying one by one: {str(e)}")
+            for write in chunk:
+                doc_ref, doc_id, data, merge, messages = write
+                try:
+                    await doc_ref.set(data, merge=merge)
+                    self._written([write])
+                except Exception as e:
+                    self._write_failed(doc_id, e, failures)
+        return failures
+
+
+class AsyncSeeder:
+    """
+    Seeds dates concurrently on one event loop
+
+    USCCB pages and scripture passages are fetched at most once per run and
+    shared by every date and project that needs them.
+    """
+
+    def __init__(self, http_client: httpx.AsyncClient, databases: Dict, dry_run: bool = False,
+                 concurrency: Optional[int] = None, deadline: Optional[main.Deadline] = None):
+        """
+        Args:
+            http_client: Client for USCCB and bible-api.com requests
+            databases: Firestore AsyncClient (or compatible) per project name
+            dry_run: If True, don't write to Firestore
+            concurrency: Dates in flight at once (defaults to ASYNC_SEED_CONCURRENCY)
+            deadline: Run deadline; caps request timeouts, and dates that get
+                a slot after it passes are deferred
+        """
+        self.http = http_client
+        self.databases = databases
+        self.dry_run = dry_run
+        self.deadline = deadline
+        self._date_slots = asyncio.Semaphore(concurrency or ASYNC_SEED_CONCURRENCY)
+        self._host_limits = {}
+        self._usccb = {}
+        self._texts = {}
+        # Project -> doc_id -> document data (None if missing), see load_states
+        self.states = {}
+        # Project -> batcher queueing the run's writes (empty: write each document directly)
+        self.writers = {}
+        if main.FIRESTORE_BATCH_WRITES and not dry_run:
+            self.writers = {project: AsyncWriteBatcher(db) for project, db in databases.items()}
+
+    @contextlib.asynccontextmanager
+    async def _host_slot(self, url: str):
+        """Hold a request slot with the same per-host politeness limits as the threaded prefetch"""
+        host = urlparse(url).netloc
+        limit = self._host_limits.get(host)
+        if limit is None:
+            limit = self._host_limits[host] = {
+                'semaphore': asyncio.Semaphore(main.MAX_CONNECTIONS_PER_HOST),
+                'next_start': 0.0
+            }
+        async with limit['semaphore']:
+            now = time.monotonic()
+            start_at = max(now, limit['next_start'])
+            limit['next_start'] = start_at + main.MIN_REQUEST_INTERVAL_SECONDS
+            if start_at > now:
+                await asyncio.sleep(start_at - now)
+            yield
+
+    async def _get(self, url: str, **kwargs) -> httpx.Response:
+        """GET within the host's politeness limits"""
+        async with self._host_slot(url):
+            return await self.http.get(url, **kwargs)
+
+    @staticmethod
+    def _once(tasks: Dict, key, factory) -> asyncio.Future:
+        """The shared task for key, started on first request"""
+        task = tasks.get(key)
+        if task is None:
+            task = tasks[key] = asyncio.ensure_future(factory())
+        return task
+
+    def usccb(self, target_date: date) -> asyncio.Future:
+        """Parsed USCCB data for a date (None if unavailable), fetched once per run"""
+        return self._once(self._usccb, target_date, lambda: self._fetch_usccb(target_date))
+
+    def scripture_text(self, reference: str) -> asyncio.Future:
+        """Public domain text for a reference ('' if unavailable), fetched once per run"""
+        return self._once(self._texts, reference, lambda: self._fetch_scripture_text(reference))
+
+    async def _fetch_usccb(self, target_date: date) -> Optional[Dict]:
+        """Async counterpart of main.fetch_usccb_reading_data, streaming the page when USCCB_STREAM is set"""
+        url = main.usccb_reading_url(target_date)
+        logger.info(f"🔎 Fetching USCCB reading data from {url}")
+        cached = main._load_cached_usccb_page(url) if main.USCCB_CACHE_ENABLED else None
+        reader = main._USCCBPageReader(target_date, url) if main.USCCB_STREAM else None
+
+        try:
+            async with self._host_slot(url):
+                async with self.http.stream('GET', url, headers=main._usccb_request_headers(cached),
+                                            timeout=main._timeout(self.deadline, 30)) as response:
+                    if cached and response.status_code == 304:
+                        content, encoding = main._usccb_not_modified(cached, reader)
+                    else:
+                        response.raise_for_status()
+                        encoding = response.encoding or 'utf-8'
+                        chunks = []
+                        partial = False
+                        async for chunk in response.aiter_bytes(main.USCCB_STREAM_CHUNK_SIZE):
+                            chunks.append(chunk)
+                            if reader is not None and reader.feed(chunk, encoding):
+                                partial = True
+                                break
+                        content = b''.join(chunks)
+                        main._usccb_downloaded(url, response, content, partial)
+
+            if reader is not None:
+                result = reader.finish()
+            else:
+                result = main.parse_usccb_reading_html(content, target_date, url, encoding)
+            return main._usccb_reading_result(result, target_date)
+
+        except Exception as e:
+            logger.error(f"❌ Error fetching USCCB data: {str(e)}")
+            return None
+
+    async def _fetch_scripture_text(self, reference: str) -> str:
+        """Async counterpart of main.fetch_public_scripture_text"""
+        passage = main._scripture_passage(reference)
+        if not passage:
+            return ''
+        text = main._stored_scripture_text(reference, passage)
+        if text is not None:
+            return text
+
+        logger.info(f"📖 Fetching scripture text for {reference} from bible-api.com")
+        try:
+            response = await self._get(main._scripture_api_url(passage['book'], [passage]),
+                                       timeout=main._timeout(self.deadline, 10))
+            return main._scripture_response_text(reference, passage, response)
+        except Exception as e:
+            logger.error(f"❌ Error fetching scripture text for {reference}: {str(e)}")
+            return ''
+
+    async def prefetch_scripture_texts(self, target_dates: List[date]):
+        """
+        Fetch every reading of the dates with batched requests (SCRIPTURE_BATCH)
+
+        Async counterpart of main.fetch_public_scripture_texts: the dates' USCCB
+        pages are fetched first, then each book's passages are requested
+        together. Passages left out (rate limited, past the deadline) are
+        fetched on demand when their dates are seeded.
+        """
+        readings = await asyncio.gather(*(self.usccb(target_date) for target_date in target_dates))
+        references = [ref for reading in readings for ref in main._reading_references(reading)]
+        texts, passage_count, batches = main._plan_scripture_batches(references)
+        rate_limited = False
+
+        async def fetch_batch(book, batch):
+            nonlocal rate_limited
+            if rate_limited or (self.deadline is not None and self.deadline.expired()):
+                main._drop_scripture_batch(texts, batch)
+                return
+            logger.info(f"📖 Fetching {len(batch)} {book} passages in one bible-api.com request")
+            verse_texts = {}
+            try:
+                response = await self._get(main._scripture_api_url(book, [p for p, _ in batch]),
+                                           timeout=main._timeout(self.deadline, 10))
+                if response.status_code in main.SCRIPTURE_RATE_LIMIT_STATUSES:
+                    if not rate_limited:
+                        main._scripture_rate_limited(response.status_code)
+                    rate_limited = True
+                    main._drop_scripture_batch(texts, batch)
+                    return
+                response.raise_for_status()
+                verse_texts = main._batch_verse_texts(response.json())
+            except Exception as e:
+                logger.warning(f"⚠️  Batched scripture request for {book} failed: {str(e)}")
+            # Passages the combined response didn't cover are fetched alone
+            for passage, refs in main._apply_scripture_batch(batch, verse_texts, texts):
+                text = await self.scripture_text(refs[0])
+                for reference in refs:
+                    texts[reference] = text
+
+        await asyncio.gather(*(fetch_batch(book, batch) for book, batch in batches))
+        for reference, text in texts.items():
+            if reference not in self._texts:
+                self._texts[reference] = asyncio.get_running_loop().create_future()
+                self._texts[reference].set_result(text)
+        logger.info(f"📖 Resolved {passage_count} unique passages ({len(texts)} references) with batched requests")
+
+    async def _texts_for(self, target_date: date, existing_data: Optional[Dict], usccb_reading) -> Dict[str, str]:
+        """Fetch just the texts plan_daily_reading will ask for"""
+        if not usccb_reading:
+            return {}
+        if existing_data is None or main._has_default_data(target_date, existing_data):
+            references = main._reading_references(usccb_reading)
+        elif not existing_data.get('responsorial_psalm'):
+            references = [usccb_reading.get('responsorialPsalm', {}).get('reference', '')]
+        else:
+            references = []
+        references = [ref for ref in references if ref and ref != 'TBD']
+        texts = await asyncio.gather(*(self.scripture_text(ref) for ref in references))
+        return dict(zip(references, texts))
+
+    async def load_states(self, project: str, target_dates: List[date]):
+        """Read every document in the range with get_all (see main.read_document_states)"""
+        db = self.databases[project]
+        refs = [db.collection('daily_scripture').document(d.strftime('%Y-%m-%d')) for d in target_dates]
+        states = {}
+        try:
+            for i in range(0, len(refs), main.FIRESTORE_GET_ALL_CHUNK_SIZE):
+                async for snapshot in db.get_all(refs[i:i + main.FIRESTORE_GET_ALL_CHUNK_SIZE]):
+                    states[snapshot.id] = snapshot.to_dict() if snapshot.exists else None
+        except Exception as e:
+            logger.warning(f"⚠️  Bulk document read failed - reading documents one by one: {str(e)}")
+            states = {}
+        self.states[project] = states
+
+    async def seed_reading(self, target_date: date, project: str) -> Dict:
+        """Async counterpart of main.seed_daily_reading"""
+        doc_id = target_date.strftime("%Y-%m-%d")
+        doc_ref = self.databases[project].collection('daily_scripture').document(doc_id)
+
+        states = self.states.get(project, {})
+        if doc_id in states:
+            existing_data, usccb_reading = states[doc_id], await self.usccb(target_date)
+        else:
+            snapshot, usccb_reading = await asyncio.gather(doc_ref.get(), self.usccb(target_date))
+            existing_data = snapshot.to_dict() if snapshot.exists else None
+        texts = await self._texts_for(target_date, existing_data, usccb_reading)
+        plan = main.plan_daily_reading(
+            target_date, existing_data, usccb_reading, lambda ref: texts.get(ref, ''), self.dry_run
+        )
+
+        if plan['action'] == 'done':
+            return plan['result']
+
+        writer = self.writers.get(project)
+        if writer is not None:
+            writer.set(doc_ref, doc_id, plan['data'], plan['merge'], plan['messages'])
+            return plan['result']
+
+        try:
+            await doc_ref.set(plan['data'], merge=plan['merge'])
+            for message in plan['messages']:
+                logger.info(message)
+            return plan['result']
+        except Exception as e:
+            logger.error(f"❌ {plan['error_message']} {doc_id}: {str(e)}")
+            return {'status': 'error', 'doc_id': doc_id, 'error': str(e)}
+
+    async def seed_date(self, target_date: date, has_primary: bool, has_secondary: bool) -> Dict[str, Optional[Dict]]:
+        """
+        Seed one date to every initialized project (both concurrently)
+
+        Returns:
+            Dict of project -> result, as main._seed_date_projects returns it
+        """
+        async with self._date_slots:
+            date_str = target_date.strftime('%Y-%m-%d')
+            projects = (['primary'] if has_primary else []) + (['secondary'] if has_secondary else [])
+            if self.deadline is not None and self.deadline.expired():
+                return main._deferred_outcomes(target_date, projects)
+            logger.info(f"📅 Processing date: {date_str}")
+
+            outcomes = dict(zip(projects, await asyncio.gather(
+                *(self.seed_reading(target_date, project) for project in projects), return_exceptions=True
+            )))
+
+            result = outcomes.get('primary')
+            if isinstance(result, BaseException):
+                raise result
+            result_secondary = outcomes.get('secondary')
+            if isinstance(result_secondary, BaseException):
+                logger.warning(f"⚠️ Secondary seeding failed for {date_str}: {str(result_secondary)}")
+                result_secondary = {'status': 'error', 'error': str(result_secondary)}
+            elif result_secondary and result_secondary['status'] != 'success':
+                logger.warning(f"⚠️ Secondary seeding failed for {date_str}: {result_secondary.get('reason', 'Unknown')}")
+
+            return {'primary': result, 'secondary': result_secondary}
+
+    async def flush_writes(self, project_results: List[Dict[str, Optional[Dict]]]) -> Dict:
+        """
+        Commit the queued writes and turn failed ones into error results
+
+        Returns:
+            Write stats per project, as the threaded engine reports them
+        """
+        for project, writer in self.writers.items():
+            main._apply_write_failures(project_results, project, await writer.flush())
+        return {project: writer.stats for project, writer in self.writers.items()}
+
+
+async def seed_dates(target_dates: List[date], dry_run: bool, has_primary: bool, has_secondary: bool,
+                     is_secondary_function: bool, http_client: Optional[httpx.AsyncClient] = None,
+                     databases: Optional[Dict] = None, report: Optional[Dict] = None,
+                     deadline: Optional[main.Deadline] = None) -> List[Optional[Dict]]:
+    """
+    Seed dates with the asyncio engine
+
+    Args:
+        target_dates: Dates to seed
+        dry_run: If True, don't write to Firestore
+        has_primary / has_secondary: Which projects to seed
+        is_secondary_function: Running as the secondary-only deployment
+        http_client: HTTP client to use (a new one is opened and closed when not given)
+        databases: Firestore client per project (AsyncClients are opened and
+            closed when not given; AsyncEngine shares them across chunks)
+        report: Dict that receives the run's report fields (plan and write stats)
+        deadline: Run deadline; dates are started in the order given and the
+            ones that don't start before it come back 'deferred'
+
+    Returns:
+        Per-date results in date order, as main._seed_dates_threaded returns them
+    """
+    own_databases = databases is None
+    if own_databases:
+        databases = async_firestore_clients(has_primary, has_secondary)
+    own_client = http_client is None
+    if own_client:
+        http_client = httpx.AsyncClient(follow_redirects=True)
+    try:
+        seeder = AsyncSeeder(http_client, databases, dry_run, deadline=deadline)
+        await asyncio.gather(*(seeder.load_states(project, target_dates) for project in databases))
+        logger.info(f"⚡ Seeding {len(target_dates)} dates with the asyncio engine")
+        # Only dates with something to do in some project are fetched and seeded
+        plan = main.build_seed_plan(target_dates, seeder.states)
+        if report is not None:
+            report['plan'] = {'summary': plan['summary'], 'estimate': plan['estimate']}
+        pending = set(plan['pending_dates'])
+        projects = list(databases)
+        # Like the threaded engine: a range's passages are fetched in a few batched requests
+        if main.SCRIPTURE_BATCH and len(pending) > 1:
+            await seeder.prefetch_scripture_texts(
+                [target_date for target_date in target_dates if target_date.strftime('%Y-%m-%d') in pending]
+            )
+
+        async def seed_date(target_date):
+            if target_date.strftime('%Y-%m-%d') not in pending:
+                return main._skipped_outcomes(target_date, projects)
+            return await seeder.seed_date(target_date, has_primary, has_secondary)
+
+        project_results = list(await asyncio.gather(*(seed_date(target_date) for target_date in target_dates)))
+        if seeder.writers:
+            writes = await seeder.flush_writes(project_results)
+            if report is not None:
+                report['writes'] = writes
+        if report is not None:
+            report['writes_avoided'] = main.count_unchanged(project_results)
+        return [
+            main._combine_project_results(
+                target_date.strftime('%Y-%m-%d'), outcomes['primary'], outcomes['secondary'],
+                has_primary, has_secondary, is_secondary_function
+            )
+            for target_date, outcomes in zip(target_dates, project_results)
+        ]
+    finally:
+        if own_client:
+            await http_client.aclose()
+        if own_databases:
+            await close_firestore_clients(databases)
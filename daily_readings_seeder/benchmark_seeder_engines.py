@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Benchmark the threaded and asyncio seeding engines against simulated latency
+
+Both engines seed the same date ranges against an in-memory Firestore and
+fake USCCB / bible-api.com servers that answer after a fixed delay, so the
+numbers show how well each engine overlaps I/O without touching the network.
+Caches are disabled so every run does the full set of requests.
+
+Usage:
+    python3 benchmark_seeder_engines.py [--days 30 365] [--http-latency 0.15]
+        [--firestore-latency 0.03] [--per-host 4] [--interval 0]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import httpx
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import main
+import async_seeder
+
+PAGE_TEMPLATE = """<html><body>
+<div class="b-verse"><div class="innerblock">
+  <div class="content-header"><h3 class="name">Reading 1</h3><div class="address"><a>{reading1}</a></div></div>
+  <div class="content-body">...</div>
+</div></div>
+<div class="b-verse"><div class="innerblock">
+  <div class="content-header"><h3 class="name">Responsorial Psalm</h3><div class="address"><a>{psalm}</a></div></div>
+  <div class="content-body">R. The Lord is my shepherd; there is nothing I shall want.<br/>...</div>
+</div></div>
+<div class="b-verse"><div class="innerblock">
+  <div class="content-header"><h3 class="name">Gospel</h3><div class="address"><a>{gospel}</a></div></div>
+  <div class="content-body">...</div>
+</div></div>
+</body></html>"""
+
+
+def usccb_page(url: str) -> bytes:
+    """A USCCB-like page with readings that vary by date"""
+    month, day, year = re.search(r'/(\d\d)(\d\d)(\d\d)(?:-Thanksgiving)?\.cfm', url).groups()
+    day_of_year = date(2000 + int(year), int(month), int(day)).timetuple().tm_yday
+    return PAGE_TEMPLATE.format(
+        reading1=f"Rom {1 + day_of_year % 16}:1-5",
+        psalm=f"Ps {1 + day_of_year % 150}:1-2",
+        gospel=f"Lk {1 + day_of_year % 24}:1-8"
+    ).encode('utf-8')
+
+
+def bible_api_json(url: str) -> dict:
+    """A bible-api.com answer covering every verse in the (possibly combined) reference"""
+    book, refs = url.rsplit('/', 1)[1].split('+', 1)
+    verses = []
+    chapter = None
+    for part in refs.split(','):
+        if ':' in part:
+            chapter, part = part.split(':')
+        start, _, end = part.partition('-')
+        for verse in range(int(start), int(end or start) + 1):
+            verses.append({'chapter': int(chapter), 'verse': verse, 'text': f"{book} {chapter}:{verse} text\n"})
+    return {'text': ''.join(v['text'] for v in verses), 'verses': verses}
+
+
+class FakeResponse:
+    """Just enough of requests.Response for the seeder"""
+
+    def __init__(self, url):
+        self.status_code = 200
+        self.headers = {}
+        self.encoding = 'utf-8'
+        self.url = url
+        self.content = usccb_page(url) if 'usccb' in url else b''
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return bible_api_json(self.url)
+
+    def iter_content(self, chunk_size=8192):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i:i + chunk_size]
+
+    def close(self):
+        pass
+
+
+class FakeSnapshot:
+    def __init__(self, data, doc_id=None):
+        self.id = doc_id
+        self.exists = data is not None
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
+
+
+class FakeDocument:
+    """Document reference whose calls take `latency` seconds (sync or async flavour)"""
+
+    def __init__(self, store, doc_id, latency, is_async):
+        self.store, self.doc_id, self.latency, self.is_async = store, doc_id, latency, is_async
+
+    def _call(self, action):
+        if self.is_async:
+            async def run():
+                await asyncio.sleep(self.latency)
+                return action()
+            return run()
+        time.sleep(self.latency)
+        return action()
+
+    def get(self):
+        return self._call(lambda: FakeSnapshot(self.store.get(self.doc_id)))
+
+    def set(self, data, merge=False):
+        return self._call(lambda: self.store.__setitem__(self.doc_id, dict(data)))
+
+    def delete(self):
+        return self._call(lambda: self.store.pop(self.doc_id, None))
+
+
+class FakeBatch:
+    """WriteBatch whose commit is one round trip however many writes it holds"""
+
+    def __init__(self, db):
+        self.db = db
+        self.writes = []
+
+    def set(self, doc_ref, data, merge=False):
+        self.writes.append((doc_ref.doc_id, dict(data)))
+
+    def _apply(self):
+        self.db.commits += 1
+        self.db.docs.update(self.writes)
+
+    def commit(self):
+        if self.db.is_async:
+            async def run():
+                await asyncio.sleep(self.db.latency)
+                self._apply()
+            return run()
+        time.sleep(self.db.latency)
+        self._apply()
+
+
+class FakeFirestore:
+    def __init__(self, latency, is_async=False):
+        self.docs = {}
+        self.latency = latency
+        self.is_async = is_async
+        self.commits = 0
+
+    def batch(self):
+        return FakeBatch(self)
+
+    def collection(self, name):
+        return self
+
+    def document(self, doc_id):
+        return FakeDocument(self.docs, doc_id, self.latency, self.is_async)
+
+    def get_all(self, refs):
+        """One round trip for the whole chunk"""
+        snapshots = [FakeSnapshot(self.docs.get(ref.doc_id), ref.doc_id) for ref in refs]
+        if self.is_async:
+            async def stream():
+                await asyncio.sleep(self.latency)
+                for snapshot in snapshots:
+                    yield snapshot
+            return stream()
+        time.sleep(self.latency)
+        return iter(snapshots)
+
+
+def run_threaded(dates, http_latency, firestore_latency):
+    """Seed with the threaded engine; returns (seconds, documents written)"""
+    def fake_get(url, **kwargs):
+        time.sleep(http_latency)
+        return FakeResponse(url)
+
+    db = FakeFirestore(firestore_latency)
+    with patch.object(main.requests, 'get', fake_get), patch.object(main, 'initialize_firebase', lambda project: db):
+        started = time.perf_counter()
+        main._seed_dates_threaded(dates, False, True, False, False)
+        return time.perf_counter() - started, len(db.docs)
+
+
+def run_async(dates, http_latency, firestore_latency):
+    """Seed with the asyncio engine; returns (seconds, documents written)"""
+    async def handler(request):
+        await asyncio.sleep(http_latency)
+        url = str(request.url)
+        if 'usccb' in url:
+            return httpx.Response(200, content=usccb_page(url))
+        return httpx.Response(200, json=bible_api_json(url))
+
+    db = FakeFirestore(firestore_latency, is_async=True)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            started = time.perf_counter()
+            await async_seeder.seed_dates(dates, False, True, False, False, http_client=client, databases={'primary': db})
+            return time.perf_counter() - started
+
+    return asyncio.run(run()), len(db.docs)
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--days', type=int, nargs='+', default=[30, 365], help='Range lengths to seed')
+    parser.add_argument('--http-latency', type=float, default=0.15, help='Seconds per USCCB / bible-api.com request')
+    parser.add_argument('--firestore-latency', type=float, default=0.03, help='Seconds per Firestore read or write')
+    parser.add_argument('--per-host', type=int, default=main.MAX_CONNECTIONS_PER_HOST,
+                        help='MAX_CONNECTIONS_PER_HOST for both engines (also sizes the USCCB prefetch pool)')
+    parser.add_argument('--interval', type=float, default=0,
+                        help='MIN_REQUEST_INTERVAL_SECONDS for both engines (0 measures raw I/O overlap)')
+    args = parser.parse_args()
+
+    # Per-date logging would dominate the output
+    logging.disable(logging.INFO)
+
+    settings = {
+        'USCCB_CACHE_ENABLED': False, 'SCRIPTURE_CACHE_ENABLED': False,
+        '_verse_store_loaded': True, '_verse_store': None,
+        'MAX_CONNECTIONS_PER_HOST': args.per_host, 'USCCB_PREFETCH_WORKERS': args.per_host,
+        'MIN_REQUEST_INTERVAL_SECONDS': args.interval,
+    }
+    with patch.multiple(main, **settings):
+        print(f"HTTP latency {args.http_latency * 1000:.0f}ms, Firestore latency {args.firestore_latency * 1000:.0f}ms, "
+              f"{args.per_host} connections per host, SEED_WORKERS={main.SEED_WORKERS}")
+        print(f"{'days':>6} {'threads s':>10} {'async s':>10} {'speedup':>8}  docs")
+        for days in args.days:
+            dates = [date(2026, 1, 1) + timedelta(days=i) for i in range(days)]
+            threads_before = threading.active_count()
+            threaded_time, threaded_docs = run_threaded(dates, args.http_latency, args.firestore_latency)
+            async_time, async_docs = run_async(dates, args.http_latency, args.firestore_latency)
+            same = '✅' if threaded_docs == async_docs == days else '❌'
+            print(f"{days:>6} {threaded_time:>10.2f} {async_time:>10.2f} "
+                  f"{threaded_time / max(async_time, 1e-9):>7.1f}x  {same}")
+            assert threading.active_count() == threads_before
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main_cli())
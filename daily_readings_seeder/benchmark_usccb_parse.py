@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark the fast-path USCCB extractor against the full BeautifulSoup parse
+
+Runs both parsers over saved USCCB pages and reports parse time and peak
+memory for each, checking that they produce the same result dict.
+
+Usage:
+    python3 benchmark_usccb_parse.py [PAGE_OR_DIR ...] [--repeat N]
+
+With no paths, benchmarks the pages in the USCCB page cache (USCCB_CACHE_DIR),
+which fill up as the seeder or test_usccb_fetch_only.py run.
+"""
+import argparse
+import glob
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from datetime import date
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from main import USCCB_CACHE_DIR, parse_usccb_reading_html, _parse_usccb_html_soup
+
+
+def find_pages(paths):
+    """Expand files and directories into a list of saved HTML pages"""
+    pages = []
+    for path in paths:
+        if os.path.isdir(path):
+            pages.extend(sorted(glob.glob(os.path.join(path, '*.html'))))
+        else:
+            pages.append(path)
+    return pages
+
+
+def measure(parse, content, repeat):
+    """Return (best seconds per parse, peak bytes allocated, result) for one page"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        parse(content)
+        best = min(best, time.perf_counter() - started)
+    
+    tracemalloc.start()
+    result = parse(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('paths', nargs='*', default=[USCCB_CACHE_DIR], help='Saved pages or directories of pages')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing runs per page (best is reported)')
+    args = parser.parse_args()
+    
+    # Parsers log every reading they find - keep the benchmark output readable
+    logging.disable(logging.INFO)
+    
+    pages = find_pages(args.paths)
+    if not pages:
+        print(f"❌ No saved pages found in: {', '.join(args.paths)}")
+        print("   Run test_usccb_fetch_only.py or the seeder first to fill the cache")
+        return 1
+    
+    target_date = date.today()
+    url = 'https://bible.usccb.org/bible/readings/'
+    soup_parse = lambda content: _parse_usccb_html_soup(content.decode('utf-8', errors='replace'), target_date, url)
+    fast_parse = lambda content: parse_usccb_reading_html(content, target_date, url)
+    
+    print(f"{'page':<40} {'size':>8} {'soup ms':>9} {'fast ms':>9} {'soup peak':>10} {'fast peak':>10}  same")
+    totals = {'soup_time': 0.0, 'fast_time': 0.0, 'soup_peak': 0, 'fast_peak': 0}
+    mismatches = 0
+    for page in pages:
+        with open(page, 'rb') as f:
+            content = f.read()
+        
+        soup_time, soup_peak, soup_result = measure(soup_parse, content, args.repeat)
+        fast_time, fast_peak, fast_result = measure(fast_parse, content, args.repeat)
+        same = soup_result == fast_result
+        mismatches += 0 if same else 1
+        
+        totals['soup_time'] += soup_time
+        totals['fast_time'] += fast_time
+        totals['soup_peak'] = max(totals['soup_peak'], soup_peak)
+        totals['fast_peak'] = max(totals['fast_peak'], fast_peak)
+        print(f"{os.path.basename(page)[:40]:<40} {len(content) // 1024:>6}KB "
+              f"{soup_time * 1000:>9.2f} {fast_time * 1000:>9.2f} "
+              f"{soup_peak // 1024:>8}KB {fast_peak // 1024:>8}KB  {'✅' if same else '❌'}")
+    
+    print()
+    print(f"📊 {len(pages)} pages: total parse time {totals['soup_time'] * 1000:.1f}ms (soup) vs "
+          f"{totals['fast_time'] * 1000:.1f}ms (fast), "
+          f"{totals['soup_time'] / max(totals['fast_time'], 1e-9):.1f}x faster")
+    print(f"📊 Max peak memory {totals['soup_peak'] // 1024}KB (soup) vs {totals['fast_peak'] // 1024}KB (fast)")
+    if mismatches:
+        print(f"❌ {mismatches} pages parsed differently")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Canonical Bible Book Registry
+One table of books - canonical ID, name, lectionary abbreviations and
+chapter/verse counts - built once at import and shared by reference parsing
+and scripture text fetching, so references can be resolved and range-checked
+without a network call.
+
+Verse counts follow the KJV (what bible-api.com and the verse store serve),
+widened where the NAB lectionary numbers a chapter further. Books only found
+in the Catholic canon are checked by chapter count alone.
+"""
+import re
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+
+class BookInfo(NamedTuple):
+    """A book of the Bible"""
+    id: str
+    name: str
+    chapter_count: int
+    verse_counts: Optional[Tuple[int, ...]]
+
+
+# (id, name, abbreviations, verse count per chapter or chapter count)
+_BOOK_TABLE = (
+    ('GEN', 'Genesis', ('Gen', 'Gn'), (
+        31, 25, 24, 26, 32, 22, 24, 22, 29, 32, 32, 20, 18, 24, 21, 16, 27, 33, 38, 18, 34, 24, 20, 67, 34,
+        35, 46, 22, 35, 43, 55, 32, 20, 31, 29, 43, 36, 30, 23, 23, 57, 38, 34, 34, 28, 34, 31, 22, 33, 26)),
+    ('EXO', 'Exodus', ('Ex', 'Exod'), (
+        22, 25, 22, 31, 23, 30, 25, 32, 35, 29, 10, 51, 22, 31, 27, 36, 16, 27, 25, 26, 36, 31, 33, 18, 40,
+        37, 21, 43, 46, 38, 18, 35, 23, 35, 35, 38, 29, 31, 43, 38)),
+    ('LEV', 'Leviticus', ('Lev', 'Lv'), (
+        17, 16, 17, 35, 19, 30, 38, 36, 24, 20, 47, 8, 59, 57, 33, 34, 16, 30, 37, 27, 24, 33, 44, 23, 55,
+        46, 34)),
+    ('NUM', 'Numbers', ('Num', 'Nm'), (
+        54, 34, 51, 49, 31, 27, 89, 26, 23, 36, 35, 16, 33, 45, 41, 50, 13, 32, 22, 29, 35, 41, 30, 25, 18,
+        65, 23, 31, 40, 16, 54, 42, 56, 29, 34, 13)),
+    ('DEU', 'Deuteronomy', ('Deut', 'Dt'), (
+        46, 37, 29, 49, 33, 25, 26, 20, 29, 22, 32, 32, 18, 29, 23, 22, 20, 22, 21, 20, 23, 30, 25, 22, 19,
+        19, 26, 68, 29, 20, 30, 52, 29, 12)),
+    ('JOS', 'Joshua', ('Josh', 'Jos'), (
+        18, 24, 17, 24, 15, 27, 26, 35, 27, 43, 23, 24, 33, 15, 63, 10, 18, 28, 51, 9, 45, 34, 16, 33)),
+    ('JDG', 'Judges', ('Judg', 'Jgs'), (
+        36, 23, 31, 24, 31, 40, 25, 35, 57, 18, 40, 15, 25, 20, 20, 31, 13, 31, 30, 48, 25)),
+    ('RUT', 'Ruth', ('Ru',), (22, 23, 18, 22)),
+    ('1SA', '1 Samuel', ('1Sam', '1Sm'), (
+        28, 36, 21, 22, 12, 21, 17, 22, 27, 27, 15, 25, 23, 52, 35, 23, 58, 30, 24, 42, 15, 23, 29, 22, 44,
+        25, 12, 25, 11, 31, 13)),
+    ('2SA', '2 Samuel', ('2Sam', '2Sm'), (
+        27, 32, 39, 12, 25, 23, 29, 18, 13, 19, 27, 31, 39, 33, 37, 23, 29, 33, 43, 26, 22, 51, 39, 25)),
+    ('1KI', '1 Kings', ('1Kgs', '1Kg'), (
+        53, 46, 28, 34, 18, 38, 51, 66, 28, 29, 43, 33, 34, 31, 34, 34, 24, 46, 21, 43, 29, 53)),
+    ('2KI', '2 Kings', ('2Kgs', '2Kg'), (
+        18, 25, 27, 44, 27, 33, 20, 29, 37, 36, 21, 21, 25, 29, 38, 20, 41, 37, 37, 21, 26, 20, 37, 20, 30)),
+    ('1CH', '1 Chronicles', ('1Chr', '1Chron'), (
+        54, 55, 24, 43, 26, 81, 40, 40, 44, 14, 47, 40, 14, 17, 29, 43, 27, 17, 19, 8, 30, 19, 32, 31, 31,
+        32, 34, 21, 30)),
+    ('2CH', '2 Chronicles', ('2Chr', '2Chron'), (
+        17, 18, 17, 22, 14, 42, 22, 18, 31, 19, 23, 16, 22, 15, 19, 14, 19, 34, 11, 37, 20, 12, 21, 27, 28,
+        23, 9, 27, 36, 27, 21, 33, 25, 33, 27, 23)),
+    ('EZR', 'Ezra', ('Ezr',), (11, 70, 13, 24, 17, 22, 28, 36, 15, 44)),
+    ('NEH', 'Nehemiah', ('Neh',), (11, 20, 32, 23, 19, 19, 73, 18, 38, 39, 36, 47, 31)),
+    ('TOB', 'Tobit', ('Tob', 'Tb'), 14),
+    ('JDT', 'Judith', ('Jdt',), 16),
+    ('EST', 'Esther', ('Esth', 'Est'), (22, 23, 15, 17, 14, 14, 10, 17, 32, 3)),
+    ('1MA', '1 Maccabees', ('1Macc', '1Mc'), 16),
+    ('2MA', '2 Maccabees', ('2Macc', '2Mc'), 15),
+    ('JOB', 'Job', ('Jb',), (
+        22, 13, 26, 21, 27, 30, 21, 22, 35, 22, 20, 25, 28, 22, 35, 22, 16, 21, 29, 29, 34, 30, 17, 25, 6,
+        14, 23, 28, 25, 31, 40, 22, 33, 37, 16, 33, 24, 41, 30, 24, 34, 17)),
+    ('PSA', 'Psalms', ('Ps', 'Psalm', 'Pss'), (
+        6, 12, 8, 8, 12, 10, 17, 9, 20, 18, 7, 8, 6, 7, 5, 11, 15, 50, 14, 9, 13, 31, 6, 10, 22,
+        12, 14, 9, 11, 12, 24, 11, 22, 22, 28, 12, 40, 22, 13, 17, 13, 11, 5, 26, 17, 11, 9, 14, 20, 23,
+        19, 9, 6, 7, 23, 13, 11, 11, 17, 12, 8, 12, 11, 10, 13, 20, 7, 35, 36, 5, 24, 20, 28, 23, 10,
+        12, 20, 72, 13, 19, 16, 8, 18, 12, 13, 17, 7, 18, 52, 17, 16, 15, 5, 23, 11, 13, 12, 9, 9, 5,
+        8, 28, 22, 35, 45, 48, 43, 13, 31, 7, 10, 10, 9, 8, 18, 19, 2, 29, 176, 7, 8, 9, 4, 8, 5,
+        6, 5, 6, 8, 8, 3, 18, 3, 3, 21, 26, 9, 8, 24, 13, 10, 7, 12, 15, 21, 10, 20, 14, 9, 6)),
+    ('PRO', 'Proverbs', ('Prov', 'Prv'), (
+        33, 22, 35, 27, 23, 35, 27, 36, 18, 32, 31, 28, 25, 35, 33, 33, 28, 24, 29, 30, 31, 29, 35, 34, 28,
+        28, 27, 28, 27, 33, 31)),
+    ('ECC', 'Ecclesiastes', ('Eccl', 'Eccles', 'Qoh'), (18, 26, 22, 16, 20, 12, 29, 17, 18, 20, 10, 14)),
+    ('SNG', 'Song of Songs', ('Song', 'Sg', 'Song of Solomon'), (17, 17, 11, 16, 16, 13, 13, 14)),
+    ('WIS', 'Wisdom', ('Wis',), 19),
+    ('SIR', 'Sirach', ('Sir',), 51),
+    ('ISA', 'Isaiah', ('Is', 'Isa'), (
+        31, 22, 26, 6, 30, 13, 25, 22, 21, 34, 16, 6, 22, 32, 9, 14, 14, 7, 25, 6, 17, 25, 18, 23, 12,
+        21, 13, 29, 24, 33, 9, 20, 24, 17, 10, 22, 38, 22, 8, 31, 29, 25, 28, 28, 25, 13, 15, 22, 26, 11,
+        23, 15, 12, 17, 13, 12, 21, 14, 21, 22, 11, 12, 19, 12, 25, 24)),
+    ('JER', 'Jeremiah', ('Jer',), (
+        19, 37, 25, 31, 31, 30, 34, 22, 26, 25, 23, 17, 27, 22, 21, 21, 27, 23, 15, 18, 14, 30, 40, 10, 38,
+        24, 22, 17, 32, 24, 40, 44, 26, 22, 19, 32, 21, 28, 18, 16, 18, 22, 13, 30, 5, 28, 7, 47, 39, 46,
+        64, 34)),
+    ('LAM', 'Lamentations', ('Lam',), (22, 22, 66, 22, 22)),
+    ('BAR', 'Baruch', ('Bar',), 6),
+    ('EZK', 'Ezekiel', ('Ezek', 'Ez'), (
+        28, 10, 27, 17, 17, 14, 27, 18, 11, 22, 25, 28, 23, 23, 8, 63, 24, 32, 14, 49, 32, 31, 49, 27, 17,
+        21, 36, 26, 21, 26, 18, 32, 33, 31, 15, 38, 28, 23, 29, 49, 26, 20, 27, 31, 25, 24, 23, 35)),
+    ('DAN', 'Daniel', ('Dan', 'Dn'), (21, 49, 30, 37, 31, 28, 28, 27, 27, 21, 45, 13)),
+    ('HOS', 'Hosea', ('Hos',), (11, 23, 5, 19, 15, 11, 16, 14, 17, 15, 12, 14, 16, 9)),
+    ('JOL', 'Joel', ('Jl',), (20, 32, 21)),
+    ('AMO', 'Amos', ('Am',), (15, 16, 15, 13, 27, 14, 17, 14, 15)),
+    ('OBA', 'Obadiah', ('Obad', 'Ob'), (21,)),
+    ('JON', 'Jonah', ('Jon',), (17, 10, 10, 11)),
+    ('MIC', 'Micah', ('Mic', 'Mi'), (16, 13, 12, 13, 15, 16, 20)),
+    ('NAM', 'Nahum', ('Nah', 'Na'), (15, 13, 19)),
+    ('HAB', 'Habakkuk', ('Hab', 'Hb'), (17, 20, 19)),
+    ('ZEP', 'Zephaniah', ('Zeph', 'Zep'), (18, 15, 20)),
+    ('HAG', 'Haggai', ('Hag', 'Hg'), (15, 23)),
+    ('ZEC', 'Zechariah', ('Zech', 'Zec'), (21, 13, 10, 14, 11, 15, 14, 23, 17, 12, 17, 14, 9, 21)),
+    ('MAL', 'Malachi', ('Mal',), (14, 17, 18, 6)),
+    ('MAT', 'Matthew', ('Mt', 'Matt'), (
+        25, 23, 17, 25, 48, 34, 29, 34, 38, 42, 30, 50, 58, 36, 39, 28, 27, 35, 30, 34, 46, 46, 39, 51, 46,
+        75, 66, 20)),
+    ('MRK', 'Mark', ('Mk', 'Mar'), (45, 28, 35, 41, 43, 56, 37, 38, 50, 52, 33, 44, 37, 72, 47, 20)),
+    ('LUK', 'Luke', ('Lk', 'Luk'), (
+        80, 52, 38, 44, 39, 49, 50, 56, 62, 42, 54, 59, 35, 35, 32, 31, 37, 43, 48, 47, 38, 71, 56, 53)),
+    ('JHN', 'John', ('Jn', 'Joh'), (
+        51, 25, 36, 54, 47, 71, 53, 59, 41, 42, 57, 50, 38, 31, 27, 33, 26, 40, 42, 31, 25)),
+    ('ACT', 'Acts', ('Act',), (
+        26, 47, 26, 37, 42, 15, 60, 40, 43, 48, 30, 25, 52, 28, 41, 40, 34, 28, 41, 38, 40, 30, 35, 27, 27,
+        32, 44, 31)),
+    ('ROM', 'Romans', ('Rom', 'Rm'), (32, 29, 31, 25, 21, 23, 25, 39, 33, 21, 36, 21, 14, 23, 33, 27)),
+    ('1CO', '1 Corinthians', ('1Cor',), (31, 16, 23, 21, 13, 20, 40, 13, 27, 33, 34, 31, 13, 40, 58, 24)),
+    ('2CO', '2 Corinthians', ('2Cor',), (24, 17, 18, 18, 21, 18, 16, 24, 15, 18, 33, 21, 14)),
+    ('GAL', 'Galatians', ('Gal',), (24, 21, 29, 31, 26, 18)),
+    ('EPH', 'Ephesians', ('Eph',), (23, 22, 21, 32, 33, 24)),
+    ('PHP', 'Philippians', ('Phil',), (30, 30, 21, 23)),
+    ('COL', 'Colossians', ('Col',), (29, 23, 25, 18)),
+    ('1TH', '1 Thessalonians', ('1Thess', '1Thes'), (10, 20, 13, 18, 28)),
+    ('2TH', '2 Thessalonians', ('2Thess', '2Thes'), (12, 17, 18)),
+    ('1TI', '1 Timothy', ('1Tim', '1Tm'), (20, 15, 16, 16, 25, 21)),
+    ('2TI', '2 Timothy', ('2Tim', '2Tm'), (18, 26, 17, 22)),
+    ('TIT', 'Titus', ('Ti', 'Tit'), (16, 15, 15)),
+    ('PHM', 'Philemon', ('Phlm', 'Philem'), (25,)),
+    ('HEB', 'Hebrews', ('Heb',), (14, 18, 19, 16, 14, 20, 28, 13, 28, 39, 40, 29, 25)),
+    ('JAS', 'James', ('Jas',), (27, 26, 18, 17, 20)),
+    ('1PE', '1 Peter', ('1Pet', '1Pt'), (25, 25, 22, 19, 14)),
+    ('2PE', '2 Peter', ('2Pet', '2Pt'), (21, 22, 18)),
+    ('1JN', '1 John', ('1Jn', '1Joh'), (10, 29, 24, 21, 21)),
+    ('2JN', '2 John', ('2Jn', '2Joh'), (13,)),
+    ('3JN', '3 John', ('3Jn', '3Joh'), (14,)),
+    ('JUD', 'Jude', ('Jud',), (25,)),
+    ('REV', 'Revelation', ('Rev', 'Rv', 'Apoc', 'Revelations'), (
+        20, 29, 22, 11, 14, 17, 17, 13, 21, 11, 19, 17, 18, 20, 8, 21, 18, 24, 21, 15, 27, 21)),
+)
+
+# Chapters the NAB lectionary numbers beyond the KJV: (book id, chapter) -> last verse
+_NAB_VERSE_COUNTS = {
+    ('GEN', 32): 33, ('EXO', 7): 29, ('EXO', 21): 37, ('LEV', 5): 26,
+    ('NUM', 17): 28, ('NUM', 30): 17, ('DEU', 13): 19, ('DEU', 23): 26, ('DEU', 28): 69,
+    ('1SA', 21): 16, ('1SA', 24): 23, ('2SA', 19): 44, ('1KI', 5): 32, ('2KI', 12): 22,
+    ('1CH', 5): 41, ('2CH', 1): 18, ('2CH', 13): 23, ('NEH', 3): 38, ('NEH', 10): 40,
+    ('JOB', 40): 32, ('ECC', 4): 17, ('SNG', 7): 14, ('ISA', 8): 23, ('JER', 8): 23,
+    ('EZK', 21): 37, ('DAN', 3): 100, ('DAN', 13): 64, ('DAN', 14): 42,
+    ('HOS', 2): 25, ('HOS', 12): 15, ('HOS', 14): 10, ('JOL', 3): 5, ('JOL', 4): 21,
+    ('JON', 2): 11, ('MIC', 4): 14, ('ZEC', 2): 17, ('MAL', 3): 24,
+    ('3JN', 1): 15, ('REV', 12): 18,
+}
+
+# The NAB numbers psalm headings as verses, shifting a psalm by up to two
+_PSALM_HEADING_VERSES = 2
+
+
+def _book_key(name: str) -> str:
+    """Lookup key for a book name or abbreviation ('1 Cor.' -> '1cor')"""
+    return re.sub(r'[\s.]', '', name).lower()
+
+
+def _build_registry(table: Iterable) -> Tuple[Dict[str, BookInfo], Dict[str, BookInfo]]:
+    by_id = {}
+    by_alias = {}
+    for book_id, name, abbreviations, counts in table:
+        verse_counts = counts if isinstance(counts, tuple) else None
+        chapter_count = len(counts) if verse_counts else counts
+        # NAB-only chapters (Joel 4, Daniel 13-14)
+        chapter_count = max([chapter_count] + [c for b, c in _NAB_VERSE_COUNTS if b == book_id])
+        book = BookInfo(book_id, name, chapter_count, verse_counts)
+        by_id[book_id] = book
+        for alias in (book_id, name) + abbreviations:
+            key = _book_key(alias)
+            if by_alias.get(key, book) is not book:
+                raise ValueError(f"Book alias {alias!r} is ambiguous")
+            by_alias[key] = book
+    return by_id, by_alias
+
+
+BOOKS_BY_ID, _BOOKS_BY_ALIAS = _build_registry(_BOOK_TABLE)
+
+
+def lookup_book(name: str) -> Optional[BookInfo]:
+    """Find a book by ID, name or abbreviation ('Ps', '1 Cor', '3Jn', 'Jude'), or None"""
+    return _BOOKS_BY_ALIAS.get(_book_key(name))
+
+
+def last_verse(book: BookInfo, chapter: int) -> Optional[int]:
+    """Highest verse number a chapter can have, or None if verse counts aren't tracked"""
+    nab_count = _NAB_VERSE_COUNTS.get((book.id, chapter), 0)
+    if book.verse_counts is None or chapter > len(book.verse_counts):
+        return nab_count or None
+    count = book.verse_counts[chapter - 1]
+    if book.id == 'PSA':
+        count += _PSALM_HEADING_VERSES
+    return max(count, nab_count)
+
+
+def validate_passage(book: BookInfo, chapter: int, verses: Iterable[int]) -> Optional[str]:
+    """
+    Check a chapter and verses exist in a book
+
+    Returns:
+        Description of the problem, or None if the passage is valid
+    """
+    if not 1 <= chapter <= book.chapter_count:
+        return f"{book.name} has {book.chapter_count} chapters, not {chapter}"
+    verses = list(verses)
+    if not verses:
+        return f"No verses given for {book.name} {chapter}"
+    limit = last_verse(book, chapter)
+    for verse in verses:
+        if verse < 1 or (limit is not None and verse > limit):
+            return f"{book.name} {chapter} has no verse {verse}"
+    return None
@@ -8,12 +8,29 @@ import json
 import logging
 import requests
 import base64
+import codecs
+import hashlib
 import re
+import sqlite3
+import tempfile
+import time
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from types import MappingProxyType
+from urllib.parse import urlparse
 from datetime import datetime, date, timedelta
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple, Mapping
 import firebase_admin
 from firebase_admin import credentials, firestore
+from google.cloud.firestore_v1.base_query import FieldFilter
 from bs4 import BeautifulSoup
+from bible_books import BOOKS_BY_ID, lookup_book, validate_passage
+from verse_store import VerseStore
+import run_state
+import shard_coordinator
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -23,6 +40,83 @@ logger = logging.getLogger(__name__)
 _firebase_initialized = False
 _db = None
 _db_secondary = None
+_firebase_lock = threading.Lock()
+
+# Dates seeded in parallel by the cron job (1 = sequential)
+SEED_WORKERS = int(os.environ.get('SEED_WORKERS', '4'))
+# Documents per get_all call when reading a range's current state
+FIRESTORE_GET_ALL_CHUNK_SIZE = int(os.environ.get('FIRESTORE_GET_ALL_CHUNK_SIZE', '100'))
+# Seeding engine: 'threads' (worker pool) or 'async' (asyncio, see async_seeder.py)
+SEEDER_ENGINE = os.environ.get('SEEDER_ENGINE', 'threads').lower()
+# 'monthly': seed next month in one run (on the 15th); 'rolling': every run
+# (daily) makes sure the next SEED_HORIZON_DAYS days are seeded
+SEED_SCHEDULE = os.environ.get('SEED_SCHEDULE', 'monthly').lower()
+SEED_HORIZON_DAYS = int(os.environ.get('SEED_HORIZON_DAYS', '45'))
+# The deployment's function timeout; dates that don't fit are deferred, not lost
+FUNCTION_TIMEOUT_SECONDS = float(os.environ.get('FUNCTION_TIMEOUT_SECONDS', '540'))
+# Time kept back at the end of a run for committing writes and responding
+DEADLINE_RESERVE_SECONDS = float(os.environ.get('DEADLINE_RESERVE_SECONDS', '45'))
+# Commit the run's document writes in WriteBatches instead of one set() per document
+FIRESTORE_BATCH_WRITES = os.environ.get('FIRESTORE_BATCH_WRITES', 'true').lower() == 'true'
+# Writes per WriteBatch commit (Firestore allows at most 500)
+FIRESTORE_WRITE_BATCH_SIZE = min(int(os.environ.get('FIRESTORE_WRITE_BATCH_SIZE', '500')), 500)
+# Documents per page of the cleanup's range query, each page deleted in one batch (at most 500)
+CLEANUP_PAGE_SIZE = min(int(os.environ.get('CLEANUP_PAGE_SIZE', '500')), 500)
+
+# USCCB prefetch configuration
+USCCB_PREFETCH = os.environ.get('USCCB_PREFETCH', 'true').lower() == 'true'
+USCCB_PREFETCH_WORKERS = int(os.environ.get('USCCB_PREFETCH_WORKERS', '4'))
+# Politeness limits applied per host while prefetching
+MAX_CONNECTIONS_PER_HOST = int(os.environ.get('MAX_CONNECTIONS_PER_HOST', '4'))
+MIN_REQUEST_INTERVAL_SECONDS = float(os.environ.get('MIN_REQUEST_INTERVAL_SECONDS', '0.2'))
+
+_host_limits_lock = threading.Lock()
+_host_limits = {}
+
+# Persistent USCCB response cache (revalidated with conditional GETs).
+# /tmp survives across warm Cloud Function invocations; point USCCB_CACHE_DIR
+# at a local directory when running scripts on a workstation.
+USCCB_CACHE_ENABLED = os.environ.get('USCCB_CACHE', 'true').lower() == 'true'
+USCCB_CACHE_DIR = os.environ.get('USCCB_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'usccb_cache'))
+# /tmp is in-memory on gen2 and counts against the instance's memory: pages expire after
+# USCCB_CACHE_TTL_DAYS and the least recently used are evicted beyond USCCB_CACHE_MAX_BYTES
+USCCB_CACHE_MAX_BYTES = int(os.environ.get('USCCB_CACHE_MAX_BYTES', str(32 * 1024 * 1024)))
+USCCB_CACHE_TTL_DAYS = float(os.environ.get('USCCB_CACHE_TTL_DAYS', '30'))
+
+# Streaming mode: stop downloading a USCCB page once all readings are parsed
+USCCB_STREAM = os.environ.get('USCCB_STREAM', 'false').lower() == 'true'
+USCCB_STREAM_CHUNK_SIZE = int(os.environ.get('USCCB_STREAM_CHUNK_SIZE', '8192'))
+
+USCCB_HEADERS = {'User-Agent': 'Mozilla/5.0 (compatible; Daily Readings Seeder/1.0)'}
+
+# Bundled KJV verse store (see verse_store.py); bible-api.com is the fallback
+KJV_STORE_PATH = os.environ.get('KJV_STORE_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'kjv.bin'))
+
+_verse_store = None
+_verse_store_loaded = False
+_verse_store_lock = threading.Lock()
+
+# Batched bible-api.com requests: max passages packed into one request
+SCRIPTURE_BATCH = os.environ.get('SCRIPTURE_BATCH', 'true').lower() == 'true'
+SCRIPTURE_BATCH_MAX_PASSAGES = int(os.environ.get('SCRIPTURE_BATCH_MAX_PASSAGES', '8'))
+
+# bible-api.com statuses that mean the passage can't be served (remembered, see
+# SCRIPTURE_UNAVAILABLE_REPROBE_DAYS) and ones that mean "slow down" (transient)
+SCRIPTURE_UNAVAILABLE_STATUSES = (400, 404)
+SCRIPTURE_RATE_LIMIT_STATUSES = (408, 429)
+
+# Scripture text cache: in-process LRU backed by a persistent SQLite file
+SCRIPTURE_CACHE_ENABLED = os.environ.get('SCRIPTURE_CACHE', 'true').lower() == 'true'
+SCRIPTURE_CACHE_SIZE = int(os.environ.get('SCRIPTURE_CACHE_SIZE', '512'))
+SCRIPTURE_CACHE_DB = os.environ.get('SCRIPTURE_CACHE_DB', os.path.join(tempfile.gettempdir(), 'scripture_cache.sqlite3'))
+SCRIPTURE_CACHE_TTL_DAYS = float(os.environ.get('SCRIPTURE_CACHE_TTL_DAYS', '90'))
+SCRIPTURE_CACHE_MAX_ENTRIES = int(os.environ.get('SCRIPTURE_CACHE_MAX_ENTRIES', '5000'))
+# Days before a passage bible-api.com couldn't serve (e.g. Wisdom, Sirach) is requested again
+SCRIPTURE_UNAVAILABLE_REPROBE_DAYS = float(os.environ.get('SCRIPTURE_UNAVAILABLE_REPROBE_DAYS', '30'))
+
+_usccb_cache_lock = threading.Lock()
+_usccb_cache_stats = {'fresh': 0, 'revalidated': 0, 'bytes_downloaded': 0, 'evicted': 0}
+_usccb_prune_lock = threading.Lock()
 
 
 def _get_firebase_credentials(env_var_json, env_var_b64, env_var_path, app_name='default'):
@@ -68,6 +162,19 @@ def initialize_firebase(project='primary'):
     Returns:
         Firestore client instance
     """
+    # Clients are created once; the lock keeps threads seeding dates in
+    # parallel from initializing the same app twice
+    if project == 'primary' and _db is not None:
+        return _db
+    if project == 'secondary' and _db_secondary is not None:
+        return _db_secondary
+    
+    with _firebase_lock:
+        return _initialize_firebase(project)
+
+
+def _initialize_firebase(project: str):
+    """Create the Firestore client for a project (caller holds _firebase_lock)"""
     global _firebase_initialized, _db, _db_secondary
     
     if project == 'primary':
@@ -144,6 +251,49 @@ def initialize_firebase(project='primary'):
         raise ValueError(f"Invalid project: {project}. Must be 'primary' or 'secondary'")
 
 
+class Deadline:
+    """
+    Time a run has left before it must stop starting new work
+    
+    Passed down to the fetchers so no single request outlives the run.
+    """
+    
+    # Shortest timeout handed to a request, so late calls still get a chance
+    MIN_TIMEOUT_SECONDS = 1.0
+    
+    def __init__(self, seconds: float):
+        self.ends_at = time.monotonic() + seconds
+    
+    def remaining(self) -> float:
+        return self.ends_at - time.monotonic()
+    
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+    
+    def timeout(self, default: float) -> float:
+        """A request's usual timeout, cut down to the time that is left"""
+        return max(self.MIN_TIMEOUT_SECONDS, min(default, self.remaining()))
+
+
+def _timeout(deadline: Optional[Deadline], default: float) -> float:
+    return deadline.timeout(default) if deadline is not None else default
+
+
+def _timeout_kwargs(deadline: Optional[Deadline], default: float) -> Dict:
+    """timeout= for a fetcher call, left to the fetcher's default when there is no deadline"""
+    return {'timeout': deadline.timeout(default)} if deadline is not None else {}
+
+
+def prioritize_dates(target_dates: List[date], today: Optional[date] = None) -> List[date]:
+    """
+    Order dates so the ones needed soonest are seeded first
+    
+    Upcoming dates come first, nearest first, then past dates, most recent first.
+    """
+    today = today or date.today()
+    return sorted(target_dates, key=lambda target_date: (target_date < today, abs((target_date - today).days)))
+
+
 def generate_usccb_url(target_date: date) -> str:
     """Generate USCCB daily readings URL in MMDDYY format"""
     month = str(target_date.month).zfill(2)
@@ -154,38 +304,14 @@ def generate_usccb_url(target_date: date) -> str:
 
 def parse_bible_reference(ref: str) -> Dict:
     """Parse Bible reference like 'Heb 9:15, 24-28' into structured data"""
-    # Book abbreviation mapping
-    book_map = {
-        'Heb': 'Hebrews', 'Ps': 'Psalms', 'Jn': 'John', 'Mk': 'Mark',
-        'Mt': 'Matthew', 'Lk': 'Luke', '1Jn': '1 John', '2Jn': '2 John',
-        'Acts': 'Acts', 'Rom': 'Romans', '1Cor': '1 Corinthians',
-        '2Cor': '2 Corinthians', 'Gal': 'Galatians', 'Eph': 'Ephesians',
-        'Phil': 'Philippians', 'Col': 'Colossians', '1Thess': '1 Thessalonians',
-        '2Thess': '2 Thessalonians', '1Tim': '1 Timothy', '2Tim': '2 Timothy',
-        'Titus': 'Titus', 'Phlm': 'Philemon', 'Jas': 'James',
-        '1Pet': '1 Peter', '2Pet': '2 Peter', 'Rev': 'Revelation',
-        'Gen': 'Genesis', 'Ex': 'Exodus', 'Lev': 'Leviticus', 'Num': 'Numbers',
-        'Deut': 'Deuteronomy', 'Josh': 'Joshua', 'Judg': 'Judges', 'Ruth': 'Ruth',
-        '1Sam': '1 Samuel', '2Sam': '2 Samuel', '1Kgs': '1 Kings', '2Kgs': '2 Kings',
-        '1Chr': '1 Chronicles', '2Chr': '2 Chronicles', 'Ezra': 'Ezra',
-        'Neh': 'Nehemiah', 'Tob': 'Tobit', 'Jdt': 'Judith', 'Esth': 'Esther',
-        '1Macc': '1 Maccabees', '2Macc': '2 Maccabees', 'Job': 'Job',
-        'Prov': 'Proverbs', 'Eccl': 'Ecclesiastes', 'Song': 'Song of Songs',
-        'Wis': 'Wisdom', 'Sir': 'Sirach', 'Is': 'Isaiah', 'Jer': 'Jeremiah',
-        'Lam': 'Lamentations', 'Bar': 'Baruch', 'Ezek': 'Ezekiel', 'Dan': 'Daniel',
-        'Hos': 'Hosea', 'Joel': 'Joel', 'Amos': 'Amos', 'Obad': 'Obadiah',
-        'Jonah': 'Jonah', 'Mic': 'Micah', 'Nah': 'Nahum', 'Hab': 'Habakkuk',
-        'Zeph': 'Zephaniah', 'Hag': 'Haggai', 'Zech': 'Zechariah', 'Mal': 'Malachi'
-    }
-    
-    # Parse reference pattern: "Heb 9:15, 24-28" or "Ps 98:1, 2-3ab"
-    import re
-    match = re.match(r'(\w+)\s+(\d+):(.+)', ref.strip())
+    # Parse reference pattern: "Heb 9:15, 24-28", "Ps 98:1, 2-3ab" or "1 Cor 1:3"
+    match = re.match(r'((?:[1-3]\s*)?[A-Za-z][A-Za-z.\s]*?)\s*(\d+):(.+)', ref.strip())
     if not match:
         return {'book': ref, 'chapter': 0, 'verses': []}
     
-    abbrev = match.group(1)
-    book = book_map.get(abbrev, abbrev)
+    abbrev = match.group(1).strip()
+    book_info = lookup_book(abbrev)
+    book = book_info.name if book_info else abbrev
     chapter = int(match.group(2))
     verses_str = match.group(3)
     
@@ -209,120 +335,733 @@ def parse_bible_reference(ref: str) -> Dict:
     
     return {
         'book': book,
+        'book_id': book_info.id if book_info else None,
         'chapter': chapter,
         'verses': verses,
         'reference': ref
     }
 
 
-def fetch_usccb_reading_data(target_date: date) -> Optional[Dict]:
+def _usccb_cache_paths(url: str) -> Tuple[str, str]:
+    """Get the (metadata, body) cache file paths for a USCCB URL"""
+    key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+    return os.path.join(USCCB_CACHE_DIR, f"{key}.json"), os.path.join(USCCB_CACHE_DIR, f"{key}.html")
+
+
+def _load_cached_usccb_page(url: str) -> Optional[Dict]:
+    """Load a cached USCCB response (validators + body bytes), or None if not cached"""
+    meta_path, body_path = _usccb_cache_paths(url)
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        # Truncated bodies cached by earlier versions in streaming mode can't answer a 304
+        if entry.get('partial'):
+            return None
+        with open(body_path, 'rb') as f:
+            entry['content'] = f.read()
+        # The metadata file's mtime is the entry's last use, for LRU eviction
+        os.utime(meta_path)
+        return entry
+    except (OSError, ValueError):
+        return None
+
+
+def _atomic_write(path: str, data: bytes):
+    """Write a file atomically so concurrent readers never see a partial file"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _store_cached_usccb_page(url: str, response, content: bytes) -> None:
+    """Cache a complete USCCB response if it carries an ETag or Last-Modified validator"""
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if not etag and not last_modified:
+        return
+    
+    meta_path, body_path = _usccb_cache_paths(url)
+    try:
+        os.makedirs(USCCB_CACHE_DIR, exist_ok=True)
+        # Body first, so metadata never points at a missing body
+        _atomic_write(body_path, content)
+        _atomic_write(meta_path, json.dumps({
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'encoding': response.encoding or 'utf-8',
+            'cached_at': datetime.now().isoformat()
+        }).encode('utf-8'))
+    except Exception as e:
+        logger.warning(f"⚠️  Could not cache USCCB page {url}: {str(e)}")
+        return
+    _prune_usccb_cache()
+
+
+def _prune_usccb_cache():
+    """Evict expired pages, then the least recently used beyond USCCB_CACHE_MAX_BYTES"""
+    with _usccb_prune_lock:
+        entries = {}
+        try:
+            with os.scandir(USCCB_CACHE_DIR) as files:
+                for file in files:
+                    key, extension = os.path.splitext(file.name)
+                    if extension not in ('.json', '.html'):
+                        continue  # A write in progress
+                    stat = file.stat()
+                    entry = entries.setdefault(key, {'bytes': 0, 'stored_at': None, 'used_at': None})
+                    entry['bytes'] += stat.st_size
+                    entry['stored_at' if extension == '.html' else 'used_at'] = stat.st_mtime
+        except OSError as e:
+            logger.warning(f"⚠️  Could not prune USCCB page cache: {str(e)}")
+            return
+        
+        expired_before = time.time() - USCCB_CACHE_TTL_DAYS * 86400
+        total_bytes = sum(entry['bytes'] for entry in entries.values())
+        evicted = 0
+        for key, entry in sorted(entries.items(), key=lambda item: item[1]['used_at'] or item[1]['stored_at']):
+            expired = entry['stored_at'] is None or entry['stored_at'] <= expired_before
+            if not expired and total_bytes <= USCCB_CACHE_MAX_BYTES:
+                continue
+            # Metadata first, so a reader never finds it pointing at a missing body
+            for path in (os.path.join(USCCB_CACHE_DIR, f"{key}.json"), os.path.join(USCCB_CACHE_DIR, f"{key}.html")):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f"⚠️  Could not evict cached USCCB page {path}: {str(e)}")
+            total_bytes -= entry['bytes']
+            evicted += 1
+    
+    if evicted:
+        logger.info(f"🧹 Evicted {evicted} USCCB pages from the cache ({total_bytes // 1024}KB kept)")
+        with _usccb_cache_lock:
+            _usccb_cache_stats['evicted'] += evicted
+
+
+def _usccb_request_headers(cached: Optional[Dict]) -> Dict[str, str]:
+    """Headers for a USCCB request, with the cached copy's validators for a conditional GET"""
+    headers = dict(USCCB_HEADERS)
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+    return headers
+
+
+def _usccb_not_modified(cached: Dict, reader: Optional['_USCCBPageReader'] = None) -> Tuple[bytes, str]:
+    """Serve a 304 Not Modified answer from the cached copy (fed to reader when streaming)"""
+    logger.info(f"♻️  USCCB page unchanged since {cached.get('cached_at')} - using cached copy")
+    with _usccb_cache_lock:
+        _usccb_cache_stats['revalidated'] += 1
+    encoding = cached.get('encoding') or 'utf-8'
+    if reader is not None:
+        reader.feed(cached['content'], encoding)
+    return cached['content'], encoding
+
+
+def _usccb_downloaded(url: str, response, content: bytes, partial: bool = False):
     """
-    Fetch USCCB reading references (NOT full text due to licensing)
-    Returns structured data with references only
-    Parses HTML to extract actual Bible references
+    Count a downloaded USCCB page and cache it
+    
+    A partial body (streaming mode stopped early) is not cached: the
+    response's validators describe the whole page, and a later 304 would
+    serve the truncated copy as if it were complete.
     """
-    url = generate_usccb_url(target_date)
+    if partial:
+        logger.info(f"✂️  All readings found after {len(content)} bytes - closing USCCB connection early")
+    with _usccb_cache_lock:
+        _usccb_cache_stats['fresh'] += 1
+        if isinstance(content, bytes):
+            _usccb_cache_stats['bytes_downloaded'] += len(content)
     
-    # Special handling for Thanksgiving (Nov 27 in 2025)
-    # Try Thanksgiving URL first for this date
-    if target_date.month == 11 and target_date.day == 27:
-        url = url.replace('.cfm', '-Thanksgiving.cfm')
-        logger.info(f"🦃 Using Thanksgiving URL: {url}")
+    if USCCB_CACHE_ENABLED and not partial:
+        _store_cached_usccb_page(url, response, content)
+
+
+def fetch_usccb_page(url: str, timeout: float = 30, reader: Optional['_USCCBPageReader'] = None) -> Tuple[bytes, str]:
+    """
+    GET a USCCB page, revalidating any cached copy with a conditional GET
+    
+    A 304 Not Modified answer is served from the cache, so unchanged pages
+    cost a few hundred bytes instead of the whole document.
+    
+    Args:
+        url: Page URL
+        timeout: Request timeout in seconds
+        reader: If given, the page is streamed into it chunk by chunk and the
+            connection is closed as soon as the reader has every reading
+    
+    Returns:
+        tuple: (raw page bytes - only the part read when stopped early, character encoding)
+    
+    Raises:
+        requests.exceptions.RequestException on network or HTTP errors
+    """
+    cached = _load_cached_usccb_page(url) if USCCB_CACHE_ENABLED else None
+    headers = _usccb_request_headers(cached)
+    
+    if reader is None:
+        response = requests.get(url, timeout=timeout, headers=headers)
     else:
-        logger.info(f"🔎 Fetching USCCB reading data from {url}")
+        response = requests.get(url, timeout=timeout, headers=headers, stream=True)
+    
+    if cached and response.status_code == 304:
+        response.close()
+        return _usccb_not_modified(cached, reader)
     
+    partial = False
     try:
-        response = requests.get(url, timeout=30, headers={
-            'User-Agent': 'Mozilla/5.0 (compatible; Daily Readings Seeder/1.0)'
-        })
         response.raise_for_status()
+        encoding = response.encoding or 'utf-8'
+        if reader is None:
+            content = response.content
+        else:
+            chunks = []
+            for chunk in response.iter_content(chunk_size=USCCB_STREAM_CHUNK_SIZE):
+                chunks.append(chunk)
+                if reader.feed(chunk, encoding):
+                    partial = True
+                    break
+            content = b''.join(chunks)
+    finally:
+        if reader is not None:
+            response.close()
+    
+    _usccb_downloaded(url, response, content, partial)
+    return content, encoding
+
+
+def _new_usccb_result(target_date: date, url: str) -> Dict:
+    """Initial result structure filled in by the USCCB page parsers"""
+    return {
+        'title': f"Readings for {target_date.strftime('%A, %B %d, %Y')}",
+        'url': url,
+        'reading1': {'title': 'Reading 1', 'reference': ''},
+        'responsorialPsalm': {'title': 'Responsorial Psalm', 'reference': '', 'response': ''},
+        'gospel': {'title': 'Gospel', 'reference': ''}
+    }
+
+
+def _record_usccb_section(result: Dict, section_name: str, reference: str) -> Optional[str]:
+    """
+    Store a reference under the matching reading in the result
+    
+    Returns:
+        The result key the reference was stored under, or None if the section
+        is not one of the readings. For 'responsorialPsalm' the refrain is read
+        from the content-body that follows the header.
+    """
+    # Match to the appropriate section (case-insensitive, flexible matching)
+    section_lower = section_name.lower().strip()
+    
+    if 'reading 1' in section_lower or 'first reading' in section_lower or section_lower == 'reading i':
+        result['reading1']['reference'] = reference
+        logger.info(f"✅ Found Reading 1: {reference}")
+        return 'reading1'
+    elif 'responsorial psalm' in section_lower or section_lower == 'responsorial psalm':
+        result['responsorialPsalm']['reference'] = reference
+        logger.info(f"✅ Found Responsorial Psalm: {reference}")
+        return 'responsorialPsalm'
+    elif 'gospel' in section_lower:
+        result['gospel']['reference'] = reference
+        logger.info(f"✅ Found Gospel: {reference}")
+        return 'gospel'
+    elif 'reading 2' in section_lower or 'second reading' in section_lower or section_lower == 'reading ii':
+        # Add reading2 if present
+        result['reading2'] = {'title': 'Reading 2', 'reference': reference}
+        logger.info(f"✅ Found Reading 2: {reference}")
+        return 'reading2'
+    return None
+
+
+def _record_psalm_response(result: Dict, content_text: str):
+    """Extract the psalm response/refrain (e.g., "R. In you, O Lord, I have found my peace.")"""
+    # Find text that starts with "R." or "R. ("
+    response_match = re.search(r'R\.\s*(?:\([^)]+\)\s*)?(.+?)(?:\n|$)', content_text, re.MULTILINE)
+    if response_match:
+        response = response_match.group(1).strip()
+        # Remove any trailing asterisks or special chars
+        response = re.sub(r'\*+$', '', response).strip()
+        result['responsorialPsalm']['response'] = response
+        logger.info(f"✅ Found Psalm Response: {response}")
+
+
+def _parse_usccb_html_soup(html, target_date: date, url: str) -> Dict:
+    """
+    Parse a USCCB readings page by building a full BeautifulSoup tree
+    
+    Reference implementation for _USCCBReadingExtractor; kept for
+    benchmark_usccb_parse.py and equivalence tests.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    result = _new_usccb_result(target_date, url)
+    
+    # USCCB uses <div class="address"> tags for Bible references
+    # Structure: <h3 class="name">Reading 1</h3> <div class="address"><a>Reference</a></div>
+    
+    # Find all content-header sections
+    headers = soup.find_all('div', class_='content-header')
+    
+    for header in headers:
+        # Get the name/title
+        name_elem = header.find('h3', class_='name')
+        if not name_elem:
+            continue
         
-        # Parse HTML to extract references
-        soup = BeautifulSoup(response.text, 'html.parser')
+        section_name = name_elem.get_text().strip()
         
-        # Initialize result structure
-        result = {
-            'title': f"Readings for {target_date.strftime('%A, %B %d, %Y')}",
-            'url': url,
-            'reading1': {'title': 'Reading 1', 'reference': ''},
-            'responsorialPsalm': {'title': 'Responsorial Psalm', 'reference': '', 'response': ''},
-            'gospel': {'title': 'Gospel', 'reference': ''}
-        }
+        # Get the reference from the address div
+        address_elem = header.find('div', class_='address')
+        if not address_elem:
+            continue
         
-        # USCCB uses <div class="address"> tags for Bible references
-        # Structure: <h3 class="name">Reading 1</h3> <div class="address"><a>Reference</a></div>
+        # The reference is in an <a> tag inside the address div
+        ref_link = address_elem.find('a')
+        if ref_link:
+            reference = ref_link.get_text().strip()
+            
+            if _record_usccb_section(result, section_name, reference) == 'responsorialPsalm':
+                # Look for the psalm content after the header
+                content_body = header.find_next_sibling('div', class_='content-body')
+                if content_body:
+                    _record_psalm_response(result, content_body.get_text())
+    
+    return result
+
+
+class _USCCBReadingExtractor(HTMLParser):
+    """
+    Incremental extractor for the reading headers on a USCCB readings page
+    
+    Mirrors the lookups in _parse_usccb_html_soup without building a tree:
+    only the text of each div.content-header's first h3.name and first
+    div.address link, plus the div.content-body sibling after the
+    Responsorial Psalm header, is kept. Everything else streams past.
+    Can be fed the page in chunks. Nested content-header divs (which USCCB
+    pages do not use) are not supported.
+    """
+    
+    # Elements that never have children (same list BeautifulSoup uses)
+    VOID_ELEMENTS = frozenset({
+        'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'keygen', 'link',
+        'menuitem', 'meta', 'param', 'source', 'track', 'wbr', 'basefont', 'bgsound',
+        'command', 'frame', 'image', 'isindex', 'nextid', 'spacer'
+    })
+    # Elements whose text get_text() leaves out
+    SKIPPED_TEXT_ELEMENTS = frozenset({'script', 'style', 'template'})
+    # Elements where BeautifulSoup keeps whitespace-only strings as-is
+    PRESERVE_WHITESPACE_ELEMENTS = frozenset({'pre', 'textarea'})
+    ASCII_SPACES = ' \n\t\x0c\r'
+    
+    def __init__(self, result: Dict):
+        super().__init__(convert_charrefs=True)
+        self.result = result
+        self._stack = []
+        self._text = []
+        self._skip_text = 0
+        self._header = None
+        self._psalm_sibling_depth = None
+        self._psalm_body = None
+        self._gospel_after_psalm = False
+        # Depth of the innermost open element holding every reading header so far
+        self._readings_depth = None
+        self._readings_closed = False
+    
+    @property
+    def _found_readings(self) -> bool:
+        """
+        True while Reading 1, the Responsorial Psalm with its refrain and a
+        Gospel after the psalm have been read
         
-        # Find all content-header sections
-        headers = soup.find_all('div', class_='content-header')
+        Requiring the Gospel to follow the psalm skips the procession Gospel
+        that comes first on Palm Sunday.
+        """
+        return (
+            self._gospel_after_psalm
+            and bool(self.result['reading1']['reference'])
+            and self._psalm_sibling_depth is None
+            and self._psalm_body is None
+        )
+    
+    @property
+    def has_all_readings(self) -> bool:
+        """
+        True once every reading is found and the element holding the reading
+        headers has closed
         
-        for header in headers:
-            # Get the name/title
-            name_elem = header.find('h3', class_='name')
-            if not name_elem:
-                continue
+        Pages with several Masses (Christmas, the Easter Vigil) list them one
+        after another, and a full parse keeps the last one's readings; waiting
+        for the readings' container to close lets a streamed parse see them too.
+        """
+        return self._readings_closed
+    
+    @staticmethod
+    def _classes(attrs) -> List[str]:
+        for name, value in attrs:
+            if name == 'class':
+                return (value or '').split()
+        return []
+    
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        if tag in self.VOID_ELEMENTS:
+            return
+        
+        depth = len(self._stack)
+        self._stack.append(tag)
+        if tag in self.SKIPPED_TEXT_ELEMENTS:
+            self._skip_text += 1
+        
+        header = self._header
+        if tag == 'div':
+            classes = self._classes(attrs)
+            if header is None and 'content-header' in classes:
+                self._header = {
+                    'depth': depth, 'name': None, 'name_depth': None,
+                    'address_depth': None, 'address_seen': False,
+                    'reference': None, 'link_depth': None
+                }
+            elif header is not None and not header['address_seen'] and 'address' in classes:
+                header['address_seen'] = True
+                header['address_depth'] = depth
+            elif (self._psalm_body is None and depth == self._psalm_sibling_depth
+                    and 'content-body' in classes):
+                self._psalm_body = {'depth': depth, 'text': []}
+        elif header is not None:
+            if tag == 'h3' and header['name'] is None and 'name' in self._classes(attrs):
+                header['name'] = []
+                header['name_depth'] = depth
+            elif tag == 'a' and header['address_depth'] is not None and header['reference'] is None:
+                header['reference'] = []
+                header['link_depth'] = depth
+    
+    def handle_data(self, data):
+        # Buffered until the next tag so a string split across feeds is
+        # treated as one, like BeautifulSoup does
+        self._text.append(data)
+    
+    def handle_comment(self, data):
+        self._flush_text()
+    
+    def handle_decl(self, decl):
+        self._flush_text()
+    
+    def handle_pi(self, data):
+        self._flush_text()
+    
+    def unknown_decl(self, data):
+        self._flush_text()
+    
+    def _flush_text(self):
+        if not self._text:
+            return
+        data = ''.join(self._text)
+        self._text = []
+        if self._skip_text:
+            return
+        
+        # BeautifulSoup collapses whitespace-only strings to one character
+        if not data.strip(self.ASCII_SPACES) and not self.PRESERVE_WHITESPACE_ELEMENTS.intersection(self._stack):
+            data = '\n' if '\n' in data else ' '
+        
+        header = self._header
+        if header is not None:
+            if header['name_depth'] is not None:
+                header['name'].append(data)
+            if header['link_depth'] is not None:
+                header['reference'].append(data)
+        if self._psalm_body is not None:
+            self._psalm_body['text'].append(data)
+    
+    def handle_endtag(self, tag):
+        self._flush_text()
+        # Like BeautifulSoup, close everything up to the most recent matching
+        # open tag and ignore stray end tags
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index] == tag:
+                self._pop_to(index)
+                return
+    
+    def close(self):
+        super().close()
+        self._flush_text()
+        self._pop_to(0)
+    
+    def _pop_to(self, index: int):
+        while len(self._stack) > index:
+            depth = len(self._stack) - 1
+            tag = self._stack.pop()
+            if tag in self.SKIPPED_TEXT_ELEMENTS:
+                self._skip_text -= 1
             
-            section_name = name_elem.get_text().strip()
+            header = self._header
+            if header is not None:
+                if depth == header['name_depth']:
+                    header['name_depth'] = None
+                elif depth == header['link_depth']:
+                    header['link_depth'] = None
+                elif depth == header['address_depth']:
+                    header['address_depth'] = None
+                elif depth == header['depth']:
+                    self._finish_header(header)
             
-            # Get the reference from the address div
-            address_elem = header.find('div', class_='address')
-            if not address_elem:
-                continue
+            if self._psalm_body is not None and depth == self._psalm_body['depth']:
+                _record_psalm_response(self.result, ''.join(self._psalm_body['text']))
+                self._psalm_body = None
+                self._psalm_sibling_depth = None
+            elif self._psalm_sibling_depth is not None and depth < self._psalm_sibling_depth:
+                # Parent closed without a content-body sibling
+                self._psalm_sibling_depth = None
             
-            # The reference is in an <a> tag inside the address div
-            ref_link = address_elem.find('a')
-            if ref_link:
-                reference = ref_link.get_text().strip()
-                
-                # Match to the appropriate section (case-insensitive, flexible matching)
-                section_lower = section_name.lower().strip()
-                
-                if 'reading 1' in section_lower or 'first reading' in section_lower or section_lower == 'reading i':
-                    result['reading1']['reference'] = reference
-                    logger.info(f"✅ Found Reading 1: {reference}")
-                elif 'responsorial psalm' in section_lower or section_lower == 'responsorial psalm':
-                    result['responsorialPsalm']['reference'] = reference
-                    logger.info(f"✅ Found Responsorial Psalm: {reference}")
-                    
-                    # Extract the psalm response/refrain (e.g., "R. In you, O Lord, I have found my peace.")
-                    # Look for the psalm content after the header
-                    content_body = header.find_next_sibling('div', class_='content-body')
-                    if content_body:
-                        # Find text that starts with "R." or "R. ("
-                        response_match = re.search(r'R\.\s*(?:\([^)]+\)\s*)?(.+?)(?:\n|$)', content_body.get_text(), re.MULTILINE)
-                        if response_match:
-                            response = response_match.group(1).strip()
-                            # Remove any trailing asterisks or special chars
-                            response = re.sub(r'\*+$', '', response).strip()
-                            result['responsorialPsalm']['response'] = response
-                            logger.info(f"✅ Found Psalm Response: {response}")
-                    
-                elif 'gospel' in section_lower:
-                    result['gospel']['reference'] = reference
-                    logger.info(f"✅ Found Gospel: {reference}")
-                elif 'reading 2' in section_lower or 'second reading' in section_lower or section_lower == 'reading ii':
-                    # Add reading2 if present
-                    result['reading2'] = {'title': 'Reading 2', 'reference': reference}
-                    logger.info(f"✅ Found Reading 2: {reference}")
-        
-        # If we didn't find responsorial psalm, return None
-        if not result['responsorialPsalm']['reference']:
-            logger.warning(f"⚠️  Could not extract responsorial psalm reference from USCCB page for {target_date}")
-            return None
+            if depth == self._readings_depth and not self._readings_closed:
+                if self._found_readings:
+                    self._readings_closed = True
+                else:
+                    # More readings may follow in the parent
+                    self._readings_depth -= 1
+    
+    def _finish_header(self, header: Dict):
+        self._header = None
+        if header['name'] is None or header['reference'] is None:
+            return
+        section_name = ''.join(header['name']).strip()
+        reference = ''.join(header['reference']).strip()
+        section = _record_usccb_section(self.result, section_name, reference)
+        if section is not None and self._readings_depth is None:
+            # The header itself has closed; its parent is the first candidate container
+            self._readings_depth = header['depth'] - 1
+        if section == 'responsorialPsalm':
+            self._psalm_sibling_depth = header['depth']
+        elif section == 'gospel' and self.result['responsorialPsalm']['reference']:
+            self._gospel_after_psalm = True
+
+
+class _USCCBPageReader:
+    """Feeds raw USCCB page bytes through an incremental decoder into the extractor"""
+    
+    def __init__(self, target_date: date, url: str):
+        self.result = _new_usccb_result(target_date, url)
+        self._extractor = _USCCBReadingExtractor(self.result)
+        self._decoder = None
+    
+    def feed(self, chunk: bytes, encoding: str) -> bool:
+        """Parse the next chunk; returns True once every reading has been found"""
+        if self._decoder is None:
+            self._decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        self._extractor.feed(self._decoder.decode(chunk))
+        return self._extractor.has_all_readings
+    
+    def finish(self) -> Dict:
+        """Flush the parser and return the result dict"""
+        if self._decoder is not None:
+            self._extractor.feed(self._decoder.decode(b'', final=True))
+        self._extractor.close()
+        return self.result
+
+
+def parse_usccb_reading_html(content, target_date: date, url: str, encoding: str = 'utf-8') -> Dict:
+    """
+    Extract reading references from a USCCB readings page
+    
+    Args:
+        content: Page HTML as bytes (decoded with encoding) or str
+        target_date: Date the page is for
+        url: Page URL
+        encoding: Character encoding for bytes content
+    
+    Returns:
+        Same result dict as _parse_usccb_html_soup
+    """
+    if isinstance(content, str):
+        content, encoding = content.encode('utf-8'), 'utf-8'
+    reader = _USCCBPageReader(target_date, url)
+    for offset in range(0, len(content), 65536):
+        reader.feed(content[offset:offset + 65536], encoding)
+    return reader.finish()
+
+
+def usccb_reading_url(target_date: date) -> str:
+    """URL of the USCCB page to read a date's readings from"""
+    url = generate_usccb_url(target_date)
+    
+    # Special handling for Thanksgiving (Nov 27 in 2025)
+    # Try Thanksgiving URL first for this date
+    if target_date.month == 11 and target_date.day == 27:
+        url = url.replace('.cfm', '-Thanksgiving.cfm')
+        logger.info(f"🦃 Using Thanksgiving URL: {url}")
+    return url
+
+
+def _usccb_reading_result(result: Dict, target_date: date) -> Optional[Dict]:
+    """A parsed USCCB page, or None if it has no responsorial psalm to seed"""
+    if not result['responsorialPsalm']['reference']:
+        logger.warning(f"⚠️  Could not extract responsorial psalm reference from USCCB page for {target_date}")
+        return None
+    return result
+
+
+def fetch_usccb_reading_data(target_date: date, stream: Optional[bool] = None, timeout: float = 30) -> Optional[Dict]:
+    """
+    Fetch USCCB reading references (NOT full text due to licensing)
+    Returns structured data with references only
+    Parses HTML to extract actual Bible references
+    
+    Args:
+        target_date: Date to fetch
+        stream: Parse the page while it downloads and stop once Reading 1, the
+            Responsorial Psalm (with its refrain) and the Gospel are found.
+            Defaults to the USCCB_STREAM environment variable.
+        timeout: Request timeout in seconds
+    """
+    if stream is None:
+        stream = USCCB_STREAM
+    
+    url = usccb_reading_url(target_date)
+    logger.info(f"🔎 Fetching USCCB reading data from {url}")
+    
+    try:
+        # Parse HTML to extract references
+        if stream:
+            reader = _USCCBPageReader(target_date, url)
+            fetch_usccb_page(url, timeout=timeout, reader=reader)
+            result = reader.finish()
+        else:
+            content, encoding = fetch_usccb_page(url, timeout=timeout)
+            result = parse_usccb_reading_html(content, target_date, url, encoding)
         
-        return result
+        return _usccb_reading_result(result, target_date)
         
     except Exception as e:
         logger.error(f"❌ Error fetching USCCB data: {str(e)}")
         return None
 
 
-def fetch_public_scripture_text(reference: str) -> str:
+def _get_host_limit(url: str) -> Dict:
+    """Get (or create) the politeness state shared by all requests to a host"""
+    host = urlparse(url).netloc
+    with _host_limits_lock:
+        if host not in _host_limits:
+            _host_limits[host] = {
+                'semaphore': threading.BoundedSemaphore(MAX_CONNECTIONS_PER_HOST),
+                'lock': threading.Lock(),
+                'next_start': 0.0
+            }
+        return _host_limits[host]
+
+
+def _wait_for_host_slot(host_limit: Dict):
+    """Space out request starts to the same host by MIN_REQUEST_INTERVAL_SECONDS"""
+    with host_limit['lock']:
+        now = time.monotonic()
+        start_at = max(now, host_limit['next_start'])
+        host_limit['next_start'] = start_at + MIN_REQUEST_INTERVAL_SECONDS
+    if start_at > now:
+        time.sleep(start_at - now)
+
+
+# Marks a prefetch that never started because the deadline passed
+_NOT_FETCHED = object()
+
+
+def prefetch_usccb_readings(target_dates: List[date], max_workers: Optional[int] = None,
+                            deadline: Optional[Deadline] = None) -> Tuple[Dict, Dict]:
     """
-    Fetch public domain scripture text for a given reference
-    Uses bible-api.com (KJV - public domain)
+    Fetch and parse the USCCB pages for all dates concurrently
+
+    Uses a bounded thread pool; requests to the same host are additionally
+    limited to MAX_CONNECTIONS_PER_HOST in flight and spaced out by
+    MIN_REQUEST_INTERVAL_SECONDS so USCCB is not hammered.
+
+    Args:
+        target_dates: Dates to prefetch
+        max_workers: Worker pool size (defaults to USCCB_PREFETCH_WORKERS)
+        deadline: Run deadline; dates not started before it are left out of
+            the result, and requests are cut short to fit it
+
+    Returns:
+        tuple: (dict of date -> parsed USCCB data or None, timing stats dict)
+    """
+    workers = max(1, min(max_workers or USCCB_PREFETCH_WORKERS, len(target_dates) or 1))
+    durations = {}
+
+    def fetch_one(target_date):
+        host_limit = _get_host_limit(generate_usccb_url(target_date))
+        with host_limit['semaphore']:
+            _wait_for_host_slot(host_limit)
+            if deadline is not None and deadline.expired():
+                return _NOT_FETCHED
+            started = time.monotonic()
+            try:
+                return fetch_usccb_reading_data(target_date, **_timeout_kwargs(deadline, 30))
+            finally:
+                durations[target_date] = time.monotonic() - started
+
+    logger.info(f"⚡ Prefetching USCCB data for {len(target_dates)} dates with {workers} workers")
+    wall_start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        fetched = {
+            target_date: reading for target_date, reading in zip(target_dates, executor.map(fetch_one, target_dates))
+            if reading is not _NOT_FETCHED
+        }
+    wall_seconds = time.monotonic() - wall_start
+
+    # Sequential cost is what the same fetches would have taken one after another
+    sequential_seconds = sum(durations.values())
+    stats = {
+        'dates': len(fetched),
+        'fetched': sum(1 for reading in fetched.values() if reading),
+        'workers': workers,
+        'wall_seconds': round(wall_seconds, 3),
+        'sequential_seconds': round(sequential_seconds, 3),
+        'saved_seconds': round(max(0.0, sequential_seconds - wall_seconds), 3)
+    }
+    logger.info(
+        f"⚡ Prefetched {stats['fetched']}/{stats['dates']} USCCB pages in {stats['wall_seconds']}s "
+        f"(saved ~{stats['saved_seconds']}s vs sequential)"
+    )
+    return fetched, stats
+
+
+def get_verse_store() -> Optional[VerseStore]:
+    """Open the bundled verse store once per instance; None if it isn't packaged"""
+    global _verse_store, _verse_store_loaded
+    
+    with _verse_store_lock:
+        if not _verse_store_loaded:
+            _verse_store_loaded = True
+            if os.path.exists(KJV_STORE_PATH):
+                try:
+                    _verse_store = VerseStore(KJV_STORE_PATH)
+                    logger.info(f"📚 Loaded verse store {KJV_STORE_PATH} ({_verse_store.verse_count} verses)")
+                except Exception as e:
+                    logger.warning(f"⚠️  Could not open verse store {KJV_STORE_PATH}: {str(e)}")
+            else:
+                logger.warning(
+                    f"⚠️  No verse store at {KJV_STORE_PATH} - every passage will be fetched from bible-api.com. "
+                    f"Build it with verse_store.py before deploying (see README)"
+                )
+        return _verse_store
+
+
+def _scripture_passage(reference: str) -> Optional[Dict]:
+    """
+    Normalize a lectionary reference into the passage requested from the text sources
+    
+    Returns:
+        Dict with the API book name, chapter and the list of verses to fetch,
+        or None if the reference can't be parsed
     """
     if not reference or reference == 'TBD':
-        return ""
+        return None
     
     parsed = parse_bible_reference(reference)
     
@@ -334,118 +1073,322 @@ def fetch_public_scripture_text(reference: str) -> str:
     
     if not book or chapter == 0 or not verses:
         logger.warning(f"⚠️  Could not parse reference: {reference}")
+        return None
+    
+    # Check the book, chapter and verses exist before any network call
+    book_info = BOOKS_BY_ID.get(parsed.get('book_id'))
+    if not book_info:
+        logger.warning(f"⚠️  Unknown book in reference: {reference}")
+        return None
+    problem = validate_passage(book_info, chapter, verses)
+    if problem:
+        logger.warning(f"⚠️  Invalid reference {reference}: {problem}")
+        return None
+    
+    # Handle complex formats like "Psalm 98:1, 2-3ab, 5-6" - fetch exactly
+    # the verses listed, as the fewest contiguous segments
+    segments = compile_verse_segments(verses)
+    
+    return {
+        'book': book_info.name,
+        'chapter': chapter,
+        'segments': segments,
+        'verses': [verse for start, end in segments for verse in range(start, end + 1)]
+    }
+
+
+def compile_verse_segments(verses: List[int]) -> List[Tuple[int, int]]:
+    """
+    Compile a verse list into the minimal ordered list of contiguous segments
+    
+    [1, 2, 3, 5, 6] -> [(1, 3), (5, 6)]
+    """
+    segments = []
+    for verse in sorted(set(verses)):
+        if segments and verse == segments[-1][1] + 1:
+            segments[-1] = (segments[-1][0], verse)
+        else:
+            segments.append((verse, verse))
+    return segments
+
+
+def _passage_api_ref(passage: Dict) -> str:
+    """Verse part of a bible-api.com reference, e.g. 98:1-3,5-6"""
+    parts = [str(start) if start == end else f"{start}-{end}" for start, end in passage['segments']]
+    return f"{passage['chapter']}:{','.join(parts)}"
+
+
+def _clean_scripture_text(text: str) -> str:
+    """Strip verse number markers and normalize whitespace in API text"""
+    text = text.strip()
+    # Remove verse number markers like "1 " at start of lines if present
+    text = re.sub(r'^\d+\s+', '', text, flags=re.MULTILINE)
+    return ' '.join(text.split())  # Normalize whitespace
+
+
+def _read_verse_store(passage: Dict) -> str:
+    """Passage text from the bundled verse store, or '' if unavailable"""
+    store = get_verse_store()
+    if store is None:
+        return ''
+    return store.passage(passage['book'], passage['chapter'], passage['verses']) or ''
+
+
+class ScriptureTextCache:
+    """
+    Two-tier cache of fetched scripture text, keyed by canonical passage
+    
+    Tier 1 is an in-process LRU (lives as long as the function instance).
+    Tier 2 is a SQLite file that survives across runs; entries expire after
+    ttl_days and the least recently used are evicted beyond max_entries.
+    
+    Passages the API can't serve are remembered as unavailable (in memory and
+    in SQLite) and not requested again until reprobe_days have passed.
+    Counters show how many bible-api.com calls were avoided or suppressed.
+    """
+    
+    def __init__(self, db_path: str, memory_size: int, ttl_days: float, max_entries: int,
+                 reprobe_days: float = SCRIPTURE_UNAVAILABLE_REPROBE_DAYS):
+        self.db_path = db_path
+        self.memory_size = memory_size
+        self.ttl_seconds = ttl_days * 86400
+        self.max_entries = max_entries
+        self.reprobe_seconds = reprobe_days * 86400
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'suppressed': 0}
+        self._memory = OrderedDict()
+        # Passage key -> time it was found unavailable
+        self._unavailable = {}
+        self._lock = threading.Lock()
+        self._conn = None
+        self._disk_failed = False
+    
+    def _db(self) -> Optional[sqlite3.Connection]:
+        """Open the SQLite tier on first use; None if it is unavailable"""
+        if self._conn is None and not self._disk_failed:
+            try:
+                os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+                conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                conn.execute(
+                    'CREATE TABLE IF NOT EXISTS scripture_text ('
+                    'key TEXT PRIMARY KEY, text TEXT NOT NULL, '
+                    'stored_at REAL NOT NULL, accessed_at REAL NOT NULL)'
+                )
+                conn.execute(
+                    'CREATE TABLE IF NOT EXISTS scripture_unavailable ('
+                    'key TEXT PRIMARY KEY, reason TEXT NOT NULL, failed_at REAL NOT NULL)'
+                )
+                conn.commit()
+                self._conn = conn
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️  Scripture cache database unavailable ({self.db_path}): {str(e)}")
+                self._disk_failed = True
+        return self._conn
+    
+    def _remember(self, key: str, text: str):
+        self._memory[key] = text
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+    
+    def get(self, key: str) -> Optional[str]:
+        """Cached text for a passage key, or None (counted as a miss)"""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.stats['memory_hits'] += 1
+                return self._memory[key]
+            
+            conn = self._db()
+            if conn is not None:
+                try:
+                    now = time.time()
+                    row = conn.execute(
+                        'SELECT text FROM scripture_text WHERE key = ? AND stored_at > ?',
+                        (key, now - self.ttl_seconds)
+                    ).fetchone()
+                    if row:
+                        conn.execute('UPDATE scripture_text SET accessed_at = ? WHERE key = ?', (now, key))
+                        conn.commit()
+                        self._remember(key, row[0])
+                        self.stats['disk_hits'] += 1
+                        return row[0]
+                except sqlite3.Error as e:
+                    logger.warning(f"⚠️  Scripture cache read failed: {str(e)}")
+            
+            self.stats['misses'] += 1
+            return None
+    
+    def put(self, key: str, text: str):
+        """Store fetched text in both tiers (empty results are not cached)"""
+        if not text:
+            return
+        with self._lock:
+            self._remember(key, text)
+            self._unavailable.pop(key, None)
+            conn = self._db()
+            if conn is None:
+                return
+            try:
+                now = time.time()
+                conn.execute(
+                    'INSERT OR REPLACE INTO scripture_text (key, text, stored_at, accessed_at) VALUES (?, ?, ?, ?)',
+                    (key, text, now, now)
+                )
+                conn.execute('DELETE FROM scripture_unavailable WHERE key = ?', (key,))
+                # Evict expired entries, then the least recently used beyond the size cap
+                conn.execute('DELETE FROM scripture_text WHERE stored_at <= ?', (now - self.ttl_seconds,))
+                conn.execute(
+                    'DELETE FROM scripture_text WHERE key IN ('
+                    'SELECT key FROM scripture_text ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+                    (self.max_entries,)
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️  Scripture cache write failed: {str(e)}")
+    
+    def is_unavailable(self, key: str) -> bool:
+        """True if the passage was found unavailable within the re-probe interval (counted as suppressed)"""
+        with self._lock:
+            failed_at = self._unavailable.get(key)
+            if failed_at is None:
+                conn = self._db()
+                if conn is not None:
+                    try:
+                        row = conn.execute(
+                            'SELECT failed_at FROM scripture_unavailable WHERE key = ?', (key,)
+                        ).fetchone()
+                        if row:
+                            failed_at = self._unavailable[key] = row[0]
+                    except sqlite3.Error as e:
+                        logger.warning(f"⚠️  Scripture cache read failed: {str(e)}")
+            
+            if failed_at is not None and failed_at > time.time() - self.reprobe_seconds:
+                self.stats['suppressed'] += 1
+                return True
+            return False
+    
+    def mark_unavailable(self, key: str, reason: str):
+        """Remember that the API can't serve a passage"""
+        with self._lock:
+            now = time.time()
+            self._unavailable[key] = now
+            conn = self._db()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    'INSERT OR REPLACE INTO scripture_unavailable (key, reason, failed_at) VALUES (?, ?, ?)',
+                    (key, reason, now)
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️  Scripture cache write failed: {str(e)}")
+    
+    def snapshot(self) -> Dict:
+        """Copy of the hit/miss counters"""
+        with self._lock:
+            return dict(self.stats)
+
+
+_scripture_cache = ScriptureTextCache(
+    SCRIPTURE_CACHE_DB, SCRIPTURE_CACHE_SIZE, SCRIPTURE_CACHE_TTL_DAYS, SCRIPTURE_CACHE_MAX_ENTRIES
+)
+
+
+def _passage_key(passage: Dict) -> str:
+    """Canonical cache key for a passage, e.g. Psalms 23:1-6"""
+    return f"{passage['book']} {_passage_api_ref(passage)}"
+
+
+def _scripture_api_url(book: str, passages: List[Dict]) -> str:
+    """bible-api.com URL for one or more passages of a book"""
+    return f"https://bible-api.com/{book}+{','.join(_passage_api_ref(passage) for passage in passages)}"
+
+
+def _stored_scripture_text(reference: str, passage: Dict) -> Optional[str]:
+    """
+    A passage's text from the verse store or the scripture cache
+    
+    Returns:
+        The text, '' if bible-api.com recently couldn't serve the passage,
+        or None if it has to be fetched
+    """
+    text = _read_verse_store(passage)
+    if text:
+        logger.info(f"📚 Read {len(text)} characters for {reference} from verse store")
+        return text
+    
+    if SCRIPTURE_CACHE_ENABLED:
+        key = _passage_key(passage)
+        text = _scripture_cache.get(key)
+        if text:
+            logger.info(f"♻️  Using cached scripture text for {reference}")
+            return text
+        if _scripture_cache.is_unavailable(key):
+            logger.info(f"⏭️  Skipping {reference} - bible-api.com recently couldn't serve it")
+            return ""
+    return None
+
+
+def _scripture_response_text(reference: str, passage: Dict, response) -> str:
+    """
+    Text from a single-passage bible-api.com response, cached for next time
+    
+    Not found means the API doesn't have the passage, which is remembered so
+    it isn't asked for again soon. Other errors (429 in particular) say
+    nothing about the passage and are raised for the caller to log.
+    """
+    key = _passage_key(passage)
+    if response.status_code in SCRIPTURE_UNAVAILABLE_STATUSES:
+        if SCRIPTURE_CACHE_ENABLED:
+            _scripture_cache.mark_unavailable(key, f"HTTP {response.status_code}")
+        logger.error(f"❌ Error fetching scripture text for {reference}: HTTP {response.status_code}")
         return ""
+    response.raise_for_status()
+    data = response.json()
     
-    # Build verse range string
-    # Handle complex formats like "Psalm 98:5-6, 7-8, 9"
-    # For bible-api.com, simplify to first and last verse
-    if len(verses) == 0:
-        logger.warning(f"⚠️  No verses found in reference: {reference}")
+    # Extract text from API response
+    if 'text' not in data:
+        logger.warning(f"⚠️  No text field in API response for {reference}")
+        if SCRIPTURE_CACHE_ENABLED:
+            _scripture_cache.mark_unavailable(key, 'no text in response')
         return ""
-    elif len(verses) == 1:
-        verse_ref = f"{chapter}:{verses[0]}"
-    else:
-        # Use first and last verse to create a simple range
-        verse_ref = f"{chapter}:{verses[0]}-{verses[-1]}"
-    
-    # Format book name for API (handle abbreviations)
-    # bible-api.com uses full book names
-    book_map = {
-        'Romans': 'Romans', 'Rom': 'Romans',
-        'Luke': 'Luke', 'Lk': 'Luke',
-        'John': 'John', 'Jn': 'John',
-        'Matthew': 'Matthew', 'Mt': 'Matthew',
-        'Mark': 'Mark', 'Mk': 'Mark',
-        'Hebrews': 'Hebrews', 'Heb': 'Hebrews',
-        'Psalms': 'Psalms', 'Ps': 'Psalms', 'Psalm': 'Psalms',
-        'Wisdom': 'Wisdom', 'Wis': 'Wisdom',
-        '1 Corinthians': '1 Corinthians', '1Cor': '1 Corinthians', '1 Cor': '1 Corinthians',
-        '2 Corinthians': '2 Corinthians', '2Cor': '2 Corinthians', '2 Cor': '2 Corinthians',
-        'Galatians': 'Galatians', 'Gal': 'Galatians',
-        'Ephesians': 'Ephesians', 'Eph': 'Ephesians',
-        'Philippians': 'Philippians', 'Phil': 'Philippians',
-        'Colossians': 'Colossians', 'Col': 'Colossians',
-        '1 Thessalonians': '1 Thessalonians', '1Thess': '1 Thessalonians', '1 Thess': '1 Thessalonians',
-        '2 Thessalonians': '2 Thessalonians', '2Thess': '2 Thessalonians', '2 Thess': '2 Thessalonians',
-        '1 Timothy': '1 Timothy', '1Tim': '1 Timothy', '1 Tim': '1 Timothy',
-        '2 Timothy': '2 Timothy', '2Tim': '2 Timothy', '2 Tim': '2 Timothy',
-        'Titus': 'Titus',
-        'Philemon': 'Philemon', 'Phlm': 'Philemon',
-        'James': 'James', 'Jas': 'James',
-        '1 Peter': '1 Peter', '1Pet': '1 Peter', '1 Pet': '1 Peter',
-        '2 Peter': '2 Peter', '2Pet': '2 Peter', '2 Pet': '2 Peter',
-        '1 John': '1 John', '1Jn': '1 John', '1 Jn': '1 John',
-        '2 John': '2 John', '2Jn': '2 John', '2 Jn': '2 John',
-        '3 John': '3 John', '3Jn': '3 John', '3 Jn': '3 John',
-        'Jude': 'Jude',
-        'Revelation': 'Revelation', 'Rev': 'Revelation',
-        'Acts': 'Acts',
-        'Genesis': 'Genesis', 'Gen': 'Genesis',
-        'Exodus': 'Exodus', 'Ex': 'Exodus',
-        'Leviticus': 'Leviticus', 'Lev': 'Leviticus',
-        'Numbers': 'Numbers', 'Num': 'Numbers',
-        'Deuteronomy': 'Deuteronomy', 'Deut': 'Deuteronomy',
-        'Joshua': 'Joshua', 'Josh': 'Joshua',
-        'Judges': 'Judges', 'Judg': 'Judges',
-        'Ruth': 'Ruth',
-        '1 Samuel': '1 Samuel', '1Sam': '1 Samuel', '1 Sam': '1 Samuel',
-        '2 Samuel': '2 Samuel', '2Sam': '2 Samuel', '2 Sam': '2 Samuel',
-        '1 Kings': '1 Kings', '1Kgs': '1 Kings', '1 Kgs': '1 Kings',
-        '2 Kings': '2 Kings', '2Kgs': '2 Kings', '2 Kgs': '2 Kings',
-        '1 Chronicles': '1 Chronicles', '1Chr': '1 Chronicles', '1 Chr': '1 Chronicles',
-        '2 Chronicles': '2 Chronicles', '2Chr': '2 Chronicles', '2 Chr': '2 Chronicles',
-        'Ezra': 'Ezra',
-        'Nehemiah': 'Nehemiah', 'Neh': 'Nehemiah',
-        'Esther': 'Esther', 'Esth': 'Esther',
-        'Job': 'Job',
-        'Proverbs': 'Proverbs', 'Prov': 'Proverbs',
-        'Ecclesiastes': 'Ecclesiastes', 'Eccl': 'Ecclesiastes',
-        'Song of Songs': 'Song of Songs', 'Song': 'Song of Songs',
-        'Isaiah': 'Isaiah', 'Is': 'Isaiah',
-        'Jeremiah': 'Jeremiah', 'Jer': 'Jeremiah',
-        'Lamentations': 'Lamentations', 'Lam': 'Lamentations',
-        'Ezekiel': 'Ezekiel', 'Ezek': 'Ezekiel',
-        'Daniel': 'Daniel', 'Dan': 'Daniel',
-        'Hosea': 'Hosea', 'Hos': 'Hosea',
-        'Joel': 'Joel',
-        'Amos': 'Amos',
-        'Obadiah': 'Obadiah', 'Obad': 'Obadiah',
-        'Jonah': 'Jonah',
-        'Micah': 'Micah', 'Mic': 'Micah',
-        'Nahum': 'Nahum', 'Nah': 'Nahum',
-        'Habakkuk': 'Habakkuk', 'Hab': 'Habakkuk',
-        'Zephaniah': 'Zephaniah', 'Zeph': 'Zephaniah',
-        'Haggai': 'Haggai', 'Hag': 'Haggai',
-        'Zechariah': 'Zechariah', 'Zech': 'Zechariah',
-        'Malachi': 'Malachi', 'Mal': 'Malachi',
-    }
     
-    api_book = book_map.get(book, book)
+    # Clean up the text (remove verse numbers if present, normalize whitespace)
+    text = _clean_scripture_text(data['text'])
+    logger.info(f"✅ Fetched {len(text)} characters for {reference}")
+    if SCRIPTURE_CACHE_ENABLED:
+        _scripture_cache.put(key, text)
+    return text
+
+
+def fetch_public_scripture_text(reference: str, timeout: float = 10) -> str:
+    """
+    Fetch public domain scripture text for a given reference
+    Reads the bundled KJV verse store when available, otherwise
+    uses bible-api.com (KJV - public domain)
+    
+    Args:
+        reference: Lectionary reference, e.g. "Ps 98:1-3, 5-6"
+        timeout: bible-api.com request timeout in seconds
+    """
+    if not reference or reference == 'TBD':
+        return ""
+    
+    passage = _scripture_passage(reference)
+    if not passage:
+        return ""
     
-    # Build API URL
-    api_ref = f"{api_book}+{verse_ref}"
-    api_url = f"https://bible-api.com/{api_ref}"
+    # Local lookup first
+    text = _stored_scripture_text(reference, passage)
+    if text is not None:
+        return text
     
     logger.info(f"📖 Fetching scripture text for {reference} from bible-api.com")
     
     try:
-        response = requests.get(api_url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        # Extract text from API response
-        if 'text' in data:
-            # Clean up the text (remove verse numbers if present, normalize whitespace)
-            text = data['text'].strip()
-            # Remove verse number markers like "1 " at start of lines if present
-            text = re.sub(r'^\d+\s+', '', text, flags=re.MULTILINE)
-            text = ' '.join(text.split())  # Normalize whitespace
-            logger.info(f"✅ Fetched {len(text)} characters for {reference}")
-            return text
-        else:
-            logger.warning(f"⚠️  No text field in API response for {reference}")
-            return ""
-            
+        response = requests.get(_scripture_api_url(passage['book'], [passage]), timeout=timeout)
+        return _scripture_response_text(reference, passage, response)
     except requests.exceptions.RequestException as e:
         logger.error(f"❌ Error fetching scripture text for {reference}: {str(e)}")
         return ""
@@ -454,6 +1397,218 @@ def fetch_public_scripture_text(reference: str) -> str:
         return ""
 
 
+def fetch_public_scripture_texts(references: List[str], deadline: Optional[Deadline] = None) -> Dict[str, str]:
+    """
+    Fetch public domain text for many references with as few requests as possible
+    
+    References are normalized and deduplicated, read from the verse store
+    where possible, and the rest are packed per book into combined
+    bible-api.com requests ("Psalms 23:1-6,98:1-3,5-6"). The combined response is
+    split back per reference using its per-verse entries. A reference the
+    combined response doesn't fully cover is fetched on its own.
+    
+    Args:
+        references: Lectionary references, e.g. every reading in a seeding range
+        deadline: Run deadline; requests are cut short to fit it, and
+            references still pending when it passes are left out of the result
+    
+    Returns:
+        Dict of reference -> text ('' if unavailable)
+    """
+    texts, passage_count, batches = _plan_scripture_batches(references)
+    
+    request_count = 0
+    rate_limited = False
+    for book, batch in batches:
+        if rate_limited or (deadline is not None and deadline.expired()):
+            # Left for whoever still seeds these dates to fetch on demand
+            _drop_scripture_batch(texts, batch)
+            continue
+        logger.info(f"📖 Fetching {len(batch)} {book} passages in one bible-api.com request")
+        request_count += 1
+        
+        verse_texts = {}
+        try:
+            response = requests.get(_scripture_api_url(book, [p for p, _ in batch]), timeout=_timeout(deadline, 10))
+            if response.status_code in SCRIPTURE_RATE_LIMIT_STATUSES:
+                _scripture_rate_limited(response.status_code)
+                rate_limited = True
+                _drop_scripture_batch(texts, batch)
+                continue
+            response.raise_for_status()
+            verse_texts = _batch_verse_texts(response.json())
+        except Exception as e:
+            logger.warning(f"⚠️  Batched scripture request for {book} failed: {str(e)}")
+        
+        for passage, refs in _apply_scripture_batch(batch, verse_texts, texts):
+            # Not covered by the combined response - fetch it alone
+            request_count += 1
+            text = fetch_public_scripture_text(refs[0], **_timeout_kwargs(deadline, 10))
+            for reference in refs:
+                texts[reference] = text
+    
+    logger.info(
+        f"📖 Resolved {passage_count} unique passages ({len(texts)} references) "
+        f"with {request_count} bible-api.com requests"
+    )
+    return texts
+
+
+def _plan_scripture_batches(references: List[str]) -> Tuple[Dict[str, str], int, List[Tuple[str, List]]]:
+    """
+    Resolve what the verse store and cache hold, and pack the rest into per-book batches
+    
+    Returns:
+        tuple: (reference -> text, '' for references still to fetch; number of
+            unique passages; list of (book, [(passage, references), ...]) batches
+            of at most SCRIPTURE_BATCH_MAX_PASSAGES passages)
+    """
+    texts = {}
+    # Canonical passage -> (passage, references that normalize to it)
+    pending = {}
+    for reference in references:
+        if reference in texts:
+            continue
+        passage = _scripture_passage(reference)
+        if not passage:
+            texts[reference] = ''
+            continue
+        key = _passage_key(passage)
+        pending.setdefault(key, (passage, []))[1].append(reference)
+        texts[reference] = ''
+    
+    by_book = {}
+    for passage, refs in pending.values():
+        text = _read_verse_store(passage)
+        if not text and SCRIPTURE_CACHE_ENABLED:
+            text = _scripture_cache.get(_passage_key(passage))
+            if not text and _scripture_cache.is_unavailable(_passage_key(passage)):
+                continue
+        if text:
+            for reference in refs:
+                texts[reference] = text
+        else:
+            by_book.setdefault(passage['book'], []).append((passage, refs))
+    
+    batches = [
+        (book, entries[i:i + SCRIPTURE_BATCH_MAX_PASSAGES])
+        for book, entries in by_book.items()
+        for i in range(0, len(entries), SCRIPTURE_BATCH_MAX_PASSAGES)
+    ]
+    return texts, len(pending), batches
+
+
+def _drop_scripture_batch(texts: Dict[str, str], batch: List[Tuple[Dict, List[str]]]):
+    """Leave a batch's references out of the result, to be fetched on demand"""
+    for passage, refs in batch:
+        for reference in refs:
+            texts.pop(reference, None)
+
+
+def _scripture_rate_limited(status_code: int):
+    """Log a rate-limited batch - retrying every passage alone would only make it worse"""
+    logger.warning(
+        f"⚠️  bible-api.com answered {status_code} - leaving the remaining passages "
+        f"to be fetched when their dates are seeded"
+    )
+
+
+def _batch_verse_texts(data: Dict) -> Dict[Tuple[int, int], str]:
+    """(chapter, verse) -> text from a combined bible-api.com response"""
+    return {
+        (verse.get('chapter'), verse.get('verse')): _clean_scripture_text(verse.get('text', ''))
+        for verse in data.get('verses', [])
+    }
+
+
+def _apply_scripture_batch(batch: List[Tuple[Dict, List[str]]], verse_texts: Dict[Tuple[int, int], str],
+                           texts: Dict[str, str]) -> List[Tuple[Dict, List[str]]]:
+    """
+    Split a combined response back per passage into texts (and the cache)
+    
+    Returns:
+        The batch's (passage, references) entries the response didn't fully cover
+    """
+    uncovered = []
+    for passage, refs in batch:
+        parts = [verse_texts.get((passage['chapter'], v)) for v in passage['verses']]
+        if not all(parts):
+            uncovered.append((passage, refs))
+            continue
+        text = ' '.join(parts)
+        if SCRIPTURE_CACHE_ENABLED:
+            _scripture_cache.put(_passage_key(passage), text)
+        for reference in refs:
+            texts[reference] = text
+    return uncovered
+
+
+def _freeze(value):
+    """Recursively wrap dicts in read-only mapping proxies"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class ResolvedReading:
+    """
+    A date's readings, fetched and parsed at most once per run
+    
+    One instance is shared by every Firebase project a run writes to, so the
+    USCCB page and each bible-api.com passage are requested once per date no
+    matter how many projects are seeded. Values are resolved lazily (a project
+    that skips the date costs nothing) and exposed read-only.
+    """
+    
+    def __init__(self, target_date: date, usccb_reading: Optional[Dict] = None,
+                 scripture_texts: Optional[Dict[str, str]] = None, deadline: Optional[Deadline] = None):
+        """
+        Args:
+            target_date: Date the readings are for
+            usccb_reading: Already-fetched USCCB data (e.g. from prefetch_usccb_readings);
+                fetched on first use when not provided
+            scripture_texts: Already-fetched texts by reference (e.g. from
+                fetch_public_scripture_texts); others are fetched on first use
+            deadline: Run deadline that caps the timeouts of fetches made on first use
+        """
+        self.target_date = target_date
+        self.deadline = deadline
+        self._lock = threading.Lock()
+        self._usccb_resolved = usccb_reading is not None
+        self._usccb = _freeze(usccb_reading)
+        self._texts = dict(scripture_texts or {})
+    
+    @property
+    def usccb(self) -> Optional[Mapping]:
+        """Parsed USCCB data (read-only), or None if it could not be fetched"""
+        with self._lock:
+            if not self._usccb_resolved:
+                self._usccb = _freeze(fetch_usccb_reading_data(self.target_date, **_timeout_kwargs(self.deadline, 30)))
+                self._usccb_resolved = True
+            return self._usccb
+    
+    def scripture_text(self, reference: str) -> str:
+        """Public domain text for a reference, fetched on first use"""
+        with self._lock:
+            if reference not in self._texts:
+                self._texts[reference] = fetch_public_scripture_text(reference, **_timeout_kwargs(self.deadline, 10))
+            return self._texts[reference]
+
+
+def _reading_references(usccb_reading: Optional[Mapping]) -> List[str]:
+    """All reading references on a parsed USCCB page"""
+    if not usccb_reading:
+        return []
+    references = []
+    for key in ('reading1', 'reading2', 'responsorialPsalm', 'gospel'):
+        reference = usccb_reading.get(key, {}).get('reference', '')
+        if reference:
+            references.append(reference)
+    return references
+
+
 def get_feast_for_date(target_date: date) -> Optional[Dict]:
     """Get feast information for a given date"""
     if not _firebase_initialized:
@@ -474,34 +1629,82 @@ def generate_id() -> str:
     return f"{int(datetime.now().timestamp() * 1000)}-{str(hash(datetime.now().isoformat()))[-9:]}"
 
 
-def seed_daily_reading(target_date: date, dry_run: bool = False, project='primary') -> Dict:
+# Fields that make up a document's content; updatedAt/createdAt are bookkeeping
+READING_FIELDS = (
+    'id', 'title', 'reference', 'usccb_link',
+    'first_reading', 'first_reading_verse', 'second_reading', 'second_reading_verse',
+    'gospel', 'gospel_verse', 'body',
+    'responsorial_psalm', 'responsorial_psalm_verse', 'responsorial_psalm_response',
+    'responsorial_psalm_response_unavailable'
+)
+CONTENT_HASH_FIELD = 'content_hash'
+# Set when the USCCB page was read and had no psalm refrain, so the date isn't refetched for it
+NO_PSALM_RESPONSE_FIELD = 'responsorial_psalm_response_unavailable'
+# Stored in place of psalm text no source had; the text is looked up again on later runs
+PSALM_TEXT_PLACEHOLDER = "[Text not available - see {reference} at USCCB]"
+
+
+def _is_psalm_placeholder(text) -> bool:
+    """Whether stored psalm text is the placeholder written when no source had it"""
+    return isinstance(text, str) and text.startswith(PSALM_TEXT_PLACEHOLDER.split("{", 1)[0])
+
+
+def reading_content_hash(data: Mapping) -> str:
+    """SHA-256 of a document's reading fields, stored with it to detect no-op writes"""
+    content = {field: data[field] for field in READING_FIELDS if field in data}
+    return hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def count_unchanged(project_results: List[Dict[str, Optional[Dict]]]) -> int:
+    """Writes skipped across all dates and projects because nothing would change"""
+    return sum(
+        1 for outcomes in project_results for result in outcomes.values()
+        if isinstance(result, dict) and result.get('reason') == 'unchanged'
+    )
+
+
+def _has_default_data(target_date: date, existing_data: Dict) -> bool:
+    """Whether a document holds incorrect default data (e.g., all dates have same gospel)"""
+    # If gospel_verse is "John 3:16" and it's not November 13, likely incorrect data
+    return existing_data.get('gospel_verse', '') == 'John 3:16' and target_date.day != 13
+
+
+def plan_daily_reading(target_date: date, existing_data: Optional[Dict], usccb_reading: Optional[Mapping],
+                       scripture_text, dry_run: bool = False) -> Dict:
     """
-    Seed responsorial psalm for a daily reading document
-    Only adds responsorial_psalm and responsorial_psalm_verse fields
-    Preserves ALL other existing data
+    Decide what to write for a date's document, without doing any I/O
+    
+    Shared by the threaded and asyncio seeding engines so both make the same
+    decisions; the caller reads the document and performs the write.
     
     Args:
         target_date: Date to seed
-        dry_run: If True, don't write to Firestore
-        project: 'primary' or 'secondary' - which Firebase project to write to
+        existing_data: Current document data, or None if the document doesn't exist
+        usccb_reading: Parsed USCCB data, or None if unavailable
+        scripture_text: Callable returning the public domain text for a reference
+        dry_run: If True, plan no writes
     
     Returns:
-        Dict with seeding results
+        Dict with 'action':
+            'write' - set 'data' on the document (merging if 'merge'), then
+                log 'messages' and return 'result'; on failure log and return
+                an error prefixed with 'error_message'
+            'done' - nothing to write; return 'result'
     """
-    db = initialize_firebase(project)
-    
     doc_id = target_date.strftime("%Y-%m-%d")
-    logger.info(f"📅 Processing {doc_id} for daily readings")
     
-    # Check if document exists
-    doc_ref = db.collection('daily_scripture').document(doc_id)
-    existing_doc = doc_ref.get()
-    
-    # Fetch USCCB data first (needed for both creating and updating)
-    usccb_reading = fetch_usccb_reading_data(target_date)
+    # A document with incorrect default data is rebuilt like a new one and
+    # overwritten in place, reusing the USCCB data already fetched
+    repair = existing_data is not None and _has_default_data(target_date, existing_data)
+    if repair:
+        if not usccb_reading:
+            logger.warning(f"⚠️  Document {doc_id} exists but USCCB data unavailable - skipping update")
+            return {'action': 'done', 'result': {'status': 'skipped', 'doc_id': doc_id, 'reason': 'usccb_unavailable'}}
+        logger.warning(f"⚠️  Document {doc_id} has incorrect default data (John 3:16) - will overwrite")
+        existing_data = None
     
     # If document doesn't exist, create it with all fields
-    if not existing_doc.exists:
+    if existing_data is None:
         # If USCCB data is unavailable, create a minimal document
         if not usccb_reading:
             logger.warning(f"⚠️  Could not fetch USCCB data for {doc_id} - creating minimal document")
@@ -523,21 +1726,24 @@ def seed_daily_reading(target_date: date, dry_run: bool = False, project='primar
                 'responsorial_psalm_verse': None,
                 'responsorial_psalm_response': None
             }
+            minimal_doc_data[CONTENT_HASH_FIELD] = reading_content_hash(minimal_doc_data)
             
             if dry_run:
                 logger.info(f"🧪 DRY RUN: Would create minimal document {doc_id} (USCCB data unavailable)")
-                return {'status': 'dry_run', 'doc_id': doc_id}
+                return {'action': 'done', 'result': {'status': 'dry_run', 'doc_id': doc_id}}
             
-            try:
-                doc_ref.set(minimal_doc_data, merge=False)
-                logger.info(f"✅ Created minimal document {doc_id} (USCCB data unavailable)")
-                return {'status': 'success', 'doc_id': doc_id, 'note': 'Created with minimal data - USCCB unavailable'}
-            except Exception as e:
-                logger.error(f"❌ Error creating minimal document {doc_id}: {str(e)}")
-                return {'status': 'error', 'doc_id': doc_id, 'error': str(e)}
+            return {
+                'action': 'write',
+                'data': minimal_doc_data,
+                'merge': False,
+                'messages': [f"✅ Created minimal document {doc_id} (USCCB data unavailable)"],
+                'result': {'status': 'success', 'doc_id': doc_id, 'note': 'Created with minimal data - USCCB unavailable'},
+                'error_message': 'Error creating minimal document'
+            }
         
         # USCCB data is available - create full document
-        logger.info(f"🆕 Document {doc_id} does not exist - creating new document with all readings")
+        if not repair:
+            logger.info(f"🆕 Document {doc_id} does not exist - creating new document with all readings")
         
         # Build complete document data
         reading1_ref = usccb_reading.get('reading1', {}).get('reference', '')
@@ -547,10 +1753,10 @@ def seed_daily_reading(target_date: date, dry_run: bool = False, project='primar
         psalm_response = usccb_reading.get('responsorialPsalm', {}).get('response', '')
         
         # Fetch scripture text for readings
-        first_reading_text = fetch_public_scripture_text(reading1_ref) if reading1_ref else ''
-        second_reading_text = fetch_public_scripture_text(reading2_ref) if reading2_ref else ''
-        gospel_text = fetch_public_scripture_text(gospel_ref) if gospel_ref else ''
-        psalm_text = fetch_public_scripture_text(psalm_ref) if psalm_ref else ''
+        first_reading_text = scripture_text(reading1_ref) if reading1_ref else ''
+        second_reading_text = scripture_text(reading2_ref) if reading2_ref else ''
+        gospel_text = scripture_text(gospel_ref) if gospel_ref else ''
+        psalm_text = scripture_text(psalm_ref) if psalm_ref else ''
         
         # Build new document
         new_doc_data = {
@@ -594,55 +1800,61 @@ def seed_daily_reading(target_date: date, dry_run: bool = False, project='primar
             new_doc_data['responsorial_psalm_verse'] = psalm_ref
             if psalm_response:
                 new_doc_data['responsorial_psalm_response'] = psalm_response
+            else:
+                new_doc_data[NO_PSALM_RESPONSE_FIELD] = True
             if psalm_text:
                 new_doc_data['responsorial_psalm'] = psalm_text
             else:
-                new_doc_data['responsorial_psalm'] = f"[Text not available - see {psalm_ref} at USCCB]"
+                new_doc_data['responsorial_psalm'] = PSALM_TEXT_PLACEHOLDER.format(reference=psalm_ref)
+        
+        new_doc_data[CONTENT_HASH_FIELD] = reading_content_hash(new_doc_data)
         
         if dry_run:
-            logger.info(f"🧪 DRY RUN: Would create document {doc_id} with all readings")
-            return {'status': 'dry_run', 'doc_id': doc_id}
+            if repair:
+                logger.info(f"🧪 DRY RUN: Would overwrite incorrect document {doc_id} with all readings")
+            else:
+                logger.info(f"🧪 DRY RUN: Would create document {doc_id} with all readings")
+            return {'action': 'done', 'result': {'status': 'dry_run', 'doc_id': doc_id}}
         
-        try:
-            doc_ref.set(new_doc_data, merge=False)  # Create new document
-            logger.info(f"✅ Created new document {doc_id} with all daily readings")
-            return {'status': 'success', 'doc_id': doc_id}
-        except Exception as e:
-            logger.error(f"❌ Error creating document {doc_id}: {str(e)}")
-            return {'status': 'error', 'doc_id': doc_id, 'error': str(e)}
+        if repair:
+            return {
+                'action': 'write',
+                'data': new_doc_data,
+                'merge': False,  # Replace every field of the incorrect document
+                'messages': [f"♻️  Overwrote incorrect document {doc_id} with all daily readings"],
+                'result': {'status': 'success', 'doc_id': doc_id},
+                'error_message': 'Error overwriting incorrect document'
+            }
+        
+        return {
+            'action': 'write',
+            'data': new_doc_data,
+            'merge': False,  # Create new document
+            'messages': [f"✅ Created new document {doc_id} with all daily readings"],
+            'result': {'status': 'success', 'doc_id': doc_id},
+            'error_message': 'Error creating document'
+        }
     
     # Document exists - check if we need to update it
-    existing_data = existing_doc.to_dict()
     
     # If USCCB data is unavailable, skip updating (document already exists)
     if not usccb_reading:
         logger.warning(f"⚠️  Document {doc_id} exists but USCCB data unavailable - skipping update")
-        return {'status': 'skipped', 'doc_id': doc_id, 'reason': 'usccb_unavailable'}
+        return {'action': 'done', 'result': {'status': 'skipped', 'doc_id': doc_id, 'reason': 'usccb_unavailable'}}
     
-    # Check if document has incorrect/default data (e.g., all dates have same gospel)
-    # If gospel_verse is "John 3:16" and it's not November 13, likely incorrect data
-    existing_gospel_verse = existing_data.get('gospel_verse', '')
-    if existing_gospel_verse == 'John 3:16' and target_date.day != 13:
-        logger.warning(f"⚠️  Document {doc_id} has incorrect default data (John 3:16) - will overwrite")
-        # Delete and recreate the document with correct data
-        try:
-            doc_ref.delete()
-            logger.info(f"🗑️  Deleted incorrect document {doc_id}, will recreate")
-            # Recursively call to create new document
-            return seed_daily_reading(target_date, dry_run, project)
-        except Exception as e:
-            logger.error(f"❌ Error deleting incorrect document {doc_id}: {str(e)}")
-            return {'status': 'error', 'doc_id': doc_id, 'error': f'Failed to delete incorrect document: {str(e)}'}
-    
-    # Check if responsorial psalm and response already exist
+    # Check if responsorial psalm and response already exist; a placeholder is
+    # retried, since the text may be available now (e.g. from the verse store)
     has_psalm = existing_data.get('responsorial_psalm')
+    if _is_psalm_placeholder(has_psalm):
+        has_psalm = None
     has_psalm_verse = existing_data.get('responsorial_psalm_verse')
-    has_psalm_response = existing_data.get('responsorial_psalm_response')
+    # A page already found to have no refrain counts as done
+    has_psalm_response = existing_data.get('responsorial_psalm_response') or existing_data.get(NO_PSALM_RESPONSE_FIELD)
     
     # Skip only if ALL three fields exist
     if has_psalm and has_psalm_verse and has_psalm_response:
         logger.info(f"⏭️  Document {doc_id} already has complete responsorial psalm - skipping")
-        return {'status': 'skipped', 'doc_id': doc_id, 'reason': 'already_exists'}
+        return {'action': 'done', 'result': {'status': 'skipped', 'doc_id': doc_id, 'reason': 'already_exists'}}
     
     # Get responsorial psalm reference and response from USCCB
     psalm_ref = usccb_reading.get('responsorialPsalm', {}).get('reference', '') if usccb_reading else ''
@@ -650,7 +1862,7 @@ def seed_daily_reading(target_date: date, dry_run: bool = False, project='primar
     
     if not psalm_ref or psalm_ref == 'TBD':
         logger.warning(f"⚠️  No responsorial psalm reference found for {doc_id}")
-        return {'status': 'skipped', 'doc_id': doc_id, 'reason': 'no_reference_found'}
+        return {'action': 'done', 'result': {'status': 'skipped', 'doc_id': doc_id, 'reason': 'no_reference_found'}}
     
     # Prepare update data - only add missing fields
     update_data = {
@@ -662,14 +1874,17 @@ def seed_daily_reading(target_date: date, dry_run: bool = False, project='primar
         update_data['responsorial_psalm_verse'] = psalm_ref
         logger.info(f"📖 Adding responsorial psalm verse: {psalm_ref}")
     
-    # Add psalm response/refrain if missing and found
+    # Add psalm response/refrain if missing and found; remember when the page has none
     if not has_psalm_response and psalm_response:
         update_data['responsorial_psalm_response'] = psalm_response
         logger.info(f"📖 Adding responsorial psalm response: {psalm_response}")
+    elif not has_psalm_response:
+        update_data[NO_PSALM_RESPONSE_FIELD] = True
+        logger.info(f"📝 No responsorial psalm response on the USCCB page for {doc_id} - not checking again")
     
     # Add psalm text if missing (try to fetch, but don't fail if unavailable)
     if not has_psalm:
-        psalm_text = fetch_public_scripture_text(psalm_ref)
+        psalm_text = scripture_text(psalm_ref)
         if psalm_text:
             update_data['responsorial_psalm'] = psalm_text
             logger.info(f"📖 Adding responsorial psalm text: {psalm_ref}")
@@ -677,30 +1892,339 @@ def seed_daily_reading(target_date: date, dry_run: bool = False, project='primar
             # For Deuterocanonical texts not available in public domain APIs
             # Still save verse and response, but leave text empty or with note
             logger.warning(f"⚠️  Could not fetch text for {psalm_ref} - Deuterocanonical or unsupported format")
-            update_data['responsorial_psalm'] = f"[Text not available - see {psalm_ref} at USCCB]"
+            update_data['responsorial_psalm'] = PSALM_TEXT_PLACEHOLDER.format(reference=psalm_ref)
             logger.info(f"📝 Added placeholder note for Deuterocanonical text: {psalm_ref}")
     
+    # Skip the write (and its updatedAt bump) when no reading field would change.
+    # Hash what the document holds now: other writers don't keep content_hash up to date
+    content_hash = reading_content_hash({**existing_data, **update_data})
+    if content_hash == reading_content_hash(existing_data):
+        logger.info(f"⏭️  Document {doc_id} would not change - skipping write")
+        return {'action': 'done', 'result': {'status': 'skipped', 'doc_id': doc_id, 'reason': 'unchanged'}}
+    update_data[CONTENT_HASH_FIELD] = content_hash
+    
     # Preserve existing fields - don't overwrite them
     if dry_run:
         logger.info(f"🧪 DRY RUN: Would update document {doc_id}")
         logger.info(f"   Existing fields preserved: {list(existing_data.keys())}")
         logger.info(f"   Fields to add/update: {list(update_data.keys())}")
-        return {'status': 'dry_run', 'doc_id': doc_id}
+        return {'action': 'done', 'result': {'status': 'dry_run', 'doc_id': doc_id}}
+    
+    return {
+        'action': 'write',
+        'data': update_data,
+        'merge': True,
+        'messages': [
+            f"✅ Updated document {doc_id} with new fields: {list(update_data.keys())}",
+            f"✅ Seeded daily reading for {doc_id}"
+        ],
+        'result': {'status': 'success', 'doc_id': doc_id},
+        'error_message': 'Error seeding'
+    }
+
+
+def read_document_states(db, doc_ids: List[str]) -> Dict[str, Optional[Dict]]:
+    """
+    Read the current state of many daily_scripture documents with get_all
     
+    One batched read per FIRESTORE_GET_ALL_CHUNK_SIZE documents replaces a
+    get() per document.
+    
+    Args:
+        db: Firestore client
+        doc_ids: Document IDs (YYYY-MM-DD)
+    
+    Returns:
+        Dict of doc_id -> document data, or None if the document doesn't exist.
+        Empty if the bulk read fails, so callers fall back to per-document reads.
+    """
+    states = {}
+    refs = [db.collection('daily_scripture').document(doc_id) for doc_id in doc_ids]
     try:
-        # Only update if there are fields to add
-        if update_data:
-            doc_ref.set(update_data, merge=True)
-            logger.info(f"✅ Updated document {doc_id} with new fields: {list(update_data.keys())}")
-        else:
-            logger.info(f"⏭️  Document {doc_id} already has all fields, skipping update")
-        logger.info(f"✅ Seeded daily reading for {doc_id}")
-        return {'status': 'success', 'doc_id': doc_id}
+        for i in range(0, len(refs), FIRESTORE_GET_ALL_CHUNK_SIZE):
+            for snapshot in db.get_all(refs[i:i + FIRESTORE_GET_ALL_CHUNK_SIZE]):
+                states[snapshot.id] = snapshot.to_dict() if snapshot.exists else None
+    except Exception as e:
+        logger.warning(f"⚠️  Bulk document read failed - reading documents one by one: {str(e)}")
+        return {}
+    return states
+
+
+# Fields seeding fills in on a document that already exists
+PATCHABLE_FIELDS = ('responsorial_psalm_verse', 'responsorial_psalm_response', 'responsorial_psalm')
+# Passages a new document can need: first reading, second reading, gospel, psalm
+PASSAGES_PER_NEW_DOCUMENT = 4
+
+
+def plan_document_delta(target_date: date, existing_data: Optional[Dict]) -> Dict:
+    """
+    Work out from a document's current state alone what seeding will do to it
+    
+    Makes the decisions of plan_daily_reading that need no USCCB data, so
+    complete documents can be skipped before any HTTP request is made.
+    
+    Args:
+        target_date: Date of the document
+        existing_data: Current document data, or None if the document doesn't exist
+    
+    Returns:
+        Dict with 'action' ('create', 'overwrite', 'patch' or 'skip') and, for
+        'patch', the 'fields' that will be filled in (when USCCB has them)
+    """
+    if existing_data is None:
+        return {'action': 'create'}
+    if _has_default_data(target_date, existing_data):
+        return {'action': 'overwrite'}
+    missing = [field for field in PATCHABLE_FIELDS if not existing_data.get(field)]
+    if _is_psalm_placeholder(existing_data.get('responsorial_psalm')):
+        missing.append('responsorial_psalm')
+    if existing_data.get(NO_PSALM_RESPONSE_FIELD) and 'responsorial_psalm_response' in missing:
+        missing.remove('responsorial_psalm_response')
+    if not missing:
+        return {'action': 'skip'}
+    return {'action': 'patch', 'fields': missing}
+
+
+def build_seed_plan(target_dates: List[date], states: Dict[str, Dict[str, Optional[Dict]]]) -> Dict:
+    """
+    Plan a run from document states read in bulk, with an estimate of its cost
+    
+    Args:
+        target_dates: Dates to seed
+        states: Per project, document states from read_document_states; a
+            document that is missing from them is planned as 'unknown'
+    
+    Returns:
+        Dict with:
+            'dates' - date -> project -> delta (see plan_document_delta)
+            'summary' - number of documents per action
+            'pending_dates' - dates with something to do in some project
+            'estimate' - upper bounds of the HTTP requests and Firestore
+                operations executing the plan takes, before caches
+    """
+    dates = {}
+    summary = {'create': 0, 'overwrite': 0, 'patch': 0, 'skip': 0, 'unknown': 0}
+    pending_dates = []
+    passages = 0
+    writes = {}
+    for target_date in target_dates:
+        doc_id = target_date.strftime('%Y-%m-%d')
+        deltas = {}
+        for project, project_states in states.items():
+            if doc_id in project_states:
+                deltas[project] = plan_document_delta(target_date, project_states[doc_id])
+            else:
+                deltas[project] = {'action': 'unknown'}
+            summary[deltas[project]['action']] += 1
+        dates[doc_id] = deltas
+        
+        actions = [delta['action'] for delta in deltas.values()]
+        if all(action == 'skip' for action in actions):
+            continue
+        pending_dates.append(doc_id)
+        for project, delta in deltas.items():
+            if delta['action'] != 'skip':
+                writes[project] = writes.get(project, 0) + 1
+        # Passages are fetched once per date and shared by the projects
+        if any(action in ('create', 'overwrite', 'unknown') for action in actions):
+            passages += PASSAGES_PER_NEW_DOCUMENT
+        elif any('responsorial_psalm' in delta.get('fields', ()) for delta in deltas.values()):
+            passages += 1
+    
+    chunks = -(-len(target_dates) // FIRESTORE_GET_ALL_CHUNK_SIZE)
+    batch_size = FIRESTORE_WRITE_BATCH_SIZE if FIRESTORE_BATCH_WRITES else 1
+    estimate = {
+        'usccb_requests': len(pending_dates),
+        'scripture_passages': passages,
+        'firestore_reads': chunks * len(states) + summary['unknown'],
+        'firestore_writes': sum(writes.values()),
+        'firestore_commits': sum(-(-count // batch_size) for count in writes.values()),
+    }
+    return {'dates': dates, 'summary': summary, 'pending_dates': pending_dates, 'estimate': estimate}
+
+
+def _skipped_outcomes(target_date: date, projects: List[str]) -> Dict[str, Optional[Dict]]:
+    """Per-project results for a date whose documents are already complete everywhere"""
+    doc_id = target_date.strftime('%Y-%m-%d')
+    logger.info(f"⏭️  Document {doc_id} already has complete responsorial psalm - skipping")
+    outcomes = {'primary': None, 'secondary': None}
+    for project in projects:
+        outcomes[project] = {'status': 'skipped', 'doc_id': doc_id, 'reason': 'already_exists'}
+    return outcomes
+
+
+def _deferred_outcomes(target_date: date, projects: List[str]) -> Dict[str, Optional[Dict]]:
+    """Per-project results for a date left for a later run because the deadline passed"""
+    doc_id = target_date.strftime('%Y-%m-%d')
+    outcomes = {'primary': None, 'secondary': None}
+    for project in projects:
+        outcomes[project] = {'status': 'deferred', 'doc_id': doc_id, 'reason': 'deadline'}
+    return outcomes
+
+
+class FirestoreWriteBatcher:
+    """
+    Collects a run's document writes and commits them in WriteBatches
+    
+    Up to FIRESTORE_WRITE_BATCH_SIZE writes share one commit RPC. A batch is
+    all-or-nothing, so when a commit fails its writes are retried one by one
+    to find the documents that really failed.
+    """
+    
+    def __init__(self, db, batch_size: Optional[int] = None):
+        self.db = db
+        self.batch_size = max(1, min(batch_size or FIRESTORE_WRITE_BATCH_SIZE, 500))
+        self.stats = {'writes': 0, 'commits': 0, 'failed': 0}
+        self._pending = []
+        self._lock = threading.Lock()
+    
+    def set(self, doc_ref, doc_id: str, data: Dict, merge: bool, messages: List[str]):
+        """Queue a write; it happens on the next flush()"""
+        with self._lock:
+            self._pending.append((doc_ref, doc_id, data, merge, messages))
+    
+    def _take_chunks(self) -> List[List[Tuple]]:
+        with self._lock:
+            pending, self._pending = self._pending, []
+        return [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+    
+    def _written(self, writes: List[Tuple]):
+        self.stats['commits'] += 1
+        self.stats['writes'] += len(writes)
+        for write in writes:
+            for message in write[4]:
+                logger.info(message)
+    
+    def _write_failed(self, doc_id: str, error: Exception, failures: Dict[str, str]):
+        logger.error(f"❌ Error writing {doc_id}: {str(error)}")
+        self.stats['failed'] += 1
+        failures[doc_id] = str(error)
+    
+    def flush(self) -> Dict[str, str]:
+        """
+        Commit every queued write
+        
+        Returns:
+            Dict of doc_id -> error for the writes that failed
+        """
+        failures = {}
+        for chunk in self._take_chunks():
+            batch = self.db.batch()
+            for doc_ref, doc_id, data, merge, messages in chunk:
+                batch.set(doc_ref, data, merge=merge)
+            try:
+                batch.commit()
+                self._written(chunk)
+                continue
+            except Exception as e:
+                logger.warning(f"⚠️  Batch commit of {len(chunk)} writes failed - retrying one by one: {str(e)}")
+            for write in chunk:
+                doc_ref, doc_id, data, merge, messages = write
+                try:
+                    doc_ref.set(data, merge=merge)
+                    self._written([write])
+                except Exception as e:
+                    self._write_failed(doc_id, e, failures)
+        return failures
+
+
+def _apply_write_failures(project_results: List[Dict[str, Optional[Dict]]], project: str,
+                          failures: Dict[str, str]):
+    """Turn the results of dates whose batched write failed into errors"""
+    for outcomes in project_results:
+        result = outcomes.get(project)
+        if isinstance(result, dict) and result.get('doc_id') in failures:
+            doc_id = result['doc_id']
+            outcomes[project] = {'status': 'error', 'doc_id': doc_id, 'error': failures[doc_id]}
+
+
+def seed_daily_reading(target_date: date, dry_run: bool = False, project='primary',
+                       resolved: Optional[ResolvedReading] = None,
+                       states: Optional[Dict[str, Optional[Dict]]] = None,
+                       writer: Optional[FirestoreWriteBatcher] = None) -> Dict:
+    """
+    Seed responsorial psalm for a daily reading document
+    Only adds responsorial_psalm and responsorial_psalm_verse fields
+    Preserves ALL other existing data
+    
+    Args:
+        target_date: Date to seed
+        dry_run: If True, don't write to Firestore
+        project: 'primary' or 'secondary' - which Firebase project to write to
+        resolved: The date's readings shared with the other projects in this run;
+            a private one is created when not provided
+        states: Document states read in bulk (see read_document_states); the
+            document is read on its own when it isn't in there
+        writer: Queue the write here instead of writing now; the result assumes
+            the write succeeds until the writer is flushed
+    
+    Returns:
+        Dict with seeding results
+    """
+    db = initialize_firebase(project)
+    
+    doc_id = target_date.strftime("%Y-%m-%d")
+    logger.info(f"📅 Processing {doc_id} for daily readings")
+    
+    # Check if document exists
+    doc_ref = db.collection('daily_scripture').document(doc_id)
+    if states is not None and doc_id in states:
+        existing_data = states[doc_id]
+    else:
+        existing_doc = doc_ref.get()
+        existing_data = existing_doc.to_dict() if existing_doc.exists else None
+    
+    # Fetch USCCB data first (needed for both creating and updating)
+    if resolved is None:
+        resolved = ResolvedReading(target_date)
+    usccb_reading = resolved.usccb
+    
+    plan = plan_daily_reading(target_date, existing_data, usccb_reading, resolved.scripture_text, dry_run)
+    
+    if plan['action'] == 'done':
+        return plan['result']
+    
+    if writer is not None:
+        writer.set(doc_ref, doc_id, plan['data'], plan['merge'], plan['messages'])
+        return plan['result']
+    
+    try:
+        doc_ref.set(plan['data'], merge=plan['merge'])
+        for message in plan['messages']:
+            logger.info(message)
+        return plan['result']
     except Exception as e:
-        logger.error(f"❌ Error seeding {doc_id}: {str(e)}")
+        logger.error(f"❌ {plan['error_message']} {doc_id}: {str(e)}")
         return {'status': 'error', 'doc_id': doc_id, 'error': str(e)}
 
 
+def _delete_documents(db, collection, doc_ids: List[str]) -> Dict[str, str]:
+    """
+    Delete documents in one WriteBatch (one delete() each without FIRESTORE_BATCH_WRITES)
+    
+    Returns:
+        Error message for each document that could not be deleted, by doc_id
+    """
+    if FIRESTORE_BATCH_WRITES:
+        batch = db.batch()
+        for doc_id in doc_ids:
+            batch.delete(collection.document(doc_id))
+        try:
+            batch.commit()
+            return {}
+        except Exception as e:
+            # Retry one by one so one bad document doesn't fail the rest
+            logger.warning(f"⚠️ Delete batch of {len(doc_ids)} failed, retrying per document: {str(e)}")
+    
+    failures = {}
+    for doc_id in doc_ids:
+        try:
+            collection.document(doc_id).delete()
+        except Exception as e:
+            failures[doc_id] = str(e)
+    return failures
+
+
 def delete_old_readings(cutoff_date: date, dry_run: bool = False, project='primary') -> Dict:
     """
     Delete readings older than the cutoff date
@@ -721,32 +2245,34 @@ def delete_old_readings(cutoff_date: date, dry_run: bool = False, project='prima
     errors = []
     
     try:
-        # Query for documents before cutoff date
-        # Document IDs are in format YYYY-MM-DD, so we can use string comparison
+        # Document IDs are in format YYYY-MM-DD, so the old ones are a key range:
+        # page through __name__ < cutoff instead of reading the whole collection
         cutoff_id = cutoff_date.strftime("%Y-%m-%d")
+        collection = db.collection('daily_scripture')
+        # IDs only - the readings themselves aren't needed to delete them
+        query = (collection.where(filter=FieldFilter('__name__', '<', collection.document(cutoff_id)))
+                 .order_by('__name__').select([]).limit(CLEANUP_PAGE_SIZE))
         
-        # Get all documents
-        docs = db.collection('daily_scripture').stream()
-        
-        for doc in docs:
-            doc_id = doc.id
-            
-            # Skip if not in date format or if >= cutoff
-            if not re.match(r'\d{4}-\d{2}-\d{2}', doc_id):
-                continue
-            
-            if doc_id < cutoff_id:
-                if dry_run:
+        page = list(query.stream())
+        while page:
+            # Skip IDs that sort below the cutoff but aren't dates
+            doc_ids = [doc.id for doc in page if re.match(r'\d{4}-\d{2}-\d{2}', doc.id)]
+            if dry_run:
+                for doc_id in doc_ids:
                     logger.info(f"🧪 DRY RUN: Would delete {doc_id} from {project}")
-                    deleted_count += 1
-                else:
-                    try:
-                        db.collection('daily_scripture').document(doc_id).delete()
+                deleted_count += len(doc_ids)
+            elif doc_ids:
+                failures = _delete_documents(db, collection, doc_ids)
+                for doc_id in doc_ids:
+                    if doc_id in failures:
+                        logger.error(f"❌ Error deleting {doc_id} from {project}: {failures[doc_id]}")
+                        errors.append({'doc_id': doc_id, 'error': failures[doc_id]})
+                    else:
                         logger.info(f"🗑️  Deleted {doc_id} from {project}")
                         deleted_count += 1
-                    except Exception as e:
-                        logger.error(f"❌ Error deleting {doc_id} from {project}: {str(e)}")
-                        errors.append({'doc_id': doc_id, 'error': str(e)})
+            if len(page) < CLEANUP_PAGE_SIZE:
+                break
+            page = list(query.start_after(page[-1]).stream())
         
         logger.info(f"✅ Deleted {deleted_count} old documents")
         return {
@@ -764,6 +2290,352 @@ def delete_old_readings(cutoff_date: date, dry_run: bool = False, project='prima
         }
 
 
+def _seed_date_projects(target_date: date, resolved: 'ResolvedReading', dry_run: bool,
+                        has_primary: bool, has_secondary: bool,
+                        states: Optional[Dict[str, Dict]] = None,
+                        writers: Optional[Dict[str, FirestoreWriteBatcher]] = None) -> Dict[str, Optional[Dict]]:
+    """
+    Seed one date to every initialized project
+    
+    Args:
+        states: Per project, document states read in bulk before seeding
+        writers: Per project, the batcher that queues this run's writes
+    
+    Returns:
+        Dict of project -> result, combined with _combine_project_results
+        once queued writes are committed
+    """
+    date_str = target_date.strftime('%Y-%m-%d')
+    logger.info(f"📅 Processing date: {date_str}")
+    states = states or {}
+    writers = writers or {}
+    
+    # Seed based on which projects are initialized
+    outcomes = {'primary': None, 'secondary': None}
+    
+    if has_primary:
+        # Seed to primary Firebase
+        outcomes['primary'] = seed_daily_reading(
+            target_date, dry_run, 'primary', resolved, states.get('primary'), writers.get('primary')
+        )
+    
+    if has_secondary:
+        # Seed to secondary Firebase
+        try:
+            result_secondary = seed_daily_reading(
+                target_date, dry_run, 'secondary', resolved, states.get('secondary'), writers.get('secondary')
+            )
+            if result_secondary['status'] != 'success':
+                logger.warning(f"⚠️ Secondary seeding failed for {date_str}: {result_secondary.get('reason', 'Unknown')}")
+        except Exception as e:
+            logger.warning(f"⚠️ Secondary seeding failed for {date_str}: {str(e)}")
+            result_secondary = {'status': 'error', 'error': str(e)}
+        outcomes['secondary'] = result_secondary
+    
+    return outcomes
+
+
+def _combine_project_results(date_str: str, result: Optional[Dict], result_secondary: Optional[Dict],
+                             has_primary: bool, has_secondary: bool, is_secondary_function: bool) -> Optional[Dict]:
+    """Pick the result that decides whether a date succeeded across projects"""
+    # Determine overall result based on which projects were seeded
+    if is_secondary_function:
+        # For secondary function, use secondary result ONLY
+        if not result_secondary:
+            logger.error(f"❌ No secondary result for {date_str} - this should not happen!")
+            result = {'status': 'error', 'error': 'Secondary seeding returned no result'}
+        else:
+            result = result_secondary
+            logger.info(f"✅ Secondary seeding result for {date_str}: {result.get('status', 'unknown')}")
+    elif has_primary and has_secondary:
+        # For primary function with both, consider it success if either succeeds
+        if result and result['status'] == 'success':
+            pass  # Use primary result
+        elif result_secondary and result_secondary['status'] == 'success':
+            result = result_secondary  # Use secondary result if primary failed
+        elif result:
+            pass  # Use primary result even if it failed
+        else:
+            result = result_secondary if result_secondary else {'status': 'error', 'error': 'No result'}
+    
+    return result
+
+
+def _seed_dates_threaded(target_dates: List[date], dry_run: bool, has_primary: bool, has_secondary: bool,
+                         is_secondary_function: bool,
+                         deadline: Optional[Deadline] = None) -> Tuple[List[Optional[Dict]], Dict]:
+    """
+    Seed dates with the threaded engine: prefetch, batch scripture, then a worker pool
+    
+    Args:
+        deadline: Run deadline; dates not started before it are deferred.
+            Dates are started in the order given.
+    
+    Returns:
+        tuple: (per-date results in date order, report fields for the response)
+    """
+    report = {}
+    
+    # Read every document in the range up front - one get_all per chunk and project
+    doc_ids = [target_date.strftime('%Y-%m-%d') for target_date in target_dates]
+    projects = (['primary'] if has_primary else []) + (['secondary'] if has_secondary else [])
+    states = {project: read_document_states(initialize_firebase(project), doc_ids) for project in projects}
+    report['state_reads'] = {
+        project: {'documents': len(doc_ids), 'loaded': len(states[project])} for project in projects
+    }
+    
+    # Only dates with something to do in some project are fetched and seeded
+    plan = build_seed_plan(target_dates, states)
+    report['plan'] = {'summary': plan['summary'], 'estimate': plan['estimate']}
+    pending = set(plan['pending_dates'])
+    seed_dates = [target_date for target_date in target_dates if target_date.strftime('%Y-%m-%d') in pending]
+    
+    # Prefetch all USCCB pages concurrently before seeding starts
+    prefetched = {}
+    if USCCB_PREFETCH and len(seed_dates) > 1:
+        prefetched, report['prefetch'] = prefetch_usccb_readings(seed_dates, deadline=deadline)
+    
+    # Fetch every reading in the range with a few batched requests
+    scripture_texts = {}
+    if SCRIPTURE_BATCH and prefetched:
+        references = [ref for reading in prefetched.values() for ref in _reading_references(reading)]
+        scripture_texts = fetch_public_scripture_texts(references, deadline)
+    
+    # Writes are queued during seeding and committed in batches afterwards
+    writers = {}
+    if FIRESTORE_BATCH_WRITES and not dry_run:
+        writers = {project: FirestoreWriteBatcher(initialize_firebase(project)) for project in projects}
+    
+    # Seed readings for the specified date range, several dates at a time;
+    # results are collected back in date order
+    def seed_date(target_date):
+        if target_date.strftime('%Y-%m-%d') not in pending:
+            return _skipped_outcomes(target_date, projects)
+        if deadline is not None and deadline.expired():
+            return _deferred_outcomes(target_date, projects)
+        # Readings are resolved once and shared by every project
+        resolved = ResolvedReading(target_date, prefetched.get(target_date), scripture_texts, deadline)
+        return _seed_date_projects(target_date, resolved, dry_run, has_primary, has_secondary, states, writers)
+    
+    workers = max(1, min(SEED_WORKERS, len(seed_dates) or 1))
+    report['seed_workers'] = workers
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        project_results = list(executor.map(seed_date, target_dates))
+    
+    if writers:
+        for project, writer in writers.items():
+            _apply_write_failures(project_results, project, writer.flush())
+        report['writes'] = {project: writer.stats for project, writer in writers.items()}
+    report['writes_avoided'] = count_unchanged(project_results)
+    
+    return [
+        _combine_project_results(
+            target_date.strftime('%Y-%m-%d'), outcomes['primary'], outcomes['secondary'],
+            has_primary, has_secondary, is_secondary_function
+        )
+        for target_date, outcomes in zip(target_dates, project_results)
+    ], report
+
+
+# Engine report fields that describe a chunk's setup rather than count its work
+ENGINE_REPORT_SETTINGS = ('seed_workers', 'workers')
+
+
+def _merge_engine_report(results: Dict, report: Dict):
+    """
+    Add one chunk's engine report to the run's totals in the response
+    
+    Counters (nested ones included) are summed across chunks; settings keep
+    their largest value.
+    """
+    for field, value in report.items():
+        current = results.get(field)
+        if isinstance(value, dict):
+            _merge_engine_report(results.setdefault(field, {}), value)
+        elif isinstance(value, (int, float)) and isinstance(current, (int, float)):
+            total = max(current, value) if field in ENGINE_REPORT_SETTINGS else current + value
+            results[field] = round(total, 3) if isinstance(total, float) else total
+        else:
+            results[field] = value
+
+
+def _open_async_engine():
+    """The asyncio engine's event loop and clients for this invocation, if SEEDER_ENGINE=async"""
+    if SEEDER_ENGINE != 'async':
+        return None
+    # Imported here: async_seeder builds on this module
+    import async_seeder
+    return async_seeder.AsyncEngine()
+
+
+def _seed_date_range(target_dates: List[date], dry_run: bool, has_primary: bool, has_secondary: bool,
+                     is_secondary_function: bool, results: Dict,
+                     deadline: Optional[Deadline] = None, async_engine=None) -> List[Optional[Dict]]:
+    """
+    Seed dates with the engine picked by SEEDER_ENGINE
+    
+    Args:
+        results: Response body; the engine adds its report fields to it
+        deadline: Run deadline; dates not started before it come back 'deferred'
+        async_engine: The invocation's async_seeder.AsyncEngine, shared by its
+            chunks (one is opened and closed for these dates when not given)
+    
+    Returns:
+        Per-date results in date order
+    """
+    if SEEDER_ENGINE == 'async':
+        results['engine'] = 'async'
+        engine_report = {}
+        engine = async_engine or _open_async_engine()
+        try:
+            date_results = engine.seed_dates(
+                target_dates, dry_run, has_primary, has_secondary, is_secondary_function, report=engine_report,
+                deadline=deadline
+            )
+        finally:
+            if async_engine is None:
+                engine.close()
+    else:
+        results['engine'] = 'threads'
+        date_results, engine_report = _seed_dates_threaded(
+            target_dates, dry_run, has_primary, has_secondary, is_secondary_function, deadline
+        )
+    # A run seeds its range in chunks; the response reports the whole run
+    _merge_engine_report(results, engine_report)
+    return date_results
+
+
+def _record_date_results(results: Dict, target_dates: List[date], date_results: List[Optional[Dict]]):
+    """Add each date's outcome to the response's successful / errors / processed_dates lists"""
+    for target_date, result in zip(target_dates, date_results):
+        date_str = target_date.strftime('%Y-%m-%d')
+        
+        if result and result['status'] == 'success':
+            results['successful'].append(date_str)
+            logger.info(f"✅ Successfully seeded {date_str}")
+        elif result and result['status'] == 'dry_run':
+            results['successful'].append(date_str)
+            logger.info(f"🧪 Dry run completed for {date_str}")
+        elif result and result['status'] == 'skipped':
+            # Skipped is okay - document doesn't exist or already has data
+            logger.info(f"⏭️  Skipped {date_str}: {result.get('reason', 'Unknown reason')}")
+        elif result and result['status'] == 'deferred':
+            # Not processed - a later run (or the same run_id) picks it up
+            results['deferred'].append(date_str)
+            continue
+        else:
+            error_msg = result.get('error', result.get('reason', 'Unknown error')) if result else 'No result from seeding'
+            results['errors'].append({
+                'date': date_str,
+                'error': error_msg
+            })
+            logger.error(f"❌ Failed to seed {date_str}: {error_msg}")
+        
+        results['processed_dates'].append(date_str)
+
+
+def _sort_date_lists(results: Dict):
+    """Report in date order, whatever order the dates were seeded in"""
+    for field in ('processed_dates', 'successful', 'deferred'):
+        results[field].sort()
+    results['errors'].sort(key=lambda error: error['date'])
+
+
+def _finish_results(results: Dict, usccb_cache_before: Dict, scripture_cache_before: Dict):
+    """Put the response's date lists in date order and add the run's cache and write stats"""
+    _sort_date_lists(results)
+    if results['deferred']:
+        logger.warning(
+            f"⏳ Deadline reached - deferred {len(results['deferred'])} dates "
+            f"({results['deferred'][0]} to {results['deferred'][-1]}) to a later run"
+        )
+    
+    with _usccb_cache_lock:
+        results['usccb_cache'] = {
+            key: _usccb_cache_stats[key] - usccb_cache_before[key] for key in _usccb_cache_stats
+        }
+    
+    scripture_cache_after = _scripture_cache.snapshot()
+    results['scripture_cache'] = {
+        key: scripture_cache_after[key] - scripture_cache_before[key] for key in scripture_cache_after
+    }
+    results['scripture_cache']['api_calls_avoided'] = (
+        results['scripture_cache']['memory_hits'] + results['scripture_cache']['disk_hits']
+    )
+    if results['scripture_cache']['suppressed']:
+        logger.info(
+            f"⏭️  Suppressed {results['scripture_cache']['suppressed']} bible-api.com calls "
+            f"for passages known to be unavailable"
+        )
+    if results.get('writes_avoided'):
+        logger.info(f"⏭️  Avoided {results['writes_avoided']} writes to documents whose content would not change")
+    for project, writes in results.get('writes', {}).items():
+        logger.info(
+            f"📝 {project}: {writes['writes']} documents written in {writes['commits']} commits"
+            f" ({writes['failed']} failed)"
+        )
+
+
+def _ndjson_line(record: Dict) -> str:
+    return json.dumps(record, separators=(',', ':'), default=str) + '\n'
+
+
+def _ndjson_response(date_outcomes, results: Dict, usccb_cache_before: Dict, scripture_cache_before: Dict,
+                     keep_lists: bool = False):
+    """
+    Stream a run as NDJSON: one line per date as its chunk is committed, then a summary line
+    
+    Date lists are turned into counts as they stream, so memory stays flat
+    however long the range is (a run_id run keeps them for its checkpoints).
+    
+    Args:
+        date_outcomes: Iterator of (date, result) that seeds the range as it is consumed
+        results: Response body the run fills in; becomes the summary line
+        keep_lists: Keep the full date lists in the summary
+    """
+    from flask import Response
+    
+    list_fields = ('processed_dates', 'successful', 'errors', 'deferred')
+    counts = {field: 0 for field in list_fields}
+    
+    def lines():
+        try:
+            for target_date, result in date_outcomes:
+                record = {'date': target_date.strftime('%Y-%m-%d'), 'status': result['status'] if result else 'error'}
+                for key in ('reason', 'error', 'note'):
+                    if result and result.get(key):
+                        record[key] = result[key]
+                yield _ndjson_line(record)
+                if not keep_lists:
+                    for field in list_fields:
+                        counts[field] += len(results[field])
+                        results[field].clear()
+            _finish_results(results, usccb_cache_before, scripture_cache_before)
+            summary = {'type': 'summary', **results}
+            if not keep_lists:
+                summary.update({f"{field}_count": count for field, count in counts.items()})
+                for field in list_fields:
+                    del summary[field]
+            logger.info("✅ Daily readings seeding completed")
+            logger.info(f"Results: {json.dumps(summary, separators=(',', ':'), default=str)}")
+            yield _ndjson_line(summary)
+        except Exception as e:
+            logger.error(f"❌ Fatal error in daily readings seeder: {str(e)}", exc_info=True)
+            yield _ndjson_line({'type': 'summary', 'status': 'error', 'message': str(e)})
+    
+    return Response(lines(), status=200, mimetype='application/x-ndjson')
+
+
+def _release_leases(held_leases: List):
+    """Release the leases an invocation holds (each release callable runs once)"""
+    while held_leases:
+        release = held_leases.pop()
+        try:
+            release()
+        except Exception as e:
+            logger.warning(f"⚠️ Could not release a lease: {str(e)}")
+
+
 def seed_daily_readings_cron(request):
     """
     Cloud Function entry point for seeding daily readings
@@ -774,8 +2646,15 @@ def seed_daily_readings_cron(request):
         request: Flask request object (from Functions Framework)
     
     Returns:
-        tuple: (response dict, status code)
+        tuple: (response dict, status code), or a streaming NDJSON
+        Response for ?format=ndjson (see _ndjson_response)
     """
+    # The clock starts now: cleanup and state reads count against the timeout too
+    deadline = Deadline(FUNCTION_TIMEOUT_SECONDS - DEADLINE_RESERVE_SECONDS)
+    # Releases for the leases taken below, run however the invocation ends
+    # (a streamed response releases them once it has been sent instead)
+    held_leases = []
+    streaming = False
     try:
         logger.info("🚀 Starting Daily Readings Seeder cron job")
         logger.info(f"Request method: {request.method}")
@@ -857,16 +2736,28 @@ def seed_daily_readings_cron(request):
         cutoff_date = date(cutoff_year, cutoff_month, 1)
         
         dry_run = os.environ.get('DRY_RUN', '').lower() == 'true'
+        # ?mode=plan previews the run: read state, report the plan, change nothing
+        plan_only = request.args.get('mode') == 'plan'
+        # ?format=ndjson streams one line per date instead of one response at the end
+        stream = request.args.get('format') == 'ndjson'
+        # ?mode=coordinate fans the range out to shard invocations (see shard_coordinator.py);
+        # a shard is an invocation made by a coordinator, with ?shard_of=<its run ID>
+        coordinate = request.args.get('mode') == 'coordinate'
+        shard_of = request.args.get('shard_of')
         
         # Clean up old readings based on which projects are initialized
         cleanup_result_primary = None
         cleanup_result_secondary = None
         
-        if has_primary:
+        if plan_only:
+            logger.info("📋 Plan mode - skipping cleanup")
+        elif shard_of:
+            logger.info(f"🧩 Shard of run {shard_of} - cleanup is left to the coordinator")
+        elif has_primary:
             logger.info(f"🗑️  Cleaning up readings older than {cutoff_date} from primary")
             cleanup_result_primary = delete_old_readings(cutoff_date, dry_run, 'primary')
         
-        if has_secondary:
+        if has_secondary and not plan_only and not shard_of:
             try:
                 logger.info(f"🗑️  Cleaning up readings older than {cutoff_date} from secondary")
                 cleanup_result_secondary = delete_old_readings(cutoff_date, dry_run, 'secondary')
@@ -881,6 +2772,22 @@ def seed_daily_readings_cron(request):
         start_date_param = request.args.get('start_date')
         end_date_param = request.args.get('end_date')
         
+        # Rolling schedule: seed today onwards instead of next month (a custom range wins)
+        schedule = (request.args.get('schedule') or SEED_SCHEDULE).lower()
+        rolling = schedule == 'rolling' and not (start_date_param or end_date_param)
+        horizon_days = SEED_HORIZON_DAYS
+        if rolling and request.args.get('horizon_days'):
+            try:
+                horizon_days = int(request.args.get('horizon_days'))
+                if horizon_days < 1:
+                    raise ValueError(horizon_days)
+            except ValueError:
+                logger.error(f"❌ Invalid horizon_days: {request.args.get('horizon_days')}")
+                return {
+                    'statusCode': 400,
+                    'body': {'status': 'error', 'message': 'Invalid horizon_days. Use a positive number of days'}
+                }, 400
+        
         if start_date_param:
             # Parse custom start date
             try:
@@ -892,6 +2799,9 @@ def seed_daily_readings_cron(request):
                     'statusCode': 400,
                     'body': {'status': 'error', 'message': 'Invalid start_date format. Use YYYY-MM-DD'}
                 }, 400
+        elif rolling:
+            # Rolling horizon starts today
+            start_date = today
         else:
             # Calculate next month (default behavior)
             if today.month == 12:
@@ -916,6 +2826,8 @@ def seed_daily_readings_cron(request):
                     'statusCode': 400,
                     'body': {'status': 'error', 'message': 'Invalid end_date format. Use YYYY-MM-DD'}
                 }, 400
+        elif rolling:
+            days_to_seed = horizon_days
         else:
             # Default: Seed days 1-30 of the target month
             target_month = start_date.month
@@ -929,6 +2841,8 @@ def seed_daily_readings_cron(request):
         
         if start_date_param or end_date_param:
             logger.info(f"📅 Seeding custom date range: {start_date} to {start_date + timedelta(days=days_to_seed-1)}")
+        elif rolling:
+            logger.info(f"📅 Seeding rolling horizon: the next {days_to_seed} days from {start_date}")
         else:
             logger.info(f"📅 Seeding days 1-30 of next month: {start_date.strftime('%B %Y')}")
         
@@ -947,9 +2861,11 @@ def seed_daily_readings_cron(request):
             'start_date': start_date.isoformat(),
             'target_month': f"{target_year}-{target_month:02d}",
             'days_to_seed': days_to_seed,
+            'schedule': 'rolling' if rolling else 'monthly',
             'processed_dates': [],
             'successful': [],
             'errors': [],
+            'deferred': [],
             'firebase_projects': firebase_projects,
             'cleanup': {}
         }
@@ -969,7 +2885,8 @@ def seed_daily_readings_cron(request):
                 'errors': cleanup_result_secondary.get('errors', [])
             }
         
-        # Seed readings for the specified date range
+        # Work out the dates to seed for the specified date range
+        target_dates = []
         for i in range(days_to_seed):
             target_date = start_date + timedelta(days=i)
             
@@ -979,72 +2896,180 @@ def seed_daily_readings_cron(request):
                 break
             
             # Skip if we've gone past the end of the month (for default behavior with months < 30 days)
-            if not end_date_param and target_date.month != target_month:
+            if not end_date_param and not rolling and target_date.month != target_month:
                 logger.info(f"⏭️  Skipping {target_date.strftime('%Y-%m-%d')} - past end of target month")
                 break
             
-            date_str = target_date.strftime('%Y-%m-%d')
-            logger.info(f"📅 Processing date: {date_str}")
-            
-            # Seed based on which projects are initialized
-            result = None
-            result_secondary = None
-            
-            if has_primary:
-                # Seed to primary Firebase
-                result = seed_daily_reading(target_date, dry_run, 'primary')
-            
-            if has_secondary:
-                # Seed to secondary Firebase
-                try:
-                    result_secondary = seed_daily_reading(target_date, dry_run, 'secondary')
-                    if result_secondary['status'] != 'success':
-                        logger.warning(f"⚠️ Secondary seeding failed for {date_str}: {result_secondary.get('reason', 'Unknown')}")
-                except Exception as e:
-                    logger.warning(f"⚠️ Secondary seeding failed for {date_str}: {str(e)}")
-                    result_secondary = {'status': 'error', 'error': str(e)}
-            
-            # Determine overall result based on which projects were seeded
-            if is_secondary_function:
-                # For secondary function, use secondary result ONLY
-                if not result_secondary:
-                    logger.error(f"❌ No secondary result for {date_str} - this should not happen!")
-                    result = {'status': 'error', 'error': 'Secondary seeding returned no result'}
-                else:
-                    result = result_secondary
-                    logger.info(f"✅ Secondary seeding result for {date_str}: {result.get('status', 'unknown')}")
-            elif has_primary and has_secondary:
-                # For primary function with both, consider it success if either succeeds
-                if result and result['status'] == 'success':
-                    pass  # Use primary result
-                elif result_secondary and result_secondary['status'] == 'success':
-                    result = result_secondary  # Use secondary result if primary failed
-                elif result:
-                    pass  # Use primary result even if it failed
-                else:
-                    result = result_secondary if result_secondary else {'status': 'error', 'error': 'No result'}
-            
-            if result and result['status'] == 'success':
-                results['successful'].append(date_str)
-                logger.info(f"✅ Successfully seeded {date_str}")
-            elif result and result['status'] == 'dry_run':
-                results['successful'].append(date_str)
-                logger.info(f"🧪 Dry run completed for {date_str}")
-            elif result and result['status'] == 'skipped':
-                # Skipped is okay - document doesn't exist or already has data
-                logger.info(f"⏭️  Skipped {date_str}: {result.get('reason', 'Unknown reason')}")
-            else:
-                error_msg = result.get('error', result.get('reason', 'Unknown error')) if result else 'No result from seeding'
-                results['errors'].append({
-                    'date': date_str,
-                    'error': error_msg
-                })
-                logger.error(f"❌ Failed to seed {date_str}: {error_msg}")
-            
-            results['processed_dates'].append(date_str)
+            target_dates.append(target_date)
+        
+        if plan_only:
+            doc_ids = [target_date.strftime('%Y-%m-%d') for target_date in target_dates]
+            states = {
+                project: read_document_states(initialize_firebase(project), doc_ids) for project in firebase_projects
+            }
+            results['mode'] = 'plan'
+            results['plan'] = build_seed_plan(target_dates, states)
+            summary = results['plan']['summary']
+            logger.info(
+                f"📋 Plan: {summary['create']} create, {summary['overwrite']} overwrite, {summary['patch']} patch, "
+                f"{summary['skip']} skip, {summary['unknown']} unknown - estimate {results['plan']['estimate']}"
+            )
+            return {'statusCode': 200, 'body': results}, 200
+        
+        if coordinate:
+            coordinator_run_id = request.args.get('run_id') or (
+                f"coord-{target_dates[0].isoformat()}-{target_dates[-1].isoformat()}" if target_dates else 'coord-empty'
+            )
+            if not run_state.valid_run_id(coordinator_run_id):
+                return {
+                    'statusCode': 400,
+                    'body': {'status': 'error', 'message': 'Invalid run_id. Use letters, digits, ".", "_" or "-"'}
+                }, 400
+            results['mode'] = 'coordinate'
+            shard_coordinator.coordinate(
+                shard_coordinator.SEEDER_FUNCTION_URL or request.base_url, target_dates, coordinator_run_id,
+                results, deadline
+            )
+            _sort_date_lists(results)
+            logger.info(f"Results: {json.dumps(results, separators=(',', ':'), default=str)}")
+            return {'statusCode': 200, 'body': results}, 200
+        
+        with _usccb_cache_lock:
+            usccb_cache_before = dict(_usccb_cache_stats)
+        scripture_cache_before = _scripture_cache.snapshot()
+        
+        # ?run_id=... checkpoints progress so a run cut off by the timeout can resume
+        run_id = request.args.get('run_id')
+        checkpoints = None
+        if shard_of and not run_id:
+            return {
+                'statusCode': 400,
+                'body': {'status': 'error', 'message': 'A shard needs a run_id'}
+            }, 400
+        if run_id:
+            if not run_state.valid_run_id(run_id):
+                return {
+                    'statusCode': 400,
+                    'body': {'status': 'error', 'message': 'Invalid run_id. Use letters, digits, ".", "_" or "-"'}
+                }, 400
+            checkpoints = run_state.checkpoint_store(
+                initialize_firebase('secondary' if is_secondary_function else 'primary')
+            )
+            checkpoint = checkpoints.load(run_id)
+            if checkpoint and (checkpoint['start_date'], checkpoint['days_to_seed']) != (
+                    results['start_date'], results['days_to_seed']):
+                logger.error(f"❌ Run {run_id} was started for a different date range")
+                return {
+                    'statusCode': 409,
+                    'body': {'status': 'error', 'message': f'run_id {run_id} was started for a different date range'}
+                }, 409
+            if checkpoint:
+                results.update(run_state.resumed_results(checkpoint))
+                target_dates = run_state.remaining_dates(target_dates, checkpoint)
+                logger.info(
+                    f"♻️  Resuming run {run_id}: {len(results['processed_dates'])} dates done, "
+                    f"{len(target_dates)} left"
+                )
+            results['run_id'] = run_id
+            results['resumed'] = checkpoint is not None
+        
+        # A shard holds a lease on its run ID for as long as an invocation can live,
+        # so a retried or duplicated shard request doesn't seed the same dates twice
+        leases = lease_key = None
+        lease_holder = uuid.uuid4().hex
+        if shard_of:
+            leases = run_state.lease_store(initialize_firebase('secondary' if is_secondary_function else 'primary'))
+            lease_key = shard_coordinator.shard_lease_key(run_id)
+            if not leases.acquire(lease_key, lease_holder, FUNCTION_TIMEOUT_SECONDS, {'shard_of': shard_of}):
+                logger.warning(f"🔒 Shard {run_id} is already being seeded by another invocation")
+                return {
+                    'statusCode': 409,
+                    'body': {'status': 'leased', 'message': f'Shard {run_id} is already being seeded'}
+                }, 409
+            held_leases.append(lambda: leases.release(lease_key, lease_holder))
+            results['shard_of'] = shard_of
+        
+        # Runs lease their range in each project they seed, so a run overlapping another
+        # (a scheduler retry, a trigger script, the secondary deployment) doesn't repeat its work
+        run_lease = None
+        if run_state.RUN_LEASES and not dry_run and target_dates:
+            lease_policy = (request.args.get('on_conflict') or run_state.RUN_LEASE_POLICY).lower()
+            run_lease = run_state.RunLease(
+                {project: run_state.lease_store(initialize_firebase(project)) for project in firebase_projects},
+                min(target_dates), max(target_dates), lease_holder, details={'run_id': run_id}
+            )
+            held_leases.append(run_lease.release)
+            run_lease.acquire()
+            # Renewed from now on, so a run that waits keeps its place ahead of later runs
+            run_lease.start_heartbeat()
+            covered = run_lease.covered(target_dates)
+            while covered and lease_policy == 'wait' and not deadline.expired():
+                logger.info(f"⏳ Waiting for {len(covered)} dates leased by another run")
+                time.sleep(max(0, min(run_state.RUN_LEASE_POLL_SECONDS, deadline.remaining())))
+                run_lease.acquire()
+                covered = run_lease.covered(target_dates)
+            if covered:
+                results['coalesced_with'] = sorted(run_lease.competitors())
+                if lease_policy == 'coalesce' or len(covered) == len(target_dates):
+                    results['status'] = 'coalesced'
+                    logger.info(f"🤝 Range already being seeded by {', '.join(results['coalesced_with'])} - nothing to do")
+                    return {'statusCode': 200, 'body': results}, 200
+                covered = set(covered)
+                target_dates = [target_date for target_date in target_dates if target_date not in covered]
+                results['coalesced_dates'] = sorted(target_date.strftime('%Y-%m-%d') for target_date in covered)
+                logger.info(
+                    f"🤝 Leaving {len(covered)} dates to {', '.join(results['coalesced_with'])}, "
+                    f"seeding the other {len(target_dates)}"
+                )
+        
+        # Nearest dates first, so the ones a timeout would cost are the least urgent.
+        # Without a run ID (or streaming) the whole range is one chunk
+        target_dates = prioritize_dates(target_dates, today)
+        chunked = run_id or stream
+        chunk_days = max(1, run_state.SEED_CHECKPOINT_DAYS) if chunked else max(1, len(target_dates))
+        
+        def seed_chunks():
+            """Seed the range chunk by chunk, yielding (date, result) once each chunk is committed"""
+            async_engine = None
+            try:
+                async_engine = _open_async_engine()
+                for i in range(0, len(target_dates), chunk_days):
+                    chunk = target_dates[i:i + chunk_days]
+                    if deadline.expired():
+                        for target_date in target_dates[i:]:
+                            results['deferred'].append(target_date.strftime('%Y-%m-%d'))
+                            yield target_date, {'status': 'deferred', 'reason': 'deadline'}
+                        break
+                    date_results = _seed_date_range(
+                        chunk, dry_run, has_primary, has_secondary, is_secondary_function, results, deadline,
+                        async_engine
+                    )
+                    _record_date_results(results, chunk, date_results)
+                    if checkpoints is not None:
+                        checkpoints.save(run_id, run_state.new_checkpoint(run_id, results, complete=False))
+                        logger.info(f"💾 Checkpointed run {run_id} ({len(results['processed_dates'])} dates done)")
+                    yield from zip(chunk, date_results)
+                if checkpoints is not None and not results['deferred']:
+                    checkpoints.save(run_id, run_state.new_checkpoint(run_id, results, complete=True))
+            finally:
+                if async_engine is not None:
+                    async_engine.close()
+                _release_leases(held_leases)
+        
+        if stream:
+            response = _ndjson_response(seed_chunks(), results, usccb_cache_before, scripture_cache_before,
+                                        keep_lists=checkpoints is not None)
+            # Covers a response closed before the generator ever ran
+            response.call_on_close(lambda: _release_leases(held_leases))
+            streaming = True
+            return response
+        
+        for _ in seed_chunks():
+            pass
+        _finish_results(results, usccb_cache_before, scripture_cache_before)
         
         logger.info("✅ Daily readings seeding completed")
-        logger.info(f"Results: {json.dumps(results, indent=2, default=str)}")
+        logger.info(f"Results: {json.dumps(results, separators=(',', ':'), default=str)}")
         
         return {
             'statusCode': 200,
@@ -1060,6 +3085,9 @@ def seed_daily_readings_cron(request):
                 'message': str(e)
             }
         }, 500
+    finally:
+        if not streaming:
+            _release_leases(held_leases)
 
 
 if __name__ == '__main__':
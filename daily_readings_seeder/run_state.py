@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+Run State
+Checkpoints that let a long seeding run resume where the last invocation stopped,
+and leases that keep two invocations from working on the same thing at once.
+
+A run started with ?run_id=... saves its progress after every committed chunk
+of dates. Invoking the function again with the same run ID skips the dates
+that are already done, so backfills longer than the function timeout finish
+across several invocations. Checkpoints live in a Firestore document
+(seeder_runs/{run_id}) on Cloud Functions and in a JSON file when run locally.
+
+Leases are documents in seeder_leases/{key} naming their holder and when they
+expire; locally they are kept in memory.
+"""
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional
+
+from google.cloud import firestore as gcloud_firestore
+from google.cloud.firestore_v1.base_query import FieldFilter
+
+logger = logging.getLogger(__name__)
+
+# Where checkpoints are kept: 'firestore' or 'file' (default: firestore on
+# Cloud Functions, where K_SERVICE is set, and file everywhere else)
+SEED_CHECKPOINT_STORE = os.environ.get(
+    'SEED_CHECKPOINT_STORE', 'firestore' if os.environ.get('K_SERVICE') else 'file'
+).lower()
+SEED_CHECKPOINT_DIR = os.environ.get('SEED_CHECKPOINT_DIR', os.path.join(tempfile.gettempdir(), 'seeder_runs'))
+SEED_RUNS_COLLECTION = os.environ.get('SEED_RUNS_COLLECTION', 'seeder_runs')
+# Dates seeded and committed between two checkpoints
+SEED_CHECKPOINT_DAYS = int(os.environ.get('SEED_CHECKPOINT_DAYS', '14'))
+
+SEED_LEASES_COLLECTION = os.environ.get('SEED_LEASES_COLLECTION', 'seeder_leases')
+# Seeding runs lease their date range in every project they seed
+RUN_LEASES = os.environ.get('RUN_LEASES', 'true').lower() == 'true'
+# How long a run lease lives without a heartbeat (renewed every third of it)
+RUN_LEASE_TTL_SECONDS = float(os.environ.get('RUN_LEASE_TTL_SECONDS', '120'))
+# What a run does about dates another run has leased: 'split' (seed only the
+# rest), 'wait' (until they are free or the deadline) or 'coalesce' (exit at once)
+RUN_LEASE_POLICY = os.environ.get('RUN_LEASE_POLICY', 'split').lower()
+RUN_LEASE_POLL_SECONDS = float(os.environ.get('RUN_LEASE_POLL_SECONDS', '5'))
+
+# Response fields a checkpoint records
+CHECKPOINT_FIELDS = ('processed_dates', 'successful', 'errors')
+
+
+def valid_run_id(run_id: str) -> bool:
+    """Run IDs become document IDs and file names, so keep them simple"""
+    return bool(re.fullmatch(r'[A-Za-z0-9_.-]{1,128}', run_id)) and run_id not in ('.', '..')
+
+
+def new_checkpoint(run_id: str, results: Dict, complete: bool) -> Dict:
+    """
+    Checkpoint for a run from its response so far
+
+    Args:
+        run_id: The run's ID
+        results: The cron response body being built
+        complete: Whether every date of the range has been processed; a run
+            with errors stays 'running' so its failed dates are retried
+    """
+    checkpoint = {
+        'run_id': run_id,
+        'start_date': results['start_date'],
+        'days_to_seed': results['days_to_seed'],
+        'status': 'complete' if complete and not results['errors'] else 'running',
+        'updated_at': datetime.now(timezone.utc).isoformat(),
+    }
+    for field in CHECKPOINT_FIELDS:
+        checkpoint[field] = list(results[field])
+    return checkpoint
+
+
+class FileCheckpointStore:
+    """Checkpoints as JSON files, one per run"""
+
+    def __init__(self, directory: str = None):
+        self.directory = directory or SEED_CHECKPOINT_DIR
+
+    def _path(self, run_id: str) -> str:
+        return os.path.join(self.directory, f"{run_id}.json")
+
+    def load(self, run_id: str) -> Optional[Dict]:
+        try:
+            with open(self._path(run_id)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def save(self, run_id: str, checkpoint: Dict):
+        os.makedirs(self.directory, exist_ok=True)
+        # Write then rename so a killed invocation never leaves half a checkpoint
+        temp_path = f"{self._path(run_id)}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(checkpoint, f)
+        os.replace(temp_path, self._path(run_id))
+
+
+class FirestoreCheckpointStore:
+    """Checkpoints as documents in the SEED_RUNS_COLLECTION collection"""
+
+    def __init__(self, db, collection: str = None):
+        self.db = db
+        self.collection = collection or SEED_RUNS_COLLECTION
+
+    def load(self, run_id: str) -> Optional[Dict]:
+        snapshot = self.db.collection(self.collection).document(run_id).get()
+        return snapshot.to_dict() if snapshot.exists else None
+
+    def save(self, run_id: str, checkpoint: Dict):
+        self.db.collection(self.collection).document(run_id).set(checkpoint)
+
+
+def checkpoint_store(db=None):
+    """
+    Checkpoint store picked by SEED_CHECKPOINT_STORE
+
+    Args:
+        db: Firestore client of the project that keeps the run state
+    """
+    if SEED_CHECKPOINT_STORE == 'firestore':
+        return FirestoreCheckpointStore(db)
+    return FileCheckpointStore()
+
+
+def _failed_dates(checkpoint: Dict) -> set:
+    return {error['date'] for error in checkpoint.get('errors', [])}
+
+
+def resumed_results(checkpoint: Dict) -> Dict:
+    """
+    Response fields a resumed run starts from
+
+    Dates that failed are seeded again, so they are dropped from the
+    processed dates and their errors aren't carried over.
+    """
+    failed = _failed_dates(checkpoint)
+    return {
+        'processed_dates': [date_str for date_str in checkpoint['processed_dates'] if date_str not in failed],
+        'successful': list(checkpoint['successful']),
+        'errors': [],
+    }
+
+
+def remaining_dates(target_dates: List, checkpoint: Optional[Dict]) -> List:
+    """Dates of the range that the checkpoint doesn't record as processed without error"""
+    if not checkpoint:
+        return list(target_dates)
+    done = set(checkpoint.get('processed_dates', [])) - _failed_dates(checkpoint)
+    return [target_date for target_date in target_dates if target_date.strftime('%Y-%m-%d') not in done]
+
+
+def _lease_is_free(lease: Optional[Dict], holder: str, now: float) -> bool:
+    """A lease can be taken if nobody holds it, it has expired, or the holder already has it"""
+    return lease is None or lease.get('expires_at', 0) <= now or lease.get('holder') == holder
+
+
+def _new_lease(holder: str, ttl_seconds: float, now: float, details: Optional[Dict]) -> Dict:
+    return {'holder': holder, 'expires_at': now + ttl_seconds, 'acquired_at': now, **(details or {})}
+
+
+class InMemoryLeaseStore:
+    """Leases held in this process - for local runs and tests"""
+
+    def __init__(self):
+        self._leases = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str, holder: str, ttl_seconds: float, details: Optional[Dict] = None) -> bool:
+        now = time.time()
+        with self._lock:
+            if not _lease_is_free(self._leases.get(key), holder, now):
+                return False
+            self._leases[key] = _new_lease(holder, ttl_seconds, now, details)
+            return True
+
+    def renew(self, key: str, holder: str, ttl_seconds: float) -> bool:
+        with self._lock:
+            lease = self._leases.get(key)
+            if not lease or lease['holder'] != holder:
+                return False
+            lease['expires_at'] = time.time() + ttl_seconds
+            return True
+
+    def release(self, key: str, holder: str):
+        with self._lock:
+            if self._leases.get(key, {}).get('holder') == holder:
+                del self._leases[key]
+
+    def active(self, prefix: str = '') -> Dict[str, Dict]:
+        """Unexpired leases whose key starts with prefix"""
+        now = time.time()
+        with self._lock:
+            return {
+                key: dict(lease) for key, lease in self._leases.items()
+                if key.startswith(prefix) and lease['expires_at'] > now
+            }
+
+
+class FirestoreLeaseStore:
+    """Leases as documents in the SEED_LEASES_COLLECTION collection, taken in transactions"""
+
+    def __init__(self, db, collection: str = None):
+        self.db = db
+        self.collection = collection or SEED_LEASES_COLLECTION
+
+    def _ref(self, key: str):
+        return self.db.collection(self.collection).document(key)
+
+    def acquire(self, key: str, holder: str, ttl_seconds: float, details: Optional[Dict] = None) -> bool:
+        ref = self._ref(key)
+
+        @gcloud_firestore.transactional
+        def take(transaction):
+            snapshot = ref.get(transaction=transaction)
+            now = time.time()
+            if not _lease_is_free(snapshot.to_dict() if snapshot.exists else None, holder, now):
+                return False
+            transaction.set(ref, _new_lease(holder, ttl_seconds, now, details))
+            return True
+
+        return take(self.db.transaction())
+
+    def renew(self, key: str, holder: str, ttl_seconds: float) -> bool:
+        ref = self._ref(key)
+
+        @gcloud_firestore.transactional
+        def extend(transaction):
+            snapshot = ref.get(transaction=transaction)
+            if not snapshot.exists or snapshot.to_dict().get('holder') != holder:
+                return False
+            transaction.update(ref, {'expires_at': time.time() + ttl_seconds})
+            return True
+
+        return extend(self.db.transaction())
+
+    def release(self, key: str, holder: str):
+        ref = self._ref(key)
+
+        @gcloud_firestore.transactional
+        def drop(transaction):
+            snapshot = ref.get(transaction=transaction)
+            if snapshot.exists and snapshot.to_dict().get('holder') == holder:
+                transaction.delete(ref)
+
+        drop(self.db.transaction())
+
+    def active(self, prefix: str = '') -> Dict[str, Dict]:
+        """Unexpired leases whose key starts with prefix (document ID range query)"""
+        collection = self.db.collection(self.collection)
+        query = collection
+        if prefix:
+            query = (collection.where(filter=FieldFilter('__name__', '>=', collection.document(prefix)))
+                     .where(filter=FieldFilter('__name__', '<', collection.document(prefix + '\uf8ff'))))
+        now = time.time()
+        leases = {}
+        for snapshot in query.stream():
+            lease = snapshot.to_dict()
+            if lease.get('expires_at', 0) > now:
+                leases[snapshot.id] = lease
+        return leases
+
+
+class RunLease:
+    """
+    Leases a seeding run holds on its date range, one per project, renewed by a heartbeat
+
+    Leases are keyed run-{project}-{start}-{end}. Another run's lease competes
+    with this run's if their ranges overlap and it was taken first, so of two
+    runs racing for the same dates exactly one goes ahead.
+    """
+
+    def __init__(self, stores: Dict, start_date: date, end_date: date, holder: str,
+                 ttl_seconds: float = None, details: Optional[Dict] = None):
+        """
+        Args:
+            stores: Lease store of each project the run seeds, by project
+            start_date: First date of the run
+            end_date: Last date of the run
+            holder: ID of this invocation
+            ttl_seconds: Lease lifetime without a heartbeat (default: RUN_LEASE_TTL_SECONDS)
+            details: Extra fields recorded in the lease documents
+        """
+        self.stores = stores
+        self.start_date = start_date.isoformat()
+        self.end_date = end_date.isoformat()
+        self.holder = holder
+        self.ttl_seconds = ttl_seconds or RUN_LEASE_TTL_SECONDS
+        self.details = {'start_date': self.start_date, 'end_date': self.end_date, **(details or {})}
+        self.held = set()
+        self._stop = threading.Event()
+        self._heartbeat = None
+
+    def key(self, project: str) -> str:
+        return f"run-{project}-{self.start_date}-{self.end_date}"
+
+    def acquire(self):
+        """Take the lease in every project where it is free; the others stay competing"""
+        for project, store in self.stores.items():
+            if project not in self.held and store.acquire(
+                    self.key(project), self.holder, self.ttl_seconds, {'project': project, **self.details}):
+                self.held.add(project)
+
+    def competitors(self) -> Dict[str, Dict]:
+        """Other runs' leases that overlap this run's range and take precedence, by key"""
+        found = {}
+        for project, store in self.stores.items():
+            leases = store.active(f"run-{project}-")
+            own = leases.get(self.key(project)) if project in self.held else None
+            for key, lease in leases.items():
+                if lease.get('holder') == self.holder:
+                    continue
+                if lease.get('end_date', '') < self.start_date or lease.get('start_date', '') > self.end_date:
+                    continue
+                if own is not None and (lease.get('acquired_at', 0), key) > (own['acquired_at'], self.key(project)):
+                    continue
+                found[key] = lease
+        return found
+
+    def covered(self, target_dates: List[date]) -> List[date]:
+        """Dates a competing run has leased in every project this run seeds"""
+        competitors = list(self.competitors().values())
+
+        def covered_in(project: str, date_str: str) -> bool:
+            return any(
+                lease.get('project') == project and lease['start_date'] <= date_str <= lease['end_date']
+                for lease in competitors
+            )
+
+        return [
+            target_date for target_date in target_dates
+            if all(covered_in(project, target_date.isoformat()) for project in self.stores)
+        ]
+
+    def start_heartbeat(self, interval: float = None):
+        """Renew the held leases in the background until release()"""
+        interval = interval or self.ttl_seconds / 3
+
+        def beat():
+            while not self._stop.wait(interval):
+                for project in list(self.held):
+                    try:
+                        if not self.stores[project].renew(self.key(project), self.holder, self.ttl_seconds):
+                            logger.warning(f"⚠️ Lost the lease {self.key(project)} to another run")
+                            self.held.discard(project)
+                    except Exception as e:
+                        logger.warning(f"⚠️ Could not renew the lease {self.key(project)}: {str(e)}")
+
+        self._heartbeat = threading.Thread(target=beat, name='run-lease-heartbeat', daemon=True)
+        self._heartbeat.start()
+
+    def release(self):
+        """Stop the heartbeat and give up the held leases"""
+        self._stop.set()
+        if self._heartbeat is not None:
+            self._heartbeat.join()
+        for project in list(self.held):
+            try:
+                self.stores[project].release(self.key(project), self.holder)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not release the lease {self.key(project)}: {str(e)}")
+        self.held.clear()
+
+
+_memory_leases = InMemoryLeaseStore()
+
+
+def lease_store(db=None):
+    """
+    Lease store matching SEED_CHECKPOINT_STORE: Firestore, or this process's memory
+
+    Args:
+        db: Firestore client of the project that keeps the run state
+    """
+    if SEED_CHECKPOINT_STORE == 'firestore':
+        return FirestoreLeaseStore(db)
+    return _memory_leases
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Shard Coordinator
+Fans a long date range out to several invocations of this function.
+
+?mode=coordinate splits the range into shards of SHARD_DAYS days and calls the
+function itself once per shard (?start_date=...&end_date=...&run_id=...&shard_of=...),
+up to SHARD_CONCURRENCY at a time. Each shard holds a lease on its run ID so a
+shard is never seeded twice at once, and checkpoints its progress, so running
+the coordinator again with the same run ID picks up whatever a shard left
+unfinished. The shards' responses are merged into the coordinator's.
+"""
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Dict, List, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Days of the range seeded by each shard invocation
+SHARD_DAYS = int(os.environ.get('SHARD_DAYS', '60'))
+# Shard invocations in flight at once
+SHARD_CONCURRENCY = int(os.environ.get('SHARD_CONCURRENCY', '8'))
+# URL the coordinator invokes for each shard (default: the URL it was called on)
+SEEDER_FUNCTION_URL = os.environ.get('SEEDER_FUNCTION_URL')
+# A shard's request may take as long as a whole invocation
+SHARD_REQUEST_TIMEOUT_SECONDS = float(os.environ.get('FUNCTION_TIMEOUT_SECONDS', '540'))
+
+# Response fields merged from the shards into the coordinator's response
+MERGED_FIELDS = ('processed_dates', 'successful', 'errors', 'deferred')
+
+
+def split_into_shards(target_dates: List[date], shard_days: Optional[int] = None) -> List[List[date]]:
+    """
+    Split consecutive dates into shards of at most shard_days days
+
+    Args:
+        target_dates: The range's dates, in date order
+        shard_days: Days per shard (default: SHARD_DAYS)
+    """
+    shard_days = max(1, shard_days or SHARD_DAYS)
+    return [target_dates[i:i + shard_days] for i in range(0, len(target_dates), shard_days)]
+
+
+def shard_run_id(coordinator_run_id: str, index: int) -> str:
+    """Run ID of a shard - stable, so a re-run coordinator resumes each shard's checkpoint"""
+    return f"{coordinator_run_id}.{index:03d}"
+
+
+def shard_lease_key(run_id: str) -> str:
+    return f"shard-{run_id}"
+
+
+def _auth_headers(url: str) -> Dict[str, str]:
+    """Identity token for calling the function itself when running on Cloud Functions"""
+    if not os.environ.get('K_SERVICE'):
+        return {}
+    import google.auth.transport.requests
+    import google.oauth2.id_token
+    token = google.oauth2.id_token.fetch_id_token(google.auth.transport.requests.Request(), url)
+    return {'Authorization': f"Bearer {token}"}
+
+
+def invoke_shard(url: str, shard_dates: List[date], run_id: str, coordinator_run_id: str, deadline=None) -> Dict:
+    """
+    Seed one shard through an HTTP invocation of the function
+
+    Args:
+        url: The function's URL
+        shard_dates: The shard's consecutive dates
+        run_id: The shard's run ID
+        coordinator_run_id: Run ID of the coordinator, sent as shard_of
+        deadline: Coordinator's Deadline; limits how long it waits for the shard
+
+    Returns:
+        Shard summary with its status and, if it answered, its response body
+    """
+    shard = {
+        'run_id': run_id,
+        'start_date': shard_dates[0].isoformat(),
+        'end_date': shard_dates[-1].isoformat(),
+        'days': len(shard_dates),
+    }
+    if deadline is not None and deadline.expired():
+        shard['status'] = 'deferred'
+        return shard
+
+    params = {
+        'start_date': shard['start_date'],
+        'end_date': shard['end_date'],
+        'run_id': run_id,
+        'shard_of': coordinator_run_id,
+    }
+    timeout = deadline.timeout(SHARD_REQUEST_TIMEOUT_SECONDS) if deadline is not None else SHARD_REQUEST_TIMEOUT_SECONDS
+    try:
+        response = requests.get(url, params=params, headers=_auth_headers(url), timeout=timeout)
+        shard['http_status'] = response.status_code
+        body = response.json().get('body', {})
+    except Exception as e:
+        logger.error(f"❌ Shard {run_id} ({shard['start_date']} to {shard['end_date']}) failed: {str(e)}")
+        shard['status'] = 'error'
+        shard['error'] = str(e)
+        return shard
+
+    if response.status_code != 200:
+        shard['status'] = body.get('status', 'error')
+        shard['error'] = body.get('message', f"HTTP {response.status_code}")
+        logger.warning(f"⚠️ Shard {run_id} answered {response.status_code}: {shard['error']}")
+        return shard
+
+    shard['status'] = 'deferred' if body.get('deferred') else body.get('status', 'success')
+    shard['body'] = body
+    logger.info(
+        f"✅ Shard {run_id}: {len(body.get('successful', []))} successful, "
+        f"{len(body.get('errors', []))} errors, {len(body.get('deferred', []))} deferred"
+    )
+    return shard
+
+
+def coordinate(url: str, target_dates: List[date], coordinator_run_id: str, results: Dict, deadline=None):
+    """
+    Seed the range through shard invocations and merge their results into the response
+
+    Dates of shards that failed, were leased by another invocation or did not
+    finish in time are reported as deferred; running the coordinator again
+    with the same run ID resumes them.
+
+    Args:
+        url: The function's URL
+        target_dates: The range's dates, in date order
+        coordinator_run_id: The coordinator's run ID; shard run IDs derive from it
+        results: Response body being built
+        deadline: Coordinator's Deadline
+    """
+    shards = split_into_shards(target_dates)
+    logger.info(
+        f"🧩 Coordinating run {coordinator_run_id}: {len(target_dates)} dates in {len(shards)} shards "
+        f"of up to {max(1, SHARD_DAYS)} days, {SHARD_CONCURRENCY} at a time"
+    )
+
+    with ThreadPoolExecutor(max_workers=max(1, min(SHARD_CONCURRENCY, len(shards) or 1))) as executor:
+        futures = [
+            executor.submit(invoke_shard, url, shard_dates, shard_run_id(coordinator_run_id, i),
+                            coordinator_run_id, deadline)
+            for i, shard_dates in enumerate(shards)
+        ]
+        outcomes = [future.result() for future in futures]
+
+    results['run_id'] = coordinator_run_id
+    results['shards'] = []
+    for shard_dates, shard in zip(shards, outcomes):
+        body = shard.pop('body', None)
+        if body is not None:
+            for field in MERGED_FIELDS:
+                results[field].extend(body.get(field, []))
+        else:
+            # The shard's checkpoint knows what it finished; the coordinator only knows it isn't done
+            results['deferred'].extend(shard_date.strftime('%Y-%m-%d') for shard_date in shard_dates)
+        results['shards'].append(shard)
+
+    if any(shard['status'] != 'success' for shard in results['shards']):
+        results['status'] = 'partial'
@@ -0,0 +1,359 @@
+"""
+Unit tests for the asyncio seeding engine
+"""
+import asyncio
+import os
+import re
+import tempfile
+import unittest
+from datetime import date
+from unittest.mock import Mock, patch
+from urllib.parse import unquote
+
+import httpx
+
+import async_seeder
+import main
+from test_main import SAMPLE_USCCB_PAGE
+
+
+class FakeSnapshot:
+    def __init__(self, data, doc_id=None):
+        self.id = doc_id
+        self.exists = data is not None
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data)
+
+
+class FakeAsyncDocument:
+    def __init__(self, docs, doc_id, reads):
+        self.docs = docs
+        self.doc_id = doc_id
+        self.reads = reads
+
+    async def get(self):
+        self.reads.append(self.doc_id)
+        return FakeSnapshot(self.docs.get(self.doc_id), self.doc_id)
+
+    async def set(self, data, merge=False):
+        self.docs[self.doc_id] = {**self.docs.get(self.doc_id, {}), **data} if merge else dict(data)
+
+    async def delete(self):
+        self.docs.pop(self.doc_id, None)
+
+
+class FakeAsyncBatch:
+    def __init__(self, db):
+        self.db = db
+        self.writes = []
+
+    def set(self, doc_ref, data, merge=False):
+        self.writes.append((doc_ref, data, merge))
+
+    async def commit(self):
+        if self.db.fail_commits:
+            raise Exception('batch failed')
+        self.db.commits += 1
+        for doc_ref, data, merge in self.writes:
+            await doc_ref.set(data, merge=merge)
+
+
+class FakeAsyncFirestore:
+    def __init__(self, docs=None):
+        self.docs = docs or {}
+        self.reads = []
+        self.get_all_calls = 0
+        self.commits = 0
+        self.fail_commits = False
+        self.closed = 0
+
+    def close(self):
+        self.closed += 1
+
+    def batch(self):
+        return FakeAsyncBatch(self)
+
+    def collection(self, name):
+        return self
+
+    def document(self, doc_id):
+        return FakeAsyncDocument(self.docs, doc_id, self.reads)
+
+    async def get_all(self, refs):
+        self.get_all_calls += 1
+        for ref in refs:
+            yield FakeSnapshot(self.docs.get(ref.doc_id), ref.doc_id)
+
+
+@patch('main.USCCB_CACHE_ENABLED', False)
+@patch('main.SCRIPTURE_CACHE_ENABLED', False)
+@patch('main.MIN_REQUEST_INTERVAL_SECONDS', 0)
+@patch('main._verse_store_loaded', True)
+@patch('main._verse_store', None)
+class TestAsyncSeeder(unittest.TestCase):
+    """Test the asyncio engine against fake HTTP and Firestore backends"""
+
+    def setUp(self):
+        self.requests = []
+
+        async def handler(request):
+            url = str(request.url)
+            self.requests.append(url)
+            await asyncio.sleep(0)
+            if 'usccb' in url:
+                return httpx.Response(200, content=SAMPLE_USCCB_PAGE.encode('utf-8'))
+            return httpx.Response(200, json={'text': f"text of {url.rsplit('/', 1)[1]}"})
+        self.handler = handler
+
+    def _seed(self, dates, databases, has_secondary=False, dry_run=False, report=None):
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(self.handler)) as client:
+                return await async_seeder.seed_dates(
+                    dates, dry_run, 'primary' in databases, has_secondary, False,
+                    http_client=client, databases=databases, report=report
+                )
+        return asyncio.run(run())
+
+    def test_creates_documents_in_date_order(self):
+        """Test new documents get every reading and results keep date order"""
+        db = FakeAsyncFirestore()
+        dates = [date(2025, 12, day) for day in (7, 8, 9)]
+
+        results = self._seed(dates, {'primary': db})
+
+        self.assertEqual([r['doc_id'] for r in results], ['2025-12-07', '2025-12-08', '2025-12-09'])
+        self.assertTrue(all(r['status'] == 'success' for r in results))
+        doc = db.docs['2025-12-07']
+        self.assertEqual(doc['gospel_verse'], 'Mt 3:1-12')
+        self.assertEqual(doc['responsorial_psalm_verse'], 'Ps 72:1-2, 7-8, 12-13, 17')
+        self.assertEqual(doc['responsorial_psalm'], 'text of Psalms+72:1-2,7-8,12-13,17')
+        self.assertEqual(doc['body'], 'Gospel: Mt 3:1-12')
+
+    @patch('main.FIRESTORE_GET_ALL_CHUNK_SIZE', 2)
+    def test_state_is_read_in_bulk(self):
+        """Test document state comes from chunked get_all calls, not per-date reads"""
+        db = FakeAsyncFirestore()
+
+        self._seed([date(2025, 12, day) for day in (7, 8, 9)], {'primary': db})
+
+        self.assertEqual(db.get_all_calls, 2)
+        self.assertEqual(db.reads, [])
+
+    def test_writes_are_batched(self):
+        """Test the range's documents are written with one batch commit"""
+        db = FakeAsyncFirestore()
+        report = {}
+
+        self._seed([date(2025, 12, day) for day in (7, 8, 9)], {'primary': db}, report=report)
+
+        self.assertEqual(db.commits, 1)
+        self.assertEqual(len(db.docs), 3)
+        self.assertEqual(report['writes'], {'primary': {'writes': 3, 'commits': 1, 'failed': 0}})
+
+    def test_failed_write_becomes_date_error(self):
+        """Test a document that cannot be written is reported as an error for its date"""
+        db = FakeAsyncFirestore()
+        db.fail_commits = True
+        original_set = FakeAsyncDocument.set
+
+        async def set_document(document, data, merge=False):
+            if document.doc_id == '2025-12-08':
+                raise Exception('permission denied')
+            await original_set(document, data, merge)
+
+        with patch.object(FakeAsyncDocument, 'set', set_document):
+            results = self._seed([date(2025, 12, 7), date(2025, 12, 8)], {'primary': db})
+
+        self.assertEqual(results[0]['status'], 'success')
+        self.assertEqual(results[1], {'status': 'error', 'doc_id': '2025-12-08', 'error': 'permission denied'})
+        self.assertEqual(list(db.docs), ['2025-12-07'])
+
+    def test_expired_deadline_defers_dates(self):
+        """Test dates that get a slot after the deadline are deferred without requests"""
+        db = FakeAsyncFirestore()
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(self.handler)) as client:
+                return await async_seeder.seed_dates(
+                    [date(2025, 12, 7)], False, True, False, False,
+                    http_client=client, databases={'primary': db}, deadline=main.Deadline(-1)
+                )
+        results = asyncio.run(run())
+
+        self.assertEqual(results, [{'status': 'deferred', 'doc_id': '2025-12-07', 'reason': 'deadline'}])
+        self.assertEqual(self.requests, [])
+        self.assertEqual(db.docs, {})
+
+    def test_default_data_is_overwritten_in_place(self):
+        """Test a John 3:16 default document is replaced with full readings in one write"""
+        db = FakeAsyncFirestore({'2025-12-07': {'gospel_verse': 'John 3:16', 'stale': True}})
+
+        results = self._seed([date(2025, 12, 7)], {'primary': db})
+
+        self.assertEqual(results[0]['status'], 'success')
+        self.assertEqual(db.docs['2025-12-07']['gospel_verse'], 'Mt 3:1-12')
+        self.assertNotIn('stale', db.docs['2025-12-07'])
+        self.assertEqual(sum('usccb' in url for url in self.requests), 1)
+        self.assertEqual(db.commits, 1)
+
+    def test_projects_share_fetches(self):
+        """Test each page and passage is requested once however many projects are seeded"""
+        primary, secondary = FakeAsyncFirestore(), FakeAsyncFirestore()
+
+        self._seed([date(2025, 12, 7)], {'primary': primary, 'secondary': secondary}, has_secondary=True)
+
+        self.assertEqual(len(self.requests), len(set(self.requests)))
+        self.assertEqual(sum('usccb' in url for url in self.requests), 1)
+        self.assertEqual(primary.docs, secondary.docs)
+
+    def test_complete_document_is_skipped_without_fetches(self):
+        """Test a document with a complete psalm costs no HTTP requests"""
+        db = FakeAsyncFirestore({'2025-12-07': {
+            'responsorial_psalm': 'text', 'responsorial_psalm_verse': 'Ps 72:1', 'responsorial_psalm_response': 'R.'
+        }})
+
+        results = self._seed([date(2025, 12, 7)], {'primary': db})
+
+        self.assertEqual(results[0]['reason'], 'already_exists')
+        self.assertEqual(self.requests, [])
+
+    def test_dry_run_writes_nothing(self):
+        """Test dry run plans but never writes"""
+        db = FakeAsyncFirestore()
+
+        results = self._seed([date(2025, 12, 7)], {'primary': db}, dry_run=True)
+
+        self.assertEqual(results[0]['status'], 'dry_run')
+        self.assertEqual(db.docs, {})
+
+
+def batch_verses(api_ref):
+    """Per-verse entries bible-api.com answers a combined request ("72:1-2,7,73:1") with"""
+    verses = []
+    chapter = None
+    for part in api_ref.split(','):
+        if ':' in part:
+            chapter, part = part.split(':')
+        start, _, end = part.partition('-')
+        verses.extend({'chapter': int(chapter), 'verse': verse, 'text': f"{chapter}:{verse}"}
+                      for verse in range(int(start), int(end or start) + 1))
+    return verses
+
+
+@patch('main.USCCB_CACHE_ENABLED', False)
+@patch('main.SCRIPTURE_CACHE_ENABLED', False)
+@patch('main.MIN_REQUEST_INTERVAL_SECONDS', 0)
+@patch('main._verse_store_loaded', True)
+@patch('main._verse_store', None)
+class TestSharedFetching(unittest.TestCase):
+    """Test the asyncio engine fetches the way the threaded engine does"""
+
+    def setUp(self):
+        self.requests = []
+
+        async def handler(request):
+            url = str(request.url)
+            self.requests.append(url)
+            if 'usccb' in url:
+                # Each date has its own psalm, so a range needs several Psalms passages
+                day = int(re.search(r'\d\d(\d\d)\d\d\.cfm', url).group(1))
+                page = SAMPLE_USCCB_PAGE.replace('Ps 72:1-2, 7-8, 12-13, 17', f"Ps {day}:1-2")
+                return httpx.Response(200, content=page.encode('utf-8'), headers={'ETag': f'"{day}"'})
+            book, api_ref = unquote(url.rsplit('/', 1)[1]).split('+', 1)
+            return httpx.Response(200, json={'verses': batch_verses(api_ref)})
+        self.handler = handler
+
+    def _engine(self, databases):
+        clients = []
+
+        def client(**kwargs):
+            clients.append(real_client(transport=httpx.MockTransport(self.handler), **kwargs))
+            return clients[-1]
+        real_client = httpx.AsyncClient
+        for patcher in (patch.object(async_seeder.httpx, 'AsyncClient', client),
+                        patch('async_seeder.async_firestore_clients', return_value=databases)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        return async_seeder.AsyncEngine(), clients
+
+    @patch('main.SCRIPTURE_BATCH', True)
+    def test_passages_are_batched_per_book(self):
+        """Test SCRIPTURE_BATCH packs the range's passages into one request per book"""
+        db = FakeAsyncFirestore()
+        engine, _ = self._engine({'primary': db})
+
+        engine.seed_dates([date(2025, 12, day) for day in (7, 8, 9)], False, True, False, False)
+        engine.close()
+
+        bible_requests = [url for url in self.requests if 'bible-api' in url]
+        self.assertEqual(len(bible_requests), 4)  # Isaiah, Psalms, Romans, Matthew
+        self.assertIn('Psalms+7:1-2,8:1-2,9:1-2', unquote(' '.join(bible_requests)))
+        self.assertEqual(db.docs['2025-12-08']['responsorial_psalm'], '8:1 8:2')
+
+    def test_chunks_share_clients(self):
+        """Test an invocation's chunks use one HTTP client and AsyncClient, closed at the end"""
+        db = FakeAsyncFirestore()
+        engine, clients = self._engine({'primary': db})
+
+        engine.seed_dates([date(2025, 12, 7)], False, True, False, False)
+        engine.seed_dates([date(2025, 12, 8)], False, True, False, False)
+        self.assertEqual(db.closed, 0)
+        engine.close()
+
+        self.assertEqual(len(clients), 1)
+        self.assertTrue(clients[0].is_closed)
+        self.assertEqual(db.closed, 1)
+        self.assertEqual(sorted(db.docs), ['2025-12-07', '2025-12-08'])
+
+    def test_pages_are_revalidated(self):
+        """Test the page cache and conditional GETs are shared with the threaded engine"""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        engine, _ = self._engine({'primary': FakeAsyncFirestore()})
+        conditional = []
+        handler = self.handler
+
+        async def revalidating_handler(request):
+            if request.headers.get('If-None-Match'):
+                conditional.append(request.headers['If-None-Match'])
+                return httpx.Response(304)
+            return await handler(request)
+        self.handler = revalidating_handler
+
+        with patch('main.USCCB_CACHE_ENABLED', True), patch('main.USCCB_CACHE_DIR', tmp.name):
+            engine.seed_dates([date(2025, 12, 7)], True, True, False, False)
+            engine.seed_dates([date(2025, 12, 7)], True, True, False, False)
+            engine.close()
+            cached = main._load_cached_usccb_page(main.usccb_reading_url(date(2025, 12, 7)))
+
+        self.assertEqual(conditional, ['"7"'])
+        self.assertIn(b'Ps 7:1-2', cached['content'])
+
+
+class TestEngineSelection(unittest.TestCase):
+    """Test SEEDER_ENGINE picks the engine"""
+
+    @patch('main.SEEDER_ENGINE', 'async')
+    @patch('main.initialize_firebase')
+    @patch('main._seed_dates_threaded')
+    @patch('async_seeder.async_firestore_clients', return_value={})
+    @patch('async_seeder.seed_dates')
+    def test_async_engine_is_selected(self, mock_async, mock_clients, mock_threaded, mock_fb):
+        """Test SEEDER_ENGINE=async seeds through async_seeder"""
+        async def seed_dates(target_dates, *args, **kwargs):
+            return [{'status': 'success'} for _ in target_dates]
+        mock_async.side_effect = seed_dates
+        request = Mock(method='GET', args={'start_date': '2025-12-01', 'end_date': '2025-12-03'})
+
+        response, status_code = main.seed_daily_readings_cron(request)
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(response['body']['engine'], 'async')
+        self.assertEqual(response['body']['successful'], ['2025-12-01', '2025-12-02', '2025-12-03'])
+        mock_threaded.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+"""
+Unit tests for the canonical Bible book registry
+"""
+import unittest
+
+from bible_books import BOOKS_BY_ID, lookup_book, last_verse, validate_passage
+
+
+class TestBookRegistry(unittest.TestCase):
+    """Test book lookup and passage validation"""
+    
+    def test_aliases_resolve_to_one_book(self):
+        """Test IDs, names and abbreviations all find the same book"""
+        for alias in ('1CO', '1 Corinthians', '1Cor', '1 Cor', '1 cor.'):
+            self.assertIs(lookup_book(alias), BOOKS_BY_ID['1CO'])
+        self.assertEqual(lookup_book('3Jn').name, '3 John')
+        self.assertEqual(lookup_book('Jude').id, 'JUD')
+        self.assertIsNone(lookup_book('Hezekiah'))
+    
+    def test_counts_match_kjv_totals(self):
+        """Test the verse count table adds up to the KJV's 1,189 chapters and 31,102 verses"""
+        counted = [book.verse_counts for book in BOOKS_BY_ID.values() if book.verse_counts]
+        self.assertEqual(sum(len(counts) for counts in counted), 1189)
+        self.assertEqual(sum(sum(counts) for counts in counted), 31102)
+    
+    def test_validate_passage(self):
+        """Test chapter and verse bounds are enforced"""
+        john = BOOKS_BY_ID['JHN']
+        self.assertIsNone(validate_passage(john, 3, [16]))
+        self.assertIsNotNone(validate_passage(john, 22, [1]))
+        self.assertIsNotNone(validate_passage(john, 3, [37]))
+        self.assertIsNotNone(validate_passage(john, 3, []))
+    
+    def test_lectionary_numbering_is_allowed(self):
+        """Test NAB chapter/verse numbering beyond the KJV is accepted"""
+        self.assertIsNone(validate_passage(BOOKS_BY_ID['MAL'], 3, [19, 20]))
+        self.assertIsNone(validate_passage(BOOKS_BY_ID['JOL'], 4, [12]))
+        self.assertIsNone(validate_passage(BOOKS_BY_ID['PSA'], 51, [3, 21]))
+        self.assertEqual(last_verse(BOOKS_BY_ID['DAN'], 3), 100)
+    
+    def test_deuterocanonical_books_check_chapters_only(self):
+        """Test books without verse counts are bounded by chapter count alone"""
+        sirach = BOOKS_BY_ID['SIR']
+        self.assertIsNone(validate_passage(sirach, 27, [30, 31]))
+        self.assertIsNotNone(validate_passage(sirach, 52, [1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,7 +6,11 @@ from unittest.mock import Mock, patch, MagicMock
 import os
 import json
 import base64
-from datetime import date, datetime
+import tempfile
+import time
+import threading
+import requests
+from datetime import date, datetime, timedelta
 from main import (
     initialize_firebase,
     generate_usccb_url,
@@ -14,7 +18,29 @@ from main import (
     fetch_usccb_reading_data,
     fetch_public_scripture_text,
     seed_daily_reading,
-    seed_daily_readings_cron
+    seed_daily_readings_cron,
+    prefetch_usccb_readings,
+    fetch_usccb_page,
+    parse_usccb_reading_html,
+    _parse_usccb_html_soup,
+    ResolvedReading,
+    fetch_public_scripture_texts,
+    ScriptureTextCache,
+    compile_verse_segments,
+    read_document_states,
+    FirestoreWriteBatcher,
+    _seed_dates_threaded,
+    plan_document_delta,
+    build_seed_plan,
+    Deadline,
+    prioritize_dates,
+    plan_daily_reading,
+    reading_content_hash,
+    count_unchanged,
+    delete_old_readings,
+    _seed_date_range,
+    _load_cached_usccb_page,
+    _usccb_cache_paths
 )
 
 
@@ -124,6 +150,14 @@ class TestBibleReferenceParsing(unittest.TestCase):
         self.assertIn(2, result['verses'])
         self.assertIn(3, result['verses'])
     
+    def test_parse_spaced_and_short_book_names(self):
+        """Test spaced, dotted and single-chapter book abbreviations resolve"""
+        self.assertEqual(parse_bible_reference("1 Cor 1:3")['book'], '1 Corinthians')
+        self.assertEqual(parse_bible_reference("1 Cor. 1:3")['book_id'], '1CO')
+        self.assertEqual(parse_bible_reference("3Jn 1:5-8")['book'], '3 John')
+        self.assertEqual(parse_bible_reference("Jude 1:17, 20b-25")['book'], 'Jude')
+        self.assertEqual(parse_bible_reference("Song of Songs 2:8-14")['book_id'], 'SNG')
+    
     def test_parse_invalid_reference(self):
         """Test parsing an invalid reference"""
         result = parse_bible_reference("Invalid Reference")
@@ -132,6 +166,197 @@ class TestBibleReferenceParsing(unittest.TestCase):
         self.assertEqual(result['verses'], [])
 
 
+SAMPLE_USCCB_PAGE = """<!DOCTYPE html>
+<html><head><title>Readings</title>
+<script>var x = "<div class='content-header'>";</script>
+</head><body>
+<div class="b-verse"><div class="innerblock">
+  <div class="content-header">
+    <h3 class="name">Reading 1</h3>
+    <div class="address"><a href="https://bible.usccb.org/bible/isaiah/11?1">Is 11:1-10</a></div>
+  </div>
+  <div class="content-body">On that day, a shoot shall sprout<br/>from the stump of Jesse.</div>
+</div></div>
+<div class="b-verse"><div class="innerblock">
+  <div class="content-header">
+    <h3 class="name">Responsorial Psalm</h3>
+    <div class="address"><a href="https://bible.usccb.org/bible/psalms/72?1">Ps 72:1-2, 7-8, 12-13, 17</a></div>
+  </div>
+  <p>Between header and body</p>
+  <div class="content-body">R. (cf. 7) Justice shall flourish in his time, and fullness of peace for ever.*<br />
+O God, with your judgment endow the king,<br />
+R. Justice shall flourish in his time &amp; peace.</div>
+</div></div>
+<div class="b-verse"><div class="innerblock">
+  <div class="content-header">
+    <h3 class="name">Reading 2</h3>
+    <div class="address"><a>Rom 15:4-9</a></div>
+  </div>
+</div></div>
+<div class="b-verse"><div class="innerblock">
+  <div class="content-header">
+    <h3 class="name">Alleluia</h3>
+    <div class="address"><a>Lk 3:4, 6</a></div>
+  </div>
+</div></div>
+<div class="b-verse"><div class="innerblock">
+  <div class="content-header"><div class="address"><a>No name</a></div></div>
+  <div class="content-header"><h3 class="name">Gospel <span>Reading</span></h3>
+    <div class="address"></div><div class="address"><a>Wrong</a></div></div>
+  <div class="content-header other"><h3 class="name">
+    Gospel</h3><div class="address"><a> Mt 3:1-12 </a><a>Second link</a></div>
+  </div>
+</div></div>
+</body></html>
+"""
+
+
+class TestUSCCBPageParsing(unittest.TestCase):
+    """Test the fast-path USCCB extractor against the BeautifulSoup parser"""
+    
+    def _assert_same_as_soup(self, html):
+        url = 'https://bible.usccb.org/bible/readings/120725.cfm'
+        expected = _parse_usccb_html_soup(html, date(2025, 12, 7), url)
+        self.assertEqual(parse_usccb_reading_html(html, date(2025, 12, 7), url), expected)
+        self.assertEqual(parse_usccb_reading_html(html.encode('utf-8'), date(2025, 12, 7), url), expected)
+        return expected
+    
+    def test_sample_page_matches_soup(self):
+        """Test the extractor produces the same result dict as the full parse"""
+        result = self._assert_same_as_soup(SAMPLE_USCCB_PAGE)
+        self.assertEqual(result['reading1']['reference'], 'Is 11:1-10')
+        self.assertEqual(result['reading2']['reference'], 'Rom 15:4-9')
+        self.assertEqual(result['responsorialPsalm']['reference'], 'Ps 72:1-2, 7-8, 12-13, 17')
+        self.assertEqual(result['responsorialPsalm']['response'],
+                         'Justice shall flourish in his time, and fullness of peace for ever.')
+        self.assertEqual(result['gospel']['reference'], 'Mt 3:1-12')
+    
+    def test_unclosed_and_stray_tags_match_soup(self):
+        """Test malformed markup is handled the same way as BeautifulSoup"""
+        self._assert_same_as_soup(
+            '<div><div class="content-header"><h3 class="name">Responsorial Psalm</h3>'
+            '<div class="address"><a>Ps 23:1-6</a></span></div></div>'
+            '<div class="content-body">R. The Lord is my shepherd'
+        )
+        self._assert_same_as_soup(
+            '<div><div class="content-header"><h3 class="name">Responsorial Psalm</h3>'
+            '<div class="address"><a>Ps 23:1-6</a></div></div></div>'
+            '<div class="content-body">R. Not a sibling</div>'
+        )
+    
+    def test_chunked_bytes_match_whole_page(self):
+        """Test multi-byte characters split across chunks decode correctly"""
+        html = SAMPLE_USCCB_PAGE.replace('Justice', 'Justicé')
+        url = 'https://bible.usccb.org/bible/readings/120725.cfm'
+        result = parse_usccb_reading_html(html.encode('utf-8'), date(2025, 12, 7), url)
+        self.assertTrue(result['responsorialPsalm']['response'].startswith('Justicé'))
+
+
+class TestUSCCBStreaming(unittest.TestCase):
+    """Test streaming USCCB download with early termination"""
+    
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        patcher = patch('main.USCCB_CACHE_DIR', self.cache_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.cache_dir.cleanup)
+    
+    def _streamed_response(self, html, chunk_size=512):
+        content = html.encode('utf-8')
+        response = Mock()
+        response.status_code = 200
+        response.encoding = 'utf-8'
+        response.headers = {'ETag': '"v1"'}
+        response.raise_for_status = Mock()
+        response.chunks_read = 0
+        
+        def iter_content(chunk_size=chunk_size):
+            for offset in range(0, len(content), chunk_size):
+                response.chunks_read += 1
+                yield content[offset:offset + chunk_size]
+        
+        response.iter_content = iter_content
+        response.total_chunks = (len(content) + chunk_size - 1) // chunk_size
+        return response
+    
+    @staticmethod
+    def _with_footer(html):
+        # The readings sit in their own container, followed by a long footer
+        return html.replace('<body>', '<body><div class="readings">').replace(
+            '</body>', '</div>' + '<p>footer</p>' * 2000 + '</body>'
+        )
+    
+    @patch('main.USCCB_STREAM_CHUNK_SIZE', 512)
+    @patch('main.requests.get')
+    def test_stops_after_gospel(self, mock_get):
+        """Test the download stops once all readings are found"""
+        html = self._with_footer(SAMPLE_USCCB_PAGE)
+        response = self._streamed_response(html)
+        mock_get.return_value = response
+        
+        result = fetch_usccb_reading_data(date(2025, 12, 7), stream=True)
+        
+        self.assertTrue(mock_get.call_args.kwargs['stream'])
+        self.assertLess(response.chunks_read, response.total_chunks)
+        response.close.assert_called()
+        expected = _parse_usccb_html_soup(html, date(2025, 12, 7), 'https://bible.usccb.org/bible/readings/120725.cfm')
+        self.assertEqual(result, expected)
+    
+    @patch('main.USCCB_STREAM_CHUNK_SIZE', 512)
+    @patch('main.requests.get')
+    def test_procession_gospel_does_not_stop_stream(self, mock_get):
+        """Test a Gospel before the psalm (Palm Sunday) does not end the download"""
+        procession = (
+            '<div><div class="content-header"><h3 class="name">Gospel at the Procession with Palms</h3>'
+            '<div class="address"><a>Mt 21:1-11</a></div></div></div>'
+        )
+        html = SAMPLE_USCCB_PAGE.replace('<body>', '<body>' + procession)
+        mock_get.return_value = self._streamed_response(html)
+        
+        result = fetch_usccb_reading_data(date(2025, 12, 7), stream=True)
+        
+        self.assertEqual(result['gospel']['reference'], 'Mt 3:1-12')
+    
+    @patch('main.USCCB_STREAM_CHUNK_SIZE', 512)
+    @patch('main.requests.get')
+    def test_partial_page_is_not_cached(self, mock_get):
+        """Test a body cut short isn't stored under the whole page's validators"""
+        html = self._with_footer(SAMPLE_USCCB_PAGE)
+        full = Mock(status_code=200, content=html.encode('utf-8'), encoding='utf-8', headers={'ETag': '"v1"'})
+        mock_get.side_effect = [self._streamed_response(html), full]
+        
+        first = fetch_usccb_reading_data(date(2025, 12, 7), stream=True)
+        second = fetch_usccb_reading_data(date(2025, 12, 7), stream=False)
+        
+        self.assertEqual(first, second)
+        # Not a conditional GET: there was no complete copy to revalidate
+        self.assertNotIn('If-None-Match', mock_get.call_args_list[1].kwargs['headers'])
+        cached = _load_cached_usccb_page('https://bible.usccb.org/bible/readings/120725.cfm')
+        self.assertEqual(cached['content'], html.encode('utf-8'))
+    
+    @patch('main.USCCB_STREAM_CHUNK_SIZE', 512)
+    @patch('main.USCCB_CACHE_ENABLED', False)
+    @patch('main.requests.get')
+    def test_multi_mass_page_matches_full_parse(self, mock_get):
+        """Test USCCB_STREAM on and off pick the same Mass on a page with several"""
+        first_mass = SAMPLE_USCCB_PAGE[SAMPLE_USCCB_PAGE.index('<body>') + len('<body>'):
+                                       SAMPLE_USCCB_PAGE.index('</body>')]
+        second_mass = (first_mass.replace('Is 11:1-10', 'Is 52:7-10').replace('Ps 72:1-2, 7-8, 12-13, 17', 'Ps 98:1-6')
+                       .replace('Justice shall flourish', 'All the ends of the earth').replace('Mt 3:1-12', 'Jn 1:1-18'))
+        html = self._with_footer(SAMPLE_USCCB_PAGE.replace('</body>', '<h2>Mass during the Day</h2>' + second_mass + '</body>'))
+        full = Mock(status_code=200, content=html.encode('utf-8'), encoding='utf-8', headers={})
+        mock_get.side_effect = [self._streamed_response(html), full]
+        
+        streamed = fetch_usccb_reading_data(date(2025, 12, 25), stream=True)
+        parsed = fetch_usccb_reading_data(date(2025, 12, 25), stream=False)
+        
+        self.assertEqual(streamed, parsed)
+        self.assertEqual(streamed['reading1']['reference'], 'Is 52:7-10')
+        self.assertEqual(streamed['gospel']['reference'], 'Jn 1:1-18')
+        self.assertTrue(streamed['responsorialPsalm']['response'].startswith('All the ends of the earth'))
+
+
 class TestUSCCBFetching(unittest.TestCase):
     """Test USCCB reading data fetching"""
     
@@ -157,9 +382,188 @@ class TestUSCCBFetching(unittest.TestCase):
         self.assertIsNone(result)
 
 
+class TestUSCCBPageCache(unittest.TestCase):
+    """Test the conditional-GET cache for USCCB pages"""
+    
+    URL = 'https://bible.usccb.org/bible/readings/120125.cfm'
+    
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        patcher = patch('main.USCCB_CACHE_DIR', self.cache_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.cache_dir.cleanup)
+    
+    def _response(self, status_code, content=b'', headers=None):
+        response = Mock()
+        response.status_code = status_code
+        response.content = content
+        response.text = content.decode('utf-8')
+        response.encoding = 'utf-8'
+        response.headers = headers or {}
+        response.raise_for_status = Mock()
+        return response
+    
+    @patch('main.requests.get')
+    def test_not_modified_is_served_from_cache(self, mock_get):
+        """Test a 304 answer returns the cached body"""
+        mock_get.side_effect = [
+            self._response(200, b'<html>page</html>', {'ETag': '"abc"', 'Last-Modified': 'Mon, 01 Dec 2025 00:00:00 GMT'}),
+            self._response(304)
+        ]
+        
+        self.assertEqual(fetch_usccb_page(self.URL), (b'<html>page</html>', 'utf-8'))
+        self.assertEqual(fetch_usccb_page(self.URL), (b'<html>page</html>', 'utf-8'))
+        
+        conditional_headers = mock_get.call_args_list[1].kwargs['headers']
+        self.assertEqual(conditional_headers['If-None-Match'], '"abc"')
+        self.assertEqual(conditional_headers['If-Modified-Since'], 'Mon, 01 Dec 2025 00:00:00 GMT')
+    
+    @patch('main.requests.get')
+    def test_changed_page_replaces_cache(self, mock_get):
+        """Test a 200 answer to a conditional GET refreshes the cached copy"""
+        mock_get.side_effect = [
+            self._response(200, b'old', {'ETag': '"v1"'}),
+            self._response(200, b'new', {'ETag': '"v2"'}),
+            self._response(304)
+        ]
+        
+        fetch_usccb_page(self.URL)
+        self.assertEqual(fetch_usccb_page(self.URL)[0], b'new')
+        self.assertEqual(fetch_usccb_page(self.URL)[0], b'new')
+        self.assertEqual(mock_get.call_args_list[2].kwargs['headers']['If-None-Match'], '"v2"')
+    
+    @patch('main.requests.get')
+    def test_page_without_validators_is_not_cached(self, mock_get):
+        """Test pages without ETag/Last-Modified are always fetched unconditionally"""
+        mock_get.side_effect = [self._response(200, b'page'), self._response(200, b'page')]
+        
+        fetch_usccb_page(self.URL)
+        fetch_usccb_page(self.URL)
+        
+        self.assertNotIn('If-None-Match', mock_get.call_args_list[1].kwargs['headers'])
+        self.assertEqual(os.listdir(self.cache_dir.name), [])
+    
+    def _cache_page(self, url, mock_get, age_seconds=0):
+        """Cache a 1000-byte page for url, stored and last used age_seconds ago"""
+        mock_get.return_value = self._response(200, b'x' * 1000, {'ETag': '"v1"'})
+        fetch_usccb_page(url)
+        then = time.time() - age_seconds
+        for path in _usccb_cache_paths(url):
+            os.utime(path, (then, then))
+    
+    @patch('main.USCCB_CACHE_MAX_BYTES', 2500)
+    @patch('main.requests.get')
+    def test_least_recently_used_pages_are_evicted(self, mock_get):
+        """Test the cache stays under its byte cap by evicting the pages used longest ago"""
+        urls = [self.URL.replace('120125', f"1201{year}") for year in (23, 24, 25)]
+        self._cache_page(urls[0], mock_get, age_seconds=300)
+        self._cache_page(urls[1], mock_get, age_seconds=200)
+        # Revalidated since: used more recently than the second page
+        self.assertIsNotNone(_load_cached_usccb_page(urls[0]))
+        
+        self._cache_page(urls[2], mock_get)
+        
+        self.assertIsNotNone(_load_cached_usccb_page(urls[0]))
+        self.assertIsNone(_load_cached_usccb_page(urls[1]))
+        self.assertIsNotNone(_load_cached_usccb_page(urls[2]))
+        self.assertEqual(len(os.listdir(self.cache_dir.name)), 4)
+    
+    @patch('main.USCCB_CACHE_TTL_DAYS', 30)
+    @patch('main.requests.get')
+    def test_expired_pages_are_evicted(self, mock_get):
+        """Test pages stored longer ago than the TTL are removed even under the byte cap"""
+        old_url = self.URL.replace('120125', '120124')
+        self._cache_page(old_url, mock_get, age_seconds=31 * 86400)
+        
+        self._cache_page(self.URL, mock_get)
+        
+        self.assertIsNone(_load_cached_usccb_page(old_url))
+        self.assertIsNotNone(_load_cached_usccb_page(self.URL))
+
+
+class TestUSCCBPrefetch(unittest.TestCase):
+    """Test concurrent USCCB prefetching"""
+    
+    @patch('main.MIN_REQUEST_INTERVAL_SECONDS', 0)
+    @patch('main.fetch_usccb_reading_data')
+    def test_prefetch_returns_result_per_date(self, mock_fetch):
+        """Test every requested date gets its parsed result"""
+        mock_fetch.side_effect = lambda d: {'url': d.isoformat()} if d.day != 3 else None
+        dates = [date(2025, 12, 1) + timedelta(days=i) for i in range(5)]
+        
+        fetched, stats = prefetch_usccb_readings(dates, max_workers=3)
+        
+        self.assertEqual(list(fetched.keys()), dates)
+        self.assertEqual(fetched[date(2025, 12, 1)], {'url': '2025-12-01'})
+        self.assertIsNone(fetched[date(2025, 12, 3)])
+        self.assertEqual(stats['dates'], 5)
+        self.assertEqual(stats['fetched'], 4)
+        self.assertEqual(stats['workers'], 3)
+    
+    @patch('main.MIN_REQUEST_INTERVAL_SECONDS', 0)
+    @patch('main.MAX_CONNECTIONS_PER_HOST', 2)
+    @patch('main._host_limits', {})
+    @patch('main.fetch_usccb_reading_data')
+    def test_prefetch_limits_connections_per_host(self, mock_fetch):
+        """Test no more than MAX_CONNECTIONS_PER_HOST requests run at once"""
+        lock = threading.Lock()
+        in_flight = {'now': 0, 'max': 0}
+        
+        def slow_fetch(d):
+            with lock:
+                in_flight['now'] += 1
+                in_flight['max'] = max(in_flight['max'], in_flight['now'])
+            time.sleep(0.05)
+            with lock:
+                in_flight['now'] -= 1
+            return {'url': d.isoformat()}
+        
+        mock_fetch.side_effect = slow_fetch
+        dates = [date(2025, 12, 1) + timedelta(days=i) for i in range(6)]
+        
+        _, stats = prefetch_usccb_readings(dates, max_workers=6)
+        
+        self.assertLessEqual(in_flight['max'], 2)
+        self.assertGreater(stats['saved_seconds'], 0)
+    
+    @patch('main.initialize_firebase')
+    @patch('main.fetch_usccb_reading_data')
+    def test_seed_daily_reading_uses_prefetched_data(self, mock_fetch, mock_fb):
+        """Test seeding does not refetch when USCCB data is passed in"""
+        mock_fb.return_value.collection.return_value.document.return_value.get.return_value.exists = False
+        
+        result = seed_daily_reading(date(2025, 12, 1), dry_run=True, resolved=ResolvedReading(date(2025, 12, 1), {
+            'url': 'https://test.com',
+            'responsorialPsalm': {'reference': ''}
+        }))
+        
+        self.assertEqual(result['status'], 'dry_run')
+        mock_fetch.assert_not_called()
+
+
 class TestScriptureTextFetching(unittest.TestCase):
     """Test public scripture text fetching"""
     
+    def test_compile_verse_segments(self):
+        """Test verse lists compile to minimal ordered contiguous segments"""
+        self.assertEqual(compile_verse_segments([1, 2, 3, 5, 6]), [(1, 3), (5, 6)])
+        self.assertEqual(compile_verse_segments([9, 3, 4, 3]), [(3, 4), (9, 9)])
+        self.assertEqual(compile_verse_segments([]), [])
+    
+    @patch('main._verse_store_loaded', True)
+    @patch('main._verse_store', None)
+    @patch('main.SCRIPTURE_CACHE_ENABLED', False)
+    @patch('main.requests.get')
+    def test_fetch_discontiguous_reference(self, mock_get):
+        """Test a reference with gaps is fetched as exact segments in one request"""
+        mock_get.return_value.json.return_value = {'text': 'Ps 98 text'}
+        
+        result = fetch_public_scripture_text("Ps 98:1, 2-3ab, 5-6")
+        
+        self.assertEqual(result, 'Ps 98 text')
+        mock_get.assert_called_once_with('https://bible-api.com/Psalms+98:1-3,5-6', timeout=10)
+    
     def test_fetch_public_scripture_text_tbd(self):
         """Test fetching text for TBD reference"""
         result = fetch_public_scripture_text("TBD")
@@ -170,6 +574,14 @@ class TestScriptureTextFetching(unittest.TestCase):
         result = fetch_public_scripture_text("")
         self.assertEqual(result, "")
     
+    @patch('main.requests.get')
+    def test_out_of_range_reference_fails_fast(self, mock_get):
+        """Test references to missing chapters or verses never reach the network"""
+        self.assertEqual(fetch_public_scripture_text("Jn 22:1"), "")
+        self.assertEqual(fetch_public_scripture_text("Jude 1:26"), "")
+        self.assertEqual(fetch_public_scripture_text("Xyz 1:1"), "")
+        mock_get.assert_not_called()
+    
     def test_fetch_public_scripture_text_valid(self):
         """Test fetching text for valid reference"""
         result = fetch_public_scripture_text("John 3:16")
@@ -177,6 +589,232 @@ class TestScriptureTextFetching(unittest.TestCase):
         self.assertIn("John 3:16", result)
 
 
+@patch('main.SCRIPTURE_CACHE_ENABLED', False)
+@patch('main._verse_store_loaded', True)
+@patch('main._verse_store', None)
+class TestBatchedScriptureFetching(unittest.TestCase):
+    """Test batched multi-reference scripture fetching"""
+    
+    def _api_response(self, book, verses):
+        response = Mock()
+        response.raise_for_status = Mock()
+        response.json.return_value = {'verses': [
+            {'book_name': book, 'chapter': c, 'verse': v, 'text': f"{book} {c}:{v}\n"} for c, v in verses
+        ]}
+        return response
+    
+    @patch('main.requests.get')
+    def test_references_are_deduped_and_packed_per_book(self, mock_get):
+        """Test equivalent references share one passage and a book is one request"""
+        mock_get.side_effect = [
+            self._api_response('Psalms', [(23, 1), (23, 2), (23, 3), (98, 1)]),
+            self._api_response('John', [(3, 16)])
+        ]
+        
+        texts = fetch_public_scripture_texts(['Ps 23:1-3', 'Ps 23:1, 2-3', 'Ps 98:1', 'Jn 3:16', 'Ps 23:1-3'])
+        
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(mock_get.call_args_list[0].args[0], 'https://bible-api.com/Psalms+23:1-3,98:1')
+        self.assertEqual(texts['Ps 23:1-3'], 'Psalms 23:1 Psalms 23:2 Psalms 23:3')
+        self.assertEqual(texts['Ps 23:1, 2-3'], texts['Ps 23:1-3'])
+        self.assertEqual(texts['Ps 98:1'], 'Psalms 98:1')
+        self.assertEqual(texts['Jn 3:16'], 'John 3:16')
+    
+    @patch('main.SCRIPTURE_BATCH_MAX_PASSAGES', 2)
+    @patch('main.requests.get')
+    def test_batches_are_capped(self, mock_get):
+        """Test no request carries more than SCRIPTURE_BATCH_MAX_PASSAGES passages"""
+        mock_get.side_effect = [
+            self._api_response('Psalms', [(1, 1), (2, 1)]),
+            self._api_response('Psalms', [(3, 1)])
+        ]
+        
+        texts = fetch_public_scripture_texts(['Ps 1:1', 'Ps 2:1', 'Ps 3:1'])
+        
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(texts['Ps 3:1'], 'Psalms 3:1')
+    
+    @patch('main.fetch_public_scripture_text')
+    @patch('main.requests.get')
+    def test_uncovered_passage_falls_back_to_single_fetch(self, mock_get, mock_single):
+        """Test a passage missing from the combined response is fetched alone"""
+        mock_get.return_value = self._api_response('Psalms', [(1, 1)])
+        mock_single.return_value = 'single text'
+        
+        texts = fetch_public_scripture_texts(['Ps 1:1', 'Ps 2:1-2', 'Invalid Reference'])
+        
+        self.assertEqual(texts['Ps 1:1'], 'Psalms 1:1')
+        self.assertEqual(texts['Ps 2:1-2'], 'single text')
+        self.assertEqual(texts['Invalid Reference'], '')
+        mock_single.assert_called_once_with('Ps 2:1-2')
+    
+    @patch('main.fetch_public_scripture_text')
+    @patch('main.requests.get')
+    def test_rate_limited_batch_is_not_retried_per_passage(self, mock_get, mock_single):
+        """Test a 429 stops batching and leaves the passages to be fetched when seeding"""
+        mock_get.return_value = Mock(status_code=429)
+        
+        texts = fetch_public_scripture_texts(['Ps 1:1', 'Ps 2:1', 'Jn 3:16'])
+        
+        self.assertEqual(mock_get.call_count, 1)
+        mock_single.assert_not_called()
+        self.assertEqual(texts, {})
+    
+    @patch('main.requests.get')
+    def test_discontiguous_reference_fetches_only_listed_verses(self, mock_get):
+        """Test skipped verses are neither requested nor included in the text"""
+        mock_get.return_value = self._api_response('Psalms', [(98, 1), (98, 2), (98, 3), (98, 5), (98, 6)])
+        
+        texts = fetch_public_scripture_texts(['Ps 98:1, 2-3ab, 5-6'])
+        
+        self.assertEqual(mock_get.call_args.args[0], 'https://bible-api.com/Psalms+98:1-3,5-6')
+        self.assertEqual(
+            texts['Ps 98:1, 2-3ab, 5-6'],
+            'Psalms 98:1 Psalms 98:2 Psalms 98:3 Psalms 98:5 Psalms 98:6'
+        )
+    
+    @patch('main.fetch_public_scripture_text')
+    def test_resolved_reading_uses_batched_texts(self, mock_single):
+        """Test preloaded texts are not fetched again when seeding"""
+        resolved = ResolvedReading(date(2025, 12, 7), {'url': 'u'}, {'Ps 1:1': 'Psalm text'})
+        
+        self.assertEqual(resolved.scripture_text('Ps 1:1'), 'Psalm text')
+        mock_single.assert_not_called()
+
+
+@patch('main._verse_store_loaded', True)
+@patch('main._verse_store', None)
+class TestScriptureTextCache(unittest.TestCase):
+    """Test the two-tier scripture text cache"""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.db_path = os.path.join(self.tmp.name, 'cache.sqlite3')
+    
+    def _cache(self, **kwargs):
+        options = {'memory_size': 2, 'ttl_days': 30, 'max_entries': 100}
+        options.update(kwargs)
+        return ScriptureTextCache(self.db_path, **options)
+    
+    def _api_response(self, text):
+        response = Mock()
+        response.raise_for_status = Mock()
+        response.json.return_value = {'text': text}
+        return response
+    
+    @patch('main.requests.get')
+    def test_repeat_fetch_hits_memory(self, mock_get):
+        """Test the second fetch of a passage makes no HTTP call"""
+        mock_get.return_value = self._api_response('The Lord is my shepherd')
+        cache = self._cache()
+        
+        with patch('main._scripture_cache', cache):
+            first = fetch_public_scripture_text('Ps 23:1')
+            second = fetch_public_scripture_text('Psalm 23:1')
+        
+        self.assertEqual(first, second)
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(cache.snapshot(), {'memory_hits': 1, 'disk_hits': 0, 'misses': 1, 'suppressed': 0})
+    
+    def test_sqlite_tier_survives_new_instance(self):
+        """Test entries persist across processes via the SQLite file"""
+        self._cache().put('Psalms 23:1', 'text')
+        
+        cache = self._cache()
+        self.assertEqual(cache.get('Psalms 23:1'), 'text')
+        self.assertEqual(cache.get('Psalms 23:1'), 'text')
+        self.assertEqual(cache.snapshot(), {'memory_hits': 1, 'disk_hits': 1, 'misses': 0, 'suppressed': 0})
+    
+    def test_expired_entries_are_misses(self):
+        """Test entries older than the TTL are not served"""
+        self._cache().put('Psalms 23:1', 'text')
+        
+        self.assertIsNone(self._cache(ttl_days=-1).get('Psalms 23:1'))
+    
+    def test_size_eviction_keeps_recently_used(self):
+        """Test the SQLite tier evicts least recently used entries beyond max_entries"""
+        cache = self._cache(max_entries=2)
+        cache.put('a', 'A')
+        time.sleep(0.01)
+        cache.put('b', 'B')
+        time.sleep(0.01)
+        cache.put('c', 'C')
+        
+        fresh = self._cache()
+        self.assertIsNone(fresh.get('a'))
+        self.assertEqual(fresh.get('c'), 'C')
+    
+    def test_empty_text_is_not_cached(self):
+        """Test failed fetches are retried next time"""
+        cache = self._cache()
+        cache.put('Wisdom 1:1', '')
+        self.assertIsNone(cache.get('Wisdom 1:1'))
+    
+    def _not_found(self):
+        response = Mock(status_code=404)
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError('404 Not Found', response=response)
+        return response
+    
+    @patch('main.requests.get')
+    def test_unavailable_passage_is_not_requested_again(self, mock_get):
+        """Test a 404 is remembered across instances and later calls are suppressed"""
+        mock_get.return_value = self._not_found()
+        
+        with patch('main._scripture_cache', self._cache()):
+            self.assertEqual(fetch_public_scripture_text('Wis 1:1-7'), '')
+        cache = self._cache()
+        with patch('main._scripture_cache', cache):
+            self.assertEqual(fetch_public_scripture_text('Wis 1:1-7'), '')
+            self.assertEqual(fetch_public_scripture_texts(['Wis 1:1-7']), {'Wis 1:1-7': ''})
+        
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(cache.snapshot()['suppressed'], 2)
+    
+    @patch('main.requests.get')
+    def test_unavailable_passage_is_reprobed_after_interval(self, mock_get):
+        """Test unavailable passages are requested again once the re-probe interval passes"""
+        mock_get.return_value = self._not_found()
+        
+        with patch('main._scripture_cache', self._cache(reprobe_days=-1)):
+            fetch_public_scripture_text('Wis 1:1-7')
+            fetch_public_scripture_text('Wis 1:1-7')
+        
+        self.assertEqual(mock_get.call_count, 2)
+    
+    @patch('main.requests.get')
+    def test_transient_errors_are_not_remembered(self, mock_get):
+        """Test timeouts and connection errors don't mark a passage unavailable"""
+        mock_get.side_effect = requests.exceptions.ConnectionError('down')
+        cache = self._cache()
+        
+        with patch('main._scripture_cache', cache):
+            fetch_public_scripture_text('Ps 23:1')
+        
+        self.assertFalse(cache.is_unavailable('Psalms 23:1'))
+    
+    @patch('main.requests.get')
+    def test_rate_limit_is_not_remembered(self, mock_get):
+        """Test a 429 leaves the passage to be fetched again next time"""
+        response = Mock(status_code=429)
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError('429 Too Many Requests', response=response)
+        mock_get.return_value = response
+        cache = self._cache()
+        
+        with patch('main._scripture_cache', cache):
+            self.assertEqual(fetch_public_scripture_text('Ps 23:1'), '')
+        
+        self.assertFalse(cache.is_unavailable('Psalms 23:1'))
+    
+    def test_successful_fetch_clears_unavailable(self):
+        """Test text stored for a passage replaces an earlier unavailable mark"""
+        cache = self._cache()
+        cache.mark_unavailable('Psalms 23:1', 'HTTP 404')
+        cache.put('Psalms 23:1', 'text')
+        
+        self.assertFalse(self._cache().is_unavailable('Psalms 23:1'))
+
+
 class TestDailyReadingSeeding(unittest.TestCase):
     """Test daily reading seeding"""
     
@@ -222,9 +860,762 @@ class TestDailyReadingSeeding(unittest.TestCase):
         self.assertEqual(result['doc_id'], '2025-11-05')
 
 
+class TestBulkStateRead(unittest.TestCase):
+    """Test reading a range's document state with get_all"""
+    
+    def _snapshot(self, doc_id, data):
+        snapshot = Mock(id=doc_id, exists=data is not None)
+        snapshot.to_dict.return_value = data
+        return snapshot
+    
+    @patch('main.FIRESTORE_GET_ALL_CHUNK_SIZE', 2)
+    def test_states_are_read_in_chunks(self):
+        """Test get_all is called once per chunk and missing documents map to None"""
+        db = MagicMock()
+        db.collection.return_value.document.side_effect = lambda doc_id: doc_id
+        db.get_all.side_effect = lambda refs: [
+            self._snapshot(doc_id, {'id': doc_id} if doc_id != '2025-12-08' else None) for doc_id in refs
+        ]
+        
+        states = read_document_states(db, ['2025-12-07', '2025-12-08', '2025-12-09'])
+        
+        self.assertEqual(db.get_all.call_count, 2)
+        self.assertEqual(states, {
+            '2025-12-07': {'id': '2025-12-07'}, '2025-12-08': None, '2025-12-09': {'id': '2025-12-09'}
+        })
+    
+    def test_failed_bulk_read_falls_back(self):
+        """Test a failing get_all yields no states so documents are read one by one"""
+        db = MagicMock()
+        db.get_all.side_effect = Exception('unavailable')
+        
+        self.assertEqual(read_document_states(db, ['2025-12-07']), {})
+    
+    @patch('main.initialize_firebase')
+    def test_seed_uses_bulk_state(self, mock_fb):
+        """Test a document in the bulk state is not read again"""
+        doc_ref = mock_fb.return_value.collection.return_value.document.return_value
+        resolved = ResolvedReading(date(2025, 12, 7), {'url': 'u', 'responsorialPsalm': {'reference': 'Ps 1:1'}})
+        complete = {
+            'responsorial_psalm': 'text', 'responsorial_psalm_verse': 'Ps 1:1', 'responsorial_psalm_response': 'R.'
+        }
+        
+        result = seed_daily_reading(date(2025, 12, 7), False, 'primary', resolved, {'2025-12-07': complete})
+        
+        self.assertEqual(result['reason'], 'already_exists')
+        doc_ref.get.assert_not_called()
+
+
+class TestBatchedWrites(unittest.TestCase):
+    """Test committing a run's writes in WriteBatches"""
+    
+    def _queue(self, writer, doc_ids):
+        refs = {}
+        for doc_id in doc_ids:
+            refs[doc_id] = Mock()
+            writer.set(refs[doc_id], doc_id, {'id': doc_id}, True, [])
+        return refs
+    
+    def test_writes_share_commits(self):
+        """Test queued writes are committed batch_size at a time"""
+        db = MagicMock()
+        writer = FirestoreWriteBatcher(db, batch_size=2)
+        refs = self._queue(writer, ['2025-12-07', '2025-12-08', '2025-12-09'])
+        
+        failures = writer.flush()
+        
+        self.assertEqual(failures, {})
+        self.assertEqual(db.batch.return_value.commit.call_count, 2)
+        db.batch.return_value.set.assert_any_call(refs['2025-12-08'], {'id': '2025-12-08'}, merge=True)
+        self.assertEqual(writer.stats, {'writes': 3, 'commits': 2, 'failed': 0})
+        for ref in refs.values():
+            ref.set.assert_not_called()
+    
+    def test_failed_commit_reports_failed_documents(self):
+        """Test a failed batch is retried per document and only real failures are reported"""
+        db = MagicMock()
+        db.batch.return_value.commit.side_effect = Exception('batch failed')
+        writer = FirestoreWriteBatcher(db)
+        refs = self._queue(writer, ['2025-12-07', '2025-12-08'])
+        refs['2025-12-08'].set.side_effect = Exception('permission denied')
+        
+        failures = writer.flush()
+        
+        self.assertEqual(failures, {'2025-12-08': 'permission denied'})
+        refs['2025-12-07'].set.assert_called_once_with({'id': '2025-12-07'}, merge=True)
+        self.assertEqual(writer.stats, {'writes': 1, 'commits': 1, 'failed': 1})
+    
+    @patch('main.initialize_firebase')
+    def test_seed_queues_write(self, mock_fb):
+        """Test seeding with a writer queues the document instead of writing it"""
+        doc_ref = mock_fb.return_value.collection.return_value.document.return_value
+        resolved = ResolvedReading(date(2025, 12, 7), {'url': 'u', 'responsorialPsalm': {'reference': 'Ps 1:1'}},
+                                   {'Ps 1:1': 'text'})
+        writer = FirestoreWriteBatcher(MagicMock())
+        
+        result = seed_daily_reading(date(2025, 12, 7), False, 'primary', resolved, {'2025-12-07': None}, writer)
+        
+        self.assertEqual(result['status'], 'success')
+        doc_ref.set.assert_not_called()
+        self.assertEqual(writer.flush(), {})
+        self.assertEqual(writer.stats['writes'], 1)
+    
+    @patch('main.FIRESTORE_BATCH_WRITES', True)
+    @patch('main.USCCB_PREFETCH', False)
+    @patch('main.initialize_firebase')
+    @patch('main.seed_daily_reading')
+    def test_failed_write_becomes_date_error(self, mock_seed, mock_fb):
+        """Test a date whose batched write fails is reported as an error"""
+        def seed(target_date, dry_run, project, resolved, states, writer):
+            doc_id = target_date.isoformat()
+            writer.set(Mock(), doc_id, {}, True, [])
+            return {'status': 'success', 'doc_id': doc_id}
+        mock_seed.side_effect = seed
+        mock_fb.return_value.get_all.return_value = []
+        
+        with patch.object(FirestoreWriteBatcher, 'flush', return_value={'2025-12-08': 'deadline exceeded'}):
+            results, report = _seed_dates_threaded([date(2025, 12, 7), date(2025, 12, 8)], False, True, False, False)
+        
+        self.assertEqual(results[0]['status'], 'success')
+        self.assertEqual(results[1], {'status': 'error', 'doc_id': '2025-12-08', 'error': 'deadline exceeded'})
+        self.assertIn('primary', report['writes'])
+
+
+class TestChunkReports(unittest.TestCase):
+    """Test a run's response adds up the engine reports of its chunks"""
+    
+    CHUNKS = [
+        {'state_reads': {'primary': {'documents': 2, 'loaded': 2}},
+         'plan': {'summary': {'create': 1, 'skip': 1}, 'estimate': {'firestore_writes': 1}},
+         'prefetch': {'dates': 2, 'fetched': 2, 'workers': 2, 'wall_seconds': 0.5},
+         'seed_workers': 2, 'writes': {'primary': {'writes': 1, 'commits': 1, 'failed': 0}}, 'writes_avoided': 1},
+        {'state_reads': {'primary': {'documents': 3, 'loaded': 1}},
+         'plan': {'summary': {'create': 3, 'skip': 0}, 'estimate': {'firestore_writes': 3}},
+         'prefetch': {'dates': 3, 'fetched': 2, 'workers': 3, 'wall_seconds': 0.25},
+         'seed_workers': 3, 'writes': {'primary': {'writes': 3, 'commits': 1, 'failed': 1}}, 'writes_avoided': 0},
+    ]
+    
+    def _assert_totals(self, results):
+        self.assertEqual(results['state_reads'], {'primary': {'documents': 5, 'loaded': 3}})
+        self.assertEqual(results['plan'], {'summary': {'create': 4, 'skip': 1}, 'estimate': {'firestore_writes': 4}})
+        self.assertEqual(results['prefetch'], {'dates': 5, 'fetched': 4, 'workers': 3, 'wall_seconds': 0.75})
+        self.assertEqual(results['writes'], {'primary': {'writes': 4, 'commits': 2, 'failed': 1}})
+        self.assertEqual(results['writes_avoided'], 1)
+    
+    @patch('main.SEEDER_ENGINE', 'threads')
+    @patch('main._seed_dates_threaded')
+    def test_threaded_chunks_are_summed(self, mock_seed):
+        """Test two threaded chunks report the run's totals"""
+        mock_seed.side_effect = [([], dict(report)) for report in self.CHUNKS]
+        results = {}
+        
+        for _ in self.CHUNKS:
+            _seed_date_range([], False, True, False, False, results)
+        
+        self._assert_totals(results)
+        self.assertEqual(results['seed_workers'], 3)
+    
+    @patch('main.SEEDER_ENGINE', 'async')
+    def test_async_chunks_are_summed(self):
+        """Test two asyncio chunks report the run's totals"""
+        import async_seeder
+        reports = iter(self.CHUNKS)
+        
+        async def seed_dates(*args, report=None, **kwargs):
+            report.update(next(reports))
+            return []
+        
+        results = {}
+        with patch.object(async_seeder, 'seed_dates', seed_dates), \
+                patch.object(async_seeder, 'async_firestore_clients', return_value={}):
+            for _ in self.CHUNKS:
+                _seed_date_range([], False, True, False, False, results)
+        
+        self._assert_totals(results)
+
+
+class FakeCleanupCollection:
+    """daily_scripture for the cleanup: an ordered key-range query over document IDs"""
+    
+    def __init__(self, doc_ids):
+        self.doc_ids = sorted(doc_ids)
+        self.streamed = []
+        self.commits = 0
+        self.fail_commits = False
+        self.fail_deletes = set()
+        self._filter = self._after = self._limit = None
+    
+    def _query(self, **changes):
+        query = FakeCleanupCollection.__new__(FakeCleanupCollection)
+        query.__dict__.update(self.__dict__, **changes)
+        query.root = getattr(self, 'root', self)
+        return query
+    
+    def document(self, doc_id):
+        root = getattr(self, 'root', self)
+        ref = Mock(id=doc_id)
+        
+        def delete():
+            if doc_id in root.fail_deletes:
+                raise Exception('permission denied')
+            root.doc_ids.remove(doc_id)
+        ref.delete.side_effect = delete
+        return ref
+    
+    def where(self, filter):
+        return self._query(_filter=filter)
+    
+    def order_by(self, field):
+        return self
+    
+    def select(self, fields):
+        return self
+    
+    def limit(self, count):
+        return self._query(_limit=count)
+    
+    def start_after(self, snapshot):
+        return self._query(_after=snapshot.id)
+    
+    def stream(self):
+        root = self.root
+        page = [doc_id for doc_id in root.doc_ids
+                if doc_id < self._filter.value.id and (self._after is None or doc_id > self._after)][:self._limit]
+        root.streamed.extend(page)
+        return iter([Mock(id=doc_id) for doc_id in page])
+    
+    def batch(self):
+        batch = Mock()
+        refs = []
+        batch.delete.side_effect = refs.append
+        
+        def commit():
+            if self.fail_commits:
+                raise Exception('batch failed')
+            self.commits += 1
+            for ref in refs:
+                ref.delete()
+        batch.commit.side_effect = commit
+        return batch
+
+
+@patch('main.FIRESTORE_BATCH_WRITES', True)
+@patch('main.CLEANUP_PAGE_SIZE', 2)
+@patch('main.initialize_firebase')
+class TestOldReadingCleanup(unittest.TestCase):
+    """Test the cleanup pages through old document IDs and deletes them in batches"""
+    
+    OLD = ['2026-01-01', '2026-01-02', '2026-01-03', '2026-01-04', '2026-01-05']
+    
+    def _db(self, mock_fb, collection):
+        mock_fb.return_value.collection.return_value = collection
+        mock_fb.return_value.batch.side_effect = collection.batch
+    
+    def test_only_old_documents_are_read(self, mock_fb):
+        """Test documents from the cutoff on are never read and old ones go in page-sized batches"""
+        collection = FakeCleanupCollection(self.OLD + ['2026-02-01', '2026-03-01'])
+        self._db(mock_fb, collection)
+        
+        result = delete_old_readings(date(2026, 2, 1))
+        
+        self.assertEqual(result, {'status': 'success', 'deleted_count': 5, 'errors': []})
+        self.assertEqual(collection.streamed, self.OLD)
+        self.assertEqual(collection.commits, 3)
+        self.assertEqual(collection.doc_ids, ['2026-02-01', '2026-03-01'])
+    
+    def test_dry_run_deletes_nothing(self, mock_fb):
+        """Test a dry run counts the old documents without deleting them"""
+        collection = FakeCleanupCollection(self.OLD + ['1-not-a-date'])
+        self._db(mock_fb, collection)
+        
+        result = delete_old_readings(date(2026, 2, 1), dry_run=True)
+        
+        self.assertEqual(result['deleted_count'], 5)
+        self.assertEqual(collection.commits, 0)
+        self.assertEqual(len(collection.doc_ids), 6)
+    
+    def test_failed_batch_is_retried_per_document(self, mock_fb):
+        """Test a failed batch falls back to single deletes and reports only real failures"""
+        collection = FakeCleanupCollection(self.OLD[:2])
+        collection.fail_commits = True
+        collection.fail_deletes = {'2026-01-02'}
+        self._db(mock_fb, collection)
+        
+        result = delete_old_readings(date(2026, 2, 1))
+        
+        self.assertEqual(result['deleted_count'], 1)
+        self.assertEqual(result['errors'], [{'doc_id': '2026-01-02', 'error': 'permission denied'}])
+        self.assertEqual(collection.doc_ids, ['2026-01-02'])
+
+
+class TestSeedPlan(unittest.TestCase):
+    """Test planning a run from document state read in bulk"""
+    
+    COMPLETE = {'responsorial_psalm': 'text', 'responsorial_psalm_verse': 'Ps 1:1', 'responsorial_psalm_response': 'R.'}
+    
+    def test_document_deltas(self):
+        """Test each document state maps to the action seeding will take"""
+        day = date(2025, 12, 7)
+        
+        self.assertEqual(plan_document_delta(day, None), {'action': 'create'})
+        self.assertEqual(plan_document_delta(day, {'gospel_verse': 'John 3:16'}), {'action': 'overwrite'})
+        self.assertEqual(plan_document_delta(day, self.COMPLETE), {'action': 'skip'})
+        self.assertEqual(
+            plan_document_delta(day, {'responsorial_psalm_verse': 'Ps 1:1'}),
+            {'action': 'patch', 'fields': ['responsorial_psalm_response', 'responsorial_psalm']}
+        )
+    
+    def test_page_without_refrain_is_settled_after_one_fetch(self):
+        """Test a date whose USCCB page has no refrain stops being patched once checked"""
+        day = date(2025, 12, 7)
+        existing = {'responsorial_psalm': 'text', 'responsorial_psalm_verse': 'Ps 1:1'}
+        usccb_reading = {'responsorialPsalm': {'reference': 'Ps 1:1', 'response': ''}}
+        self.assertEqual(plan_document_delta(day, existing),
+                         {'action': 'patch', 'fields': ['responsorial_psalm_response']})
+        
+        plan = plan_daily_reading(day, existing, usccb_reading, lambda ref: 'text')
+        
+        self.assertEqual(plan['action'], 'write')
+        self.assertIs(plan['data']['responsorial_psalm_response_unavailable'], True)
+        patched = {**existing, **plan['data']}
+        self.assertEqual(plan_document_delta(day, patched), {'action': 'skip'})
+        self.assertEqual(plan_daily_reading(day, patched, usccb_reading, lambda ref: 'text')['result']['reason'],
+                         'already_exists')
+    
+    def test_new_document_without_refrain_is_settled(self):
+        """Test a document created from a page without a refrain isn't planned as a patch"""
+        day = date(2025, 12, 7)
+        usccb_reading = {'url': 'u', 'responsorialPsalm': {'reference': 'Ps 1:1', 'response': ''}}
+        
+        plan = plan_daily_reading(day, None, usccb_reading, lambda ref: 'text')
+        
+        self.assertEqual(plan_document_delta(day, plan['data']), {'action': 'skip'})
+    
+    @patch('main.FIRESTORE_BATCH_WRITES', True)
+    def test_plan_and_estimate(self):
+        """Test the plan covers every date and project and estimates only the deltas"""
+        dates = [date(2025, 12, day) for day in (7, 8, 9)]
+        states = {
+            'primary': {'2025-12-07': self.COMPLETE, '2025-12-08': self.COMPLETE, '2025-12-09': None},
+            'secondary': {'2025-12-07': self.COMPLETE, '2025-12-08': {'responsorial_psalm': 'text'}},
+        }
+        
+        plan = build_seed_plan(dates, states)
+        
+        self.assertEqual(plan['pending_dates'], ['2025-12-08', '2025-12-09'])
+        self.assertEqual(plan['dates']['2025-12-08']['primary'], {'action': 'skip'})
+        self.assertEqual(plan['dates']['2025-12-09']['secondary'], {'action': 'unknown'})
+        self.assertEqual(plan['summary'], {'create': 1, 'overwrite': 0, 'patch': 1, 'skip': 3, 'unknown': 1})
+        self.assertEqual(plan['estimate'], {
+            'usccb_requests': 2, 'scripture_passages': 4, 'firestore_reads': 3,
+            'firestore_writes': 3, 'firestore_commits': 2,
+        })
+    
+    @patch('main.initialize_firebase')
+    @patch('main.prefetch_usccb_readings')
+    @patch('main.seed_daily_reading')
+    def test_complete_range_is_a_no_op(self, mock_seed, mock_prefetch, mock_fb):
+        """Test a fully seeded range makes no HTTP requests and no writes"""
+        db = mock_fb.return_value
+        db.collection.return_value.document.side_effect = lambda doc_id: Mock(doc_id=doc_id)
+        db.get_all.side_effect = lambda refs: [
+            Mock(id=ref.doc_id, exists=True, to_dict=Mock(return_value=self.COMPLETE)) for ref in refs
+        ]
+        dates = [date(2025, 12, day) for day in (7, 8, 9)]
+        
+        results, report = _seed_dates_threaded(dates, False, True, False, False)
+        
+        self.assertEqual([r['reason'] for r in results], ['already_exists'] * 3)
+        self.assertEqual(report['plan']['estimate']['usccb_requests'], 0)
+        mock_seed.assert_not_called()
+        mock_prefetch.assert_not_called()
+        db.batch.assert_not_called()
+    
+    @patch('main.initialize_firebase')
+    @patch('main.delete_old_readings')
+    @patch('main._seed_dates_threaded')
+    def test_plan_mode_changes_nothing(self, mock_threaded, mock_delete, mock_fb):
+        """Test ?mode=plan returns the plan without cleaning up or seeding"""
+        mock_fb.return_value.get_all.return_value = []
+        request = Mock(method='GET', args={'start_date': '2025-12-01', 'end_date': '2025-12-03', 'mode': 'plan'})
+        
+        with patch.dict(os.environ, {'FIREBASE_CREDENTIALS_JSON': '{}'}):
+            response, status_code = seed_daily_readings_cron(request)
+        
+        self.assertEqual(status_code, 200)
+        body = response['body']
+        self.assertEqual(body['mode'], 'plan')
+        self.assertEqual(list(body['plan']['dates']), ['2025-12-01', '2025-12-02', '2025-12-03'])
+        mock_delete.assert_not_called()
+        mock_threaded.assert_not_called()
+
+
+class TestDeadlineScheduling(unittest.TestCase):
+    """Test seeding against the function timeout"""
+    
+    def test_nearest_dates_first(self):
+        """Test upcoming dates come first, nearest first, then past dates"""
+        dates = [date(2025, 12, day) for day in (1, 5, 9, 10, 20)]
+        
+        self.assertEqual(
+            prioritize_dates(dates, today=date(2025, 12, 9)),
+            [date(2025, 12, 9), date(2025, 12, 10), date(2025, 12, 20), date(2025, 12, 5), date(2025, 12, 1)]
+        )
+    
+    def test_timeouts_fit_the_deadline(self):
+        """Test per-call timeouts shrink with the time left but never below the floor"""
+        self.assertEqual(Deadline(300).timeout(30), 30)
+        self.assertLessEqual(Deadline(5).timeout(30), 5)
+        self.assertEqual(Deadline(-1).timeout(30), Deadline.MIN_TIMEOUT_SECONDS)
+        self.assertTrue(Deadline(-1).expired())
+    
+    @patch('main.fetch_usccb_reading_data')
+    def test_prefetch_stops_at_deadline(self, mock_fetch):
+        """Test no USCCB page is requested once the deadline has passed"""
+        fetched, stats = prefetch_usccb_readings([date(2025, 12, 7)], deadline=Deadline(-1))
+        
+        self.assertEqual(fetched, {})
+        mock_fetch.assert_not_called()
+    
+    @patch('main.fetch_usccb_reading_data')
+    def test_prefetch_passes_timeout_down(self, mock_fetch):
+        """Test USCCB requests get a timeout cut to the time left"""
+        prefetch_usccb_readings([date(2025, 12, 7)], deadline=Deadline(5))
+        
+        self.assertLessEqual(mock_fetch.call_args.kwargs['timeout'], 5)
+    
+    @patch('main.initialize_firebase')
+    @patch('main.seed_daily_reading')
+    def test_expired_deadline_defers_dates(self, mock_seed, mock_fb):
+        """Test dates not started before the deadline come back deferred"""
+        mock_fb.return_value.get_all.return_value = []
+        
+        results, _ = _seed_dates_threaded([date(2025, 12, 7)], False, True, False, False, Deadline(-1))
+        
+        self.assertEqual(results, [{'status': 'deferred', 'doc_id': '2025-12-07', 'reason': 'deadline'}])
+        mock_seed.assert_not_called()
+    
+    @patch('main.DEADLINE_RESERVE_SECONDS', 600)
+    @patch('main.initialize_firebase')
+    @patch('main.delete_old_readings', new=Mock(return_value={'deleted_count': 0, 'errors': []}))
+    @patch('main._seed_date_range')
+    def test_cron_reports_deferred_dates(self, mock_seed_range, mock_fb):
+        """Test a run out of time lists the dates it left in date order"""
+        request = Mock(method='GET', args={'start_date': '2025-12-01', 'end_date': '2025-12-03'})
+        
+        with patch.dict(os.environ, {'FIREBASE_CREDENTIALS_JSON': '{}'}):
+            response, status_code = seed_daily_readings_cron(request)
+        
+        self.assertEqual(status_code, 200)
+        self.assertEqual(response['body']['deferred'], ['2025-12-01', '2025-12-02', '2025-12-03'])
+        self.assertEqual(response['body']['processed_dates'], [])
+        mock_seed_range.assert_not_called()
+
+
+class TestContentHash(unittest.TestCase):
+    """Test skipping writes that would not change a document"""
+    
+    USCCB = {'url': 'u', 'gospel': {'reference': 'Mt 3:1-12'}, 'responsorialPsalm': {'reference': 'Ps 72:1-2'}}
+    # Psalm refrain missing, and USCCB has none to add
+    EXISTING = {'id': '2025-12-07', 'responsorial_psalm': 'text', 'responsorial_psalm_verse': 'Ps 72:1-2'}
+    
+    def _plan(self, existing):
+        return plan_daily_reading(date(2025, 12, 7), existing, self.USCCB, lambda ref: f"text of {ref}")
+    
+    def test_new_document_carries_hash(self):
+        """Test created documents store the hash of their reading fields"""
+        plan = self._plan(None)
+        
+        self.assertEqual(plan['data']['content_hash'], reading_content_hash(plan['data']))
+    
+    def test_hash_ignores_bookkeeping_fields(self):
+        """Test timestamps and the hash itself don't change the hash"""
+        self.assertEqual(
+            reading_content_hash(self.EXISTING),
+            reading_content_hash({**self.EXISTING, 'updatedAt': 'now', 'content_hash': 'x'})
+        )
+    
+    def test_missing_refrain_is_written_once(self):
+        """Test a refrain USCCB doesn't have costs one marker write, with or without a stored hash"""
+        stored = {**self.EXISTING, 'content_hash': reading_content_hash(self.EXISTING)}
+        
+        for existing in (self.EXISTING, stored):
+            plan = self._plan(existing)
+            self.assertEqual(plan['action'], 'write')
+            self.assertEqual(set(plan['data']) - {'updatedAt', 'content_hash'},
+                             {'responsorial_psalm_response_unavailable'})
+            
+            plan = self._plan({**existing, **plan['data']})
+            self.assertEqual(plan['action'], 'done')
+            self.assertEqual(plan['result']['reason'], 'already_exists')
+    
+    def test_externally_edited_document_is_repaired(self):
+        """Test a reading field cleared by another writer is refilled despite a stale stored hash"""
+        seeded = {**self.EXISTING, 'responsorial_psalm': 'text of Ps 72:1-2'}
+        # Another writer cleared the psalm without touching content_hash
+        edited = {**seeded, 'responsorial_psalm': None, 'content_hash': reading_content_hash(seeded)}
+        
+        plan = self._plan(edited)
+        
+        self.assertEqual(plan['action'], 'write')
+        self.assertEqual(plan['data']['responsorial_psalm'], 'text of Ps 72:1-2')
+    
+    def test_changed_document_gets_new_hash(self):
+        """Test a real update writes the hash of the merged document"""
+        existing = {'id': '2025-12-07', 'responsorial_psalm': 'text'}
+        
+        plan = self._plan(existing)
+        
+        self.assertEqual(plan['action'], 'write')
+        self.assertEqual(plan['data']['content_hash'], reading_content_hash({**existing, **plan['data']}))
+    
+    @patch('main.USCCB_PREFETCH', False)
+    @patch('main.FIRESTORE_BATCH_WRITES', False)
+    @patch('main.fetch_public_scripture_text', return_value='')
+    @patch('main.fetch_usccb_reading_data')
+    @patch('main.initialize_firebase')
+    def test_reseeding_unavailable_psalm_is_not_written(self, mock_fb, mock_usccb, mock_text):
+        """Test a psalm text still unavailable on the next run costs no write, and the run counts it"""
+        mock_usccb.return_value = {**self.USCCB, 'responsorialPsalm': {'reference': 'Dn 3:52', 'response': 'Glory'}}
+        stored, writes = {}, []
+        
+        def document(doc_id):
+            def set_data(data, merge):
+                writes.append(doc_id)
+                stored[doc_id] = {**stored.get(doc_id, {}), **data} if merge else dict(data)
+            return Mock(doc_id=doc_id, set=Mock(side_effect=set_data))
+        db = mock_fb.return_value
+        db.collection.return_value.document.side_effect = document
+        db.get_all.side_effect = lambda refs: [
+            Mock(id=ref.doc_id, exists=ref.doc_id in stored, to_dict=Mock(return_value=dict(stored.get(ref.doc_id, {}))))
+            for ref in refs
+        ]
+        
+        first, report = _seed_dates_threaded([date(2025, 12, 7)], False, True, False, False)
+        self.assertEqual(first[0]['status'], 'success')
+        self.assertEqual(stored['2025-12-07']['responsorial_psalm'], '[Text not available - see Dn 3:52 at USCCB]')
+        self.assertEqual(report['writes_avoided'], 0)
+        
+        second, report = _seed_dates_threaded([date(2025, 12, 7)], False, True, False, False)
+        
+        self.assertEqual(second[0]['reason'], 'unchanged')
+        self.assertEqual(report['plan']['summary']['patch'], 1)
+        self.assertEqual(report['writes_avoided'], 1)
+        self.assertEqual(writes, ['2025-12-07'])
+        self.assertEqual(mock_text.call_args[0][0], 'Dn 3:52')
+    
+    def test_placeholder_psalm_is_looked_up_again(self):
+        """Test psalm text that was unavailable is written once a source has it"""
+        existing = {**self.EXISTING, 'responsorial_psalm': '[Text not available - see Ps 72:1-2 at USCCB]',
+                    'responsorial_psalm_response_unavailable': True}
+        
+        self.assertEqual(plan_document_delta(date(2025, 12, 7), existing),
+                         {'action': 'patch', 'fields': ['responsorial_psalm']})
+        plan = self._plan(existing)
+        
+        self.assertEqual(plan['action'], 'write')
+        self.assertEqual(plan['data']['responsorial_psalm'], 'text of Ps 72:1-2')
+    
+    def test_count_unchanged(self):
+        """Test avoided writes are counted over every date and project"""
+        unchanged = {'status': 'skipped', 'reason': 'unchanged'}
+        
+        self.assertEqual(count_unchanged([
+            {'primary': unchanged, 'secondary': unchanged},
+            {'primary': {'status': 'success'}, 'secondary': None},
+        ]), 2)
+
+
+@patch('main.initialize_firebase')
+@patch('main.delete_old_readings', new=Mock(return_value={'deleted_count': 0, 'errors': []}))
+@patch('main.prioritize_dates', new=lambda target_dates, today=None: list(target_dates))
+class TestStreamingResponse(unittest.TestCase):
+    """Test the NDJSON streaming response"""
+    
+    def _stream(self, mock_seed_range, args):
+        def seed_range(target_dates, *rest):
+            return [
+                {'status': 'error', 'error': 'Test error'} if d.day == 2 else {'status': 'success', 'doc_id': d.isoformat()}
+                for d in target_dates
+            ]
+        mock_seed_range.side_effect = seed_range
+        with patch.dict(os.environ, {'FIREBASE_CREDENTIALS_JSON': '{}'}):
+            response = seed_daily_readings_cron(Mock(method='GET', args=args))
+        return response, [json.loads(line) for line in response.response]
+    
+    @patch('run_state.SEED_CHECKPOINT_DAYS', 2)
+    @patch('main._seed_date_range')
+    def test_one_line_per_date_then_summary(self, mock_seed_range, mock_fb):
+        """Test each date gets a compact line as its chunk commits, followed by a summary"""
+        response, lines = self._stream(
+            mock_seed_range, {'start_date': '2025-12-01', 'end_date': '2025-12-03', 'format': 'ndjson'}
+        )
+        
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        self.assertEqual(lines[:3], [
+            {'date': '2025-12-01', 'status': 'success'},
+            {'date': '2025-12-02', 'status': 'error', 'error': 'Test error'},
+            {'date': '2025-12-03', 'status': 'success'},
+        ])
+        summary = lines[3]
+        self.assertEqual(summary['type'], 'summary')
+        self.assertEqual(
+            (summary['processed_dates_count'], summary['successful_count'], summary['errors_count']), (3, 2, 1)
+        )
+        self.assertNotIn('successful', summary)
+        self.assertEqual(mock_seed_range.call_count, 2)
+    
+    @patch('main._seed_date_range')
+    def test_failure_mid_stream_ends_with_error_summary(self, mock_seed_range, mock_fb):
+        """Test an exception after streaming started still ends the stream with a summary"""
+        mock_seed_range.side_effect = Exception('Firestore unavailable')
+        
+        with patch.dict(os.environ, {'FIREBASE_CREDENTIALS_JSON': '{}'}):
+            response = seed_daily_readings_cron(Mock(method='GET', args={
+                'start_date': '2025-12-01', 'end_date': '2025-12-01', 'format': 'ndjson'
+            }))
+        lines = [json.loads(line) for line in response.response]
+        
+        self.assertEqual(lines, [{'type': 'summary', 'status': 'error', 'message': 'Firestore unavailable'}])
+
+
+class FixedDate(date):
+    """date whose today() is 2025-12-07"""
+    
+    @classmethod
+    def today(cls):
+        return cls(2025, 12, 7)
+
+
+@patch('main.date', FixedDate)
+@patch('main.initialize_firebase')
+@patch('main.delete_old_readings', new=Mock(return_value={'deleted_count': 0, 'errors': []}))
+@patch('main._seed_date_range')
+class TestRollingSchedule(unittest.TestCase):
+    """Test the rolling-horizon schedule"""
+    
+    def _run(self, args):
+        def seed_range(target_dates, *rest):
+            return [{'status': 'success'} for _ in target_dates]
+        self.mock_seed_range.side_effect = seed_range
+        with patch.dict(os.environ, {'FIREBASE_CREDENTIALS_JSON': '{}'}):
+            return seed_daily_readings_cron(Mock(method='GET', args=args))
+    
+    @patch('main.SEED_SCHEDULE', 'rolling')
+    @patch('main.SEED_HORIZON_DAYS', 3)
+    def test_seeds_the_next_days(self, mock_seed_range, mock_fb):
+        """Test a rolling run covers today and the following days across month ends"""
+        self.mock_seed_range = mock_seed_range
+        
+        response, status_code = self._run({})
+        
+        self.assertEqual(status_code, 200)
+        self.assertEqual(response['body']['schedule'], 'rolling')
+        self.assertEqual(response['body']['successful'], ['2025-12-07', '2025-12-08', '2025-12-09'])
+    
+    def test_schedule_and_horizon_from_request(self, mock_seed_range, mock_fb):
+        """Test ?schedule=rolling&horizon_days=N overrides the configuration, across month ends"""
+        self.mock_seed_range = mock_seed_range
+        
+        response, _ = self._run({'schedule': 'rolling', 'horizon_days': '27'})
+        
+        successful = response['body']['successful']
+        self.assertEqual((successful[0], successful[-1], len(successful)), ('2025-12-07', '2026-01-02', 27))
+    
+    def test_invalid_horizon_is_rejected(self, mock_seed_range, mock_fb):
+        """Test a horizon that isn't a positive number of days is a 400"""
+        self.mock_seed_range = mock_seed_range
+        
+        _, status_code = self._run({'schedule': 'rolling', 'horizon_days': '0'})
+        
+        self.assertEqual(status_code, 400)
+    
+    def test_monthly_is_the_default(self, mock_seed_range, mock_fb):
+        """Test without configuration the run seeds next month"""
+        self.mock_seed_range = mock_seed_range
+        
+        response, _ = self._run({})
+        
+        self.assertEqual(response['body']['schedule'], 'monthly')
+        self.assertEqual(response['body']['start_date'], '2026-01-01')
+
+
+class TestResolvedReading(unittest.TestCase):
+    """Test per-run reading resolution shared by all projects"""
+    
+    USCCB = {
+        'url': 'https://test.com',
+        'reading1': {'reference': 'Is 11:1-10'},
+        'responsorialPsalm': {'reference': 'Ps 72:1-2', 'response': 'Justice shall flourish'},
+        'gospel': {'reference': 'Mt 3:1-12'}
+    }
+    
+    @patch('main.initialize_firebase')
+    @patch('main.fetch_usccb_reading_data')
+    @patch('main.fetch_public_scripture_text')
+    def test_projects_share_one_fetch(self, mock_text, mock_usccb, mock_fb):
+        """Test seeding two projects fetches USCCB and each passage once"""
+        mock_fb.return_value.collection.return_value.document.return_value.get.return_value.exists = False
+        mock_usccb.return_value = self.USCCB
+        mock_text.side_effect = lambda ref: f"Text of {ref}"
+        
+        resolved = ResolvedReading(date(2025, 12, 7))
+        primary = seed_daily_reading(date(2025, 12, 7), dry_run=False, project='primary', resolved=resolved)
+        secondary = seed_daily_reading(date(2025, 12, 7), dry_run=False, project='secondary', resolved=resolved)
+        
+        self.assertEqual(primary['status'], 'success')
+        self.assertEqual(secondary['status'], 'success')
+        mock_usccb.assert_called_once_with(date(2025, 12, 7))
+        self.assertEqual(sorted(call.args[0] for call in mock_text.call_args_list),
+                         ['Is 11:1-10', 'Mt 3:1-12', 'Ps 72:1-2'])
+    
+    @patch('main.fetch_usccb_reading_data')
+    def test_payload_is_read_only(self, mock_usccb):
+        """Test the shared USCCB payload cannot be modified by a writer"""
+        mock_usccb.return_value = self.USCCB
+        resolved = ResolvedReading(date(2025, 12, 7))
+        
+        with self.assertRaises(TypeError):
+            resolved.usccb['gospel']['reference'] = 'John 3:16'
+        self.assertEqual(resolved.usccb['gospel']['reference'], 'Mt 3:1-12')
+    
+    @patch('main.fetch_usccb_reading_data')
+    def test_failed_fetch_is_not_retried_per_project(self, mock_usccb):
+        """Test an unavailable USCCB page is only requested once"""
+        mock_usccb.return_value = None
+        resolved = ResolvedReading(date(2025, 12, 7))
+        
+        self.assertIsNone(resolved.usccb)
+        self.assertIsNone(resolved.usccb)
+        mock_usccb.assert_called_once()
+    
+    @patch('main.initialize_firebase')
+    @patch('main.fetch_usccb_reading_data')
+    @patch('main.fetch_public_scripture_text')
+    def test_default_data_is_overwritten_in_place(self, mock_text, mock_usccb, mock_fb):
+        """Test a John 3:16 default document is repaired with one set and no delete or re-read"""
+        mock_usccb.return_value = self.USCCB
+        mock_text.side_effect = lambda ref: f"text of {ref}"
+        doc_ref = mock_fb.return_value.collection.return_value.document.return_value
+        doc_ref.get.return_value = Mock(exists=True, to_dict=Mock(return_value={'gospel_verse': 'John 3:16'}))
+        
+        result = seed_daily_reading(date(2025, 12, 7))
+        
+        self.assertEqual(result, {'status': 'success', 'doc_id': '2025-12-07'})
+        doc_ref.get.assert_called_once()
+        doc_ref.delete.assert_not_called()
+        mock_usccb.assert_called_once()
+        data, = doc_ref.set.call_args.args
+        self.assertFalse(doc_ref.set.call_args.kwargs['merge'])
+        self.assertEqual(data['gospel_verse'], 'Mt 3:1-12')
+        self.assertEqual(data['gospel'], 'text of Mt 3:1-12')
+
+
 class TestCloudFunction(unittest.TestCase):
     """Test the Cloud Function entry point"""
     
+    @patch('main.MIN_REQUEST_INTERVAL_SECONDS', 0)
+    @patch('main.fetch_usccb_reading_data', new=Mock(return_value=None))
     @patch('main.initialize_firebase')
     @patch('main.seed_daily_reading')
     def test_seed_daily_readings_cron_success(self, mock_seed, mock_fb):
@@ -242,6 +1633,8 @@ class TestCloudFunction(unittest.TestCase):
         self.assertEqual(response['body']['status'], 'success')
         self.assertEqual(response['body']['days_seeded'], 3)
     
+    @patch('main.MIN_REQUEST_INTERVAL_SECONDS', 0)
+    @patch('main.fetch_usccb_reading_data', new=Mock(return_value=None))
     @patch('main.initialize_firebase')
     @patch('main.seed_daily_reading')
     def test_seed_daily_readings_cron_dry_run(self, mock_seed, mock_fb):
@@ -258,6 +1651,8 @@ class TestCloudFunction(unittest.TestCase):
             self.assertEqual(status_code, 200)
             self.assertEqual(response['body']['status'], 'success')
     
+    @patch('main.MIN_REQUEST_INTERVAL_SECONDS', 0)
+    @patch('main.fetch_usccb_reading_data', new=Mock(return_value=None))
     @patch('main.initialize_firebase')
     @patch('main.seed_daily_reading')
     def test_seed_daily_readings_cron_with_errors(self, mock_seed, mock_fb):
@@ -277,7 +1672,55 @@ class TestCloudFunction(unittest.TestCase):
         self.assertEqual(status_code, 200)
         self.assertEqual(len(response['body']['errors']), 1)
         self.assertEqual(len(response['body']['successful']), 1)
-
+    
+    @patch('main.SEED_WORKERS', 4)
+    @patch('main.MIN_REQUEST_INTERVAL_SECONDS', 0)
+    @patch('main.fetch_usccb_reading_data', new=Mock(return_value=None))
+    @patch('main.initialize_firebase')
+    @patch('main.seed_daily_reading')
+    def test_parallel_seeding_keeps_date_order(self, mock_seed, mock_fb):
+        """Test dates seeded in parallel are reported in date order"""
+        mock_request = Mock()
+        mock_request.method = 'GET'
+        mock_request.args = {'start_date': '2025-11-01', 'end_date': '2025-11-08'}
+        
+        def seed(target_date, dry_run, project, resolved, states=None, writer=None):
+            # Earlier dates finish last
+            time.sleep((9 - target_date.day) * 0.005)
+            if target_date.day == 3:
+                return {'status': 'error', 'doc_id': '2025-11-03', 'error': 'Test error'}
+            return {'status': 'success', 'doc_id': target_date.isoformat()}
+        mock_seed.side_effect = seed
+        
+        with patch.dict(os.environ, {'FIREBASE_CREDENTIALS_JSON': '{}'}):
+            response, status_code = seed_daily_readings_cron(mock_request)
+        
+        body = response['body']
+        expected = [f"2025-11-{day:02d}" for day in range(1, 9)]
+        self.assertEqual(status_code, 200)
+        self.assertEqual(body['seed_workers'], 4)
+        self.assertEqual(body['processed_dates'], expected)
+        self.assertEqual(body['successful'], [d for d in expected if d != '2025-11-03'])
+        self.assertEqual(body['errors'], [{'date': '2025-11-03', 'error': 'Test error'}])
+    
+    @patch('main._db', None)
+    @patch('main._get_firebase_credentials', new=Mock(return_value=None))
+    @patch('main.firebase_admin.get_app')
+    @patch('main.firestore.client')
+    def test_initialize_firebase_is_thread_safe(self, mock_client, mock_get_app):
+        """Test concurrent callers create the primary client only once"""
+        def create(app):
+            time.sleep(0.01)
+            return Mock()
+        mock_client.side_effect = create
+        
+        threads = [threading.Thread(target=initialize_firebase) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        mock_client.assert_called_once()
 
 if __name__ == '__main__':
     unittest.main()
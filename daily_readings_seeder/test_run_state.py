@@ -0,0 +1,296 @@
+"""
+Unit tests for run checkpoints and resumable seeding
+"""
+import os
+import tempfile
+import threading
+import time
+import unittest
+from datetime import date
+from unittest.mock import MagicMock, Mock, patch
+
+import main
+import run_state
+
+
+class TestCheckpointStores(unittest.TestCase):
+    """Test saving and loading checkpoints"""
+
+    def test_file_store_round_trip(self):
+        """Test a saved checkpoint loads back and unknown runs load as None"""
+        with tempfile.TemporaryDirectory() as tmp:
+            store = run_state.FileCheckpointStore(os.path.join(tmp, 'runs'))
+            self.assertIsNone(store.load('backfill'))
+
+            store.save('backfill', {'run_id': 'backfill', 'processed_dates': ['2026-01-01']})
+
+            self.assertEqual(store.load('backfill'), {'run_id': 'backfill', 'processed_dates': ['2026-01-01']})
+            self.assertEqual(os.listdir(os.path.join(tmp, 'runs')), ['backfill.json'])
+
+    def test_firestore_store_uses_run_document(self):
+        """Test checkpoints are kept in seeder_runs/{run_id}"""
+        db = MagicMock()
+        store = run_state.FirestoreCheckpointStore(db, 'seeder_runs')
+
+        store.save('backfill', {'status': 'running'})
+
+        db.collection.assert_called_with('seeder_runs')
+        db.collection.return_value.document.assert_called_with('backfill')
+        db.collection.return_value.document.return_value.set.assert_called_once_with({'status': 'running'})
+
+    def test_remaining_dates(self):
+        """Test only dates missing from the checkpoint are left"""
+        dates = [date(2026, 1, day) for day in (1, 2, 3)]
+
+        self.assertEqual(run_state.remaining_dates(dates, None), dates)
+        self.assertEqual(
+            run_state.remaining_dates(dates, {'processed_dates': ['2026-01-01', '2026-01-02']}), [date(2026, 1, 3)]
+        )
+        self.assertEqual(
+            run_state.remaining_dates(dates, {'processed_dates': ['2026-01-01', '2026-01-02'],
+                                              'errors': [{'date': '2026-01-02', 'error': 'timeout'}]}),
+            [date(2026, 1, 2), date(2026, 1, 3)]
+        )
+
+    def test_valid_run_id(self):
+        """Test run IDs that could escape the checkpoint directory are refused"""
+        self.assertTrue(run_state.valid_run_id('backfill-2026.h1'))
+        self.assertFalse(run_state.valid_run_id('../backfill'))
+        self.assertFalse(run_state.valid_run_id('..'))
+
+
+class TestLeaseStore(unittest.TestCase):
+    """Test the in-memory lease store used locally"""
+
+    def test_lease_is_exclusive_until_released(self):
+        """Test a second holder is refused until the first releases"""
+        leases = run_state.InMemoryLeaseStore()
+
+        self.assertTrue(leases.acquire('shard-a', 'first', 60))
+        self.assertFalse(leases.acquire('shard-a', 'second', 60))
+        self.assertTrue(leases.acquire('shard-a', 'first', 60))
+
+        leases.release('shard-a', 'second')
+        self.assertFalse(leases.acquire('shard-a', 'second', 60))
+        leases.release('shard-a', 'first')
+        self.assertTrue(leases.acquire('shard-a', 'second', 60))
+
+    def test_expired_lease_can_be_taken(self):
+        """Test a lease whose holder stopped renewing it is free again"""
+        leases = run_state.InMemoryLeaseStore()
+        leases.acquire('shard-a', 'first', -1)
+
+        self.assertEqual(leases.active(), {})
+        self.assertFalse(leases.renew('shard-a', 'second', 60))
+        self.assertTrue(leases.acquire('shard-a', 'second', 60))
+        self.assertEqual(list(leases.active('shard-')), ['shard-a'])
+
+
+@patch('run_state.SEED_CHECKPOINT_DAYS', 2)
+@patch('run_state.SEED_CHECKPOINT_STORE', 'file')
+@patch('main.prioritize_dates', new=lambda target_dates, today=None: list(target_dates))
+@patch('main.initialize_firebase')
+@patch('main.delete_old_readings', new=Mock(return_value={'deleted_count': 0, 'errors': []}))
+class TestResumableRun(unittest.TestCase):
+    """Test a run cut off part way resumes from its checkpoint"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = patch('run_state.SEED_CHECKPOINT_DIR', self.tmp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.seeded = []
+
+    def _run(self, fail_after=None, failing=()):
+        def seed_range(target_dates, *args):
+            if fail_after is not None and len(self.seeded) >= fail_after:
+                raise TimeoutError('function timeout')
+            self.seeded.extend(target_date.isoformat() for target_date in target_dates)
+            return [
+                {'status': 'error', 'error': 'USCCB timeout'} if target_date.isoformat() in failing
+                else {'status': 'success'}
+                for target_date in target_dates
+            ]
+
+        request = Mock(method='GET', args={'start_date': '2026-01-01', 'end_date': '2026-01-05', 'run_id': 'backfill'})
+        with patch('main._seed_date_range', side_effect=seed_range), \
+                patch.dict(os.environ, {'FIREBASE_CREDENTIALS_JSON': '{}'}):
+            return main.seed_daily_readings_cron(request)
+
+    def test_resume_skips_finished_dates(self, mock_fb):
+        """Test the second invocation seeds only the dates the first didn't finish"""
+        _, status_code = self._run(fail_after=2)
+        self.assertEqual(status_code, 500)
+        checkpoint = run_state.FileCheckpointStore(self.tmp.name).load('backfill')
+        self.assertEqual(checkpoint['status'], 'running')
+        self.assertEqual(checkpoint['processed_dates'], ['2026-01-01', '2026-01-02'])
+
+        self.seeded = []
+        response, status_code = self._run()
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(self.seeded, ['2026-01-03', '2026-01-04', '2026-01-05'])
+        body = response['body']
+        self.assertTrue(body['resumed'])
+        self.assertEqual(body['successful'], [f"2026-01-0{day}" for day in range(1, 6)])
+        self.assertEqual(run_state.FileCheckpointStore(self.tmp.name).load('backfill')['status'], 'complete')
+
+    def test_failed_date_is_retried_on_resume(self, mock_fb):
+        """Test a date that errored keeps the run open and is seeded by the next invocation"""
+        response, _ = self._run(failing=('2026-01-02',))
+        self.assertEqual(response['body']['errors'], [{'date': '2026-01-02', 'error': 'USCCB timeout'}])
+        self.assertEqual(run_state.FileCheckpointStore(self.tmp.name).load('backfill')['status'], 'running')
+
+        self.seeded = []
+        response, status_code = self._run()
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(self.seeded, ['2026-01-02'])
+        body = response['body']
+        self.assertEqual(body['errors'], [])
+        self.assertEqual(sorted(body['successful']), [f"2026-01-0{day}" for day in range(1, 6)])
+        self.assertEqual(sorted(body['processed_dates']), [f"2026-01-0{day}" for day in range(1, 6)])
+        self.assertEqual(run_state.FileCheckpointStore(self.tmp.name).load('backfill')['status'], 'complete')
+
+    def test_completed_run_does_nothing(self, mock_fb):
+        """Test invoking a finished run again seeds nothing"""
+        self._run()
+        self.seeded = []
+
+        response, status_code = self._run()
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(self.seeded, [])
+        self.assertEqual(len(response['body']['processed_dates']), 5)
+
+    def test_different_range_is_refused(self, mock_fb):
+        """Test a run ID can't be reused for another date range"""
+        self._run()
+        request = Mock(method='GET', args={'start_date': '2026-02-01', 'end_date': '2026-02-05', 'run_id': 'backfill'})
+
+        with patch.dict(os.environ, {'FIREBASE_CREDENTIALS_JSON': '{}'}):
+            _, status_code = main.seed_daily_readings_cron(request)
+
+        self.assertEqual(status_code, 409)
+
+
+class TestRunLease(unittest.TestCase):
+    """Test run leases on overlapping date ranges"""
+
+    def _lease(self, store, start_day, end_day, holder):
+        return run_state.RunLease({'primary': store}, date(2026, 1, start_day), date(2026, 1, end_day), holder, 60)
+
+    def test_earlier_lease_covers_overlap(self):
+        """Test the run that leased first keeps the overlap and the later one gives it up"""
+        store = run_state.InMemoryLeaseStore()
+        first, second = self._lease(store, 1, 3, 'first'), self._lease(store, 2, 5, 'second')
+        first.acquire()
+        second.acquire()
+
+        self.assertEqual(first.covered([date(2026, 1, day) for day in range(1, 4)]), [])
+        self.assertEqual(second.covered([date(2026, 1, day) for day in range(2, 6)]),
+                         [date(2026, 1, 2), date(2026, 1, 3)])
+
+    def test_same_range_is_covered_entirely(self):
+        """Test a run whose exact range is leased elsewhere can't take the lease"""
+        store = run_state.InMemoryLeaseStore()
+        self._lease(store, 1, 3, 'first').acquire()
+        retry = self._lease(store, 1, 3, 'retry')
+        retry.acquire()
+
+        self.assertEqual(retry.held, set())
+        self.assertEqual(len(retry.covered([date(2026, 1, 1), date(2026, 1, 3)])), 2)
+
+    def test_heartbeat_keeps_lease_alive(self):
+        """Test a lease outlives its TTL while the heartbeat runs and is gone after release"""
+        store = run_state.InMemoryLeaseStore()
+        lease = run_state.RunLease({'primary': store}, date(2026, 1, 1), date(2026, 1, 3), 'first', 0.2)
+        lease.acquire()
+        lease.start_heartbeat(interval=0.05)
+
+        time.sleep(0.4)
+        self.assertEqual(list(store.active()), ['run-primary-2026-01-01-2026-01-03'])
+
+        lease.release()
+        self.assertEqual(store.active(), {})
+
+
+@patch('run_state.SEED_CHECKPOINT_STORE', 'file')
+@patch('main.prioritize_dates', new=lambda target_dates, today=None: list(target_dates))
+@patch('main.initialize_firebase')
+@patch('main.delete_old_readings', new=Mock(return_value={'deleted_count': 0, 'errors': []}))
+class TestOverlappingRuns(unittest.TestCase):
+    """Test a run overlapping one already in progress"""
+
+    def setUp(self):
+        patcher = patch('run_state._memory_leases', run_state.InMemoryLeaseStore())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.seeded = []
+        # The run in progress: Jan 1-3 in the primary project
+        run_state.RunLease(
+            {'primary': run_state._memory_leases}, date(2026, 1, 1), date(2026, 1, 3), 'scheduled', 0.3
+        ).acquire()
+
+    def _run(self, on_conflict):
+        def seed_range(target_dates, *args):
+            self.seeded.extend(target_date.isoformat() for target_date in target_dates)
+            return [{'status': 'success'} for _ in target_dates]
+
+        request = Mock(method='GET', args={'start_date': '2026-01-01', 'end_date': '2026-01-05',
+                                           'on_conflict': on_conflict})
+        with patch('main._seed_date_range', side_effect=seed_range), \
+                patch.dict(os.environ, {'FIREBASE_CREDENTIALS_JSON': '{}'}):
+            return main.seed_daily_readings_cron(request)
+
+    def test_split_takes_uncovered_dates(self, mock_fb):
+        """Test the overlapping run seeds only the dates the other run hasn't leased"""
+        response, status_code = self._run('split')
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(self.seeded, ['2026-01-04', '2026-01-05'])
+        self.assertEqual(response['body']['coalesced_dates'], ['2026-01-01', '2026-01-02', '2026-01-03'])
+        self.assertEqual(response['body']['coalesced_with'], ['run-primary-2026-01-01-2026-01-03'])
+        self.assertEqual(list(run_state._memory_leases.active()), ['run-primary-2026-01-01-2026-01-03'])
+
+    def test_coalesce_exits_without_seeding(self, mock_fb):
+        """Test on_conflict=coalesce gives the whole run up"""
+        response, status_code = self._run('coalesce')
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(response['body']['status'], 'coalesced')
+        self.assertEqual(self.seeded, [])
+
+    @patch('run_state.RUN_LEASE_POLL_SECONDS', 0.05)
+    def test_wait_seeds_everything_once_the_lease_expires(self, mock_fb):
+        """Test on_conflict=wait seeds the whole range after the other run's lease lapses"""
+        response, status_code = self._run('wait')
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(response['body']['status'], 'success')
+        self.assertEqual(self.seeded, [f"2026-01-0{day}" for day in range(1, 6)])
+        self.assertEqual(run_state._memory_leases.active(), {})
+
+    @patch('run_state.RUN_LEASE_TTL_SECONDS', 0.2)
+    @patch('run_state.RUN_LEASE_POLL_SECONDS', 0.05)
+    def test_waiting_run_keeps_its_lease(self, mock_fb):
+        """Test a run that waits longer than the lease TTL still holds its lease"""
+        run_state.RunLease(
+            {'primary': run_state._memory_leases}, date(2026, 1, 1), date(2026, 1, 3), 'scheduled', 60
+        ).acquire()
+        outcome = {}
+        waiting = threading.Thread(target=lambda: outcome.update(response=self._run('wait')))
+        waiting.start()
+
+        time.sleep(0.6)
+        self.assertIn('run-primary-2026-01-01-2026-01-05', run_state._memory_leases.active())
+        run_state._memory_leases.release('run-primary-2026-01-01-2026-01-03', 'scheduled')
+        waiting.join(5)
+
+        self.assertEqual(outcome['response'][0]['body']['status'], 'success')
+        self.assertEqual(self.seeded, [f"2026-01-0{day}" for day in range(1, 6)])
+
+
+if __name__ == '__main__':
+    unittest.main()
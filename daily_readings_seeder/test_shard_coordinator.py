@@ -0,0 +1,159 @@
+"""
+Unit tests for sharded seeding: a coordinator invoking shards over HTTP
+"""
+import json
+import os
+import tempfile
+import threading
+import unittest
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
+from urllib.parse import parse_qsl, urlparse
+
+import main
+import run_state
+import shard_coordinator
+
+
+class FunctionHandler(BaseHTTPRequestHandler):
+    """Stand-in for the deployed function: answers each request with seed_daily_readings_cron"""
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        request = Mock(method='GET', args=dict(parse_qsl(url.query)), base_url=self.server.base_url)
+        body, status_code = main.seed_daily_readings_cron(request)
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestSplitIntoShards(unittest.TestCase):
+    """Test ranges are cut into consecutive shards"""
+
+    def test_split(self):
+        """Test shards hold shard_days dates, the last one the rest"""
+        dates = [date(2026, 1, 1) + timedelta(days=i) for i in range(7)]
+
+        shards = shard_coordinator.split_into_shards(dates, 3)
+
+        self.assertEqual([len(shard) for shard in shards], [3, 3, 1])
+        self.assertEqual(sum(shards, []), dates)
+        self.assertEqual(shard_coordinator.shard_run_id('coord', 2), 'coord.002')
+
+
+@patch('shard_coordinator.SHARD_DAYS', 3)
+@patch('shard_coordinator.SHARD_CONCURRENCY', 2)
+@patch('run_state.SEED_CHECKPOINT_STORE', 'file')
+@patch('main.prioritize_dates', new=lambda target_dates, today=None: list(target_dates))
+@patch('main.initialize_firebase')
+class TestCoordinator(unittest.TestCase):
+    """Test a coordinator run against a stand-in HTTP server and in-memory leases"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        for target, value in (('run_state.SEED_CHECKPOINT_DIR', tmp.name),
+                              ('run_state._memory_leases', run_state.InMemoryLeaseStore())):
+            patcher = patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.seeded = []
+        self.seeded_lock = threading.Lock()
+
+        def seed_range(target_dates, *args):
+            with self.seeded_lock:
+                self.seeded.extend(target_date.isoformat() for target_date in target_dates)
+            return [{'status': 'success'} for _ in target_dates]
+
+        self.cleanup = Mock(return_value={'deleted_count': 0, 'errors': []})
+        for patcher in (patch('main._seed_date_range', side_effect=seed_range),
+                        patch('main.delete_old_readings', self.cleanup),
+                        patch.dict(os.environ, {'FIREBASE_CREDENTIALS_JSON': '{}'})):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), FunctionHandler)
+        self.server.base_url = f"http://127.0.0.1:{self.server.server_port}/"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def _coordinate(self):
+        request = Mock(method='GET', base_url=self.server.base_url, args={
+            'mode': 'coordinate', 'start_date': '2026-01-01', 'end_date': '2026-01-10', 'run_id': 'reseed'
+        })
+        return main.seed_daily_readings_cron(request)
+
+    def test_shards_seed_the_whole_range(self, mock_fb):
+        """Test every date is seeded once, by a shard, and the results are merged"""
+        response, status_code = self._coordinate()
+
+        self.assertEqual(status_code, 200)
+        body = response['body']
+        dates = [f"2026-01-{day:02d}" for day in range(1, 11)]
+        self.assertEqual(sorted(self.seeded), dates)
+        self.assertEqual(body['successful'], dates)
+        self.assertEqual(body['status'], 'success')
+        self.assertEqual([shard['run_id'] for shard in body['shards']],
+                         ['reseed.000', 'reseed.001', 'reseed.002', 'reseed.003'])
+        self.assertTrue(all(shard['status'] == 'success' for shard in body['shards']))
+        # Only the coordinator cleans up
+        self.assertEqual(self.cleanup.call_count, 1)
+
+    def test_leased_shard_is_deferred_then_resumed(self, mock_fb):
+        """Test a shard held elsewhere is deferred, and a re-run seeds only that shard"""
+        run_state._memory_leases.acquire(shard_coordinator.shard_lease_key('reseed.001'), 'other', 60)
+
+        response, _ = self._coordinate()
+
+        body = response['body']
+        self.assertEqual(body['status'], 'partial')
+        self.assertEqual(body['shards'][1]['status'], 'leased')
+        self.assertEqual(body['deferred'], ['2026-01-04', '2026-01-05', '2026-01-06'])
+        self.assertNotIn('2026-01-04', self.seeded)
+
+        run_state._memory_leases.release(shard_coordinator.shard_lease_key('reseed.001'), 'other')
+        self.seeded = []
+        response, _ = self._coordinate()
+
+        self.assertEqual(sorted(self.seeded), ['2026-01-04', '2026-01-05', '2026-01-06'])
+        self.assertEqual(response['body']['status'], 'success')
+        self.assertEqual(len(response['body']['successful']), 10)
+        self.assertEqual(run_state._memory_leases.active(), {})
+
+    def _shard(self):
+        request = Mock(method='GET', base_url=self.server.base_url, args={
+            'start_date': '2026-01-01', 'end_date': '2026-01-03', 'run_id': 'reseed.000', 'shard_of': 'reseed'
+        })
+        return main.seed_daily_readings_cron(request)
+
+    def test_shard_lease_is_released_on_failure(self, mock_fb):
+        """Test a shard that fails before seeding doesn't keep its lease"""
+        with patch('main.prioritize_dates', side_effect=Exception('boom')):
+            _, status_code = self._shard()
+
+        self.assertEqual(status_code, 500)
+        self.assertEqual(run_state._memory_leases.active(), {})
+
+    def test_shard_lease_is_released_when_coalesced(self, mock_fb):
+        """Test a shard whose dates another run is seeding gives its lease back"""
+        run_state.RunLease(
+            {'primary': run_state._memory_leases}, date(2026, 1, 1), date(2026, 1, 3), 'scheduled', 60
+        ).acquire()
+
+        response, _ = self._shard()
+
+        self.assertEqual(response['body']['status'], 'coalesced')
+        self.assertEqual(list(run_state._memory_leases.active()), ['run-primary-2026-01-01-2026-01-03'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Unit tests for the local KJV verse store
+"""
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from verse_store import VerseStore, build_verse_store, check_verse_store, read_source
+import main
+
+
+VERSES = [
+    ('Genesis', 1, 1, 'In the beginning God created the heaven and the earth.'),
+    ('Genesis', 1, 2, 'And the earth was without form, and void;'),
+    ('Genesis', 2, 1, 'Thus the heavens and the earth were finished,'),
+    ('Psalms', 23, 1, 'The LORD is my shepherd; I shall not want.'),
+    ('Song of Solomon', 1, 1, 'The song of songs, which is Solomon’s.'),
+    ('1 John', 1, 1, 'That which was from the beginning, which we have heard,'),
+]
+
+
+class TestVerseStore(unittest.TestCase):
+    """Test building and reading the verse store"""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, 'kjv.bin')
+    
+    def _build(self, verses):
+        # Psalms 1-22 are needed so chapter 23 is numbered consecutively
+        padded = []
+        for book, chapter, verse, text in verses:
+            if book == 'Psalms':
+                padded.extend(('Psalms', c, 1, f'Psalm {c}') for c in range(1, chapter))
+            padded.append((book, chapter, verse, text))
+        build_verse_store(padded, self.path)
+        store = VerseStore(self.path)
+        self.addCleanup(store.close)
+        return store
+    
+    def test_lookup_single_verses(self):
+        """Test verses are read back exactly"""
+        store = self._build(VERSES)
+        self.assertEqual(store.get('Genesis', 1, 2), 'And the earth was without form, and void;')
+        self.assertEqual(store.get('Psalms', 23, 1), 'The LORD is my shepherd; I shall not want.')
+        self.assertEqual(store.get('1 John', 1, 1), 'That which was from the beginning, which we have heard,')
+    
+    def test_missing_verses_return_none(self):
+        """Test unknown books, chapters and verses are reported as missing"""
+        store = self._build(VERSES)
+        self.assertIsNone(store.get('Wisdom', 1, 1))
+        self.assertIsNone(store.get('Genesis', 3, 1))
+        self.assertIsNone(store.get('Genesis', 1, 3))
+        self.assertIsNone(store.get('Genesis', 0, 1))
+        self.assertIsNone(store.passage('Genesis', 1, [1, 2, 3]))
+    
+    def test_passage_and_aliases(self):
+        """Test passages join verses and lectionary book names resolve"""
+        store = self._build(VERSES)
+        self.assertEqual(
+            store.passage('Genesis', 1, [1, 2]),
+            'In the beginning God created the heaven and the earth. And the earth was without form, and void;'
+        )
+        self.assertEqual(store.get('Song of Songs', 1, 1), 'The song of songs, which is Solomon’s.')
+        self.assertEqual(store.get('1john', 1, 1), store.get('1 John', 1, 1))
+    
+    def test_out_of_order_source_is_rejected(self):
+        """Test gaps in the source numbering fail the build"""
+        with self.assertRaises(ValueError):
+            build_verse_store([('Genesis', 1, 1, 'a'), ('Genesis', 1, 3, 'c')], self.path)
+    
+    def test_build_from_json_source(self):
+        """Test unnamed JSON books take their canonical KJV names and lose italic braces"""
+        source = os.path.join(self.tmp.name, 'kjv.json')
+        with open(source, 'w', encoding='utf-8-sig') as f:
+            json.dump([
+                {'abbrev': 'gn', 'chapters': [['In the beginning God created the heaven and the earth.',
+                                               'And the earth was without form, and void; and darkness {was}']]},
+                {'abbrev': 'ex', 'chapters': [['Now these {are} the names']]},
+            ], f)
+        
+        build_verse_store(read_source(source), self.path)
+        
+        with VerseStore(self.path) as store:
+            self.assertEqual(store.get('Genesis', 1, 2), 'And the earth was without form, and void; and darkness was')
+            self.assertEqual(store.get('Exodus', 1, 1), 'Now these are the names')
+    
+    def test_check_rejects_missing_or_incomplete_store(self):
+        """Test the deploy check fails when kjv.bin would not serve lookups"""
+        with self.assertRaises(ValueError):
+            check_verse_store(self.path)
+        
+        self._build(VERSES)
+        with self.assertRaises(ValueError):
+            check_verse_store(self.path)
+        with self.assertRaises(ValueError):
+            check_verse_store(self.path, min_verses=1)  # No John 3:16
+    
+    def test_missing_store_is_logged_as_warning(self):
+        """Test a function deployed without kjv.bin says so"""
+        with patch('main.KJV_STORE_PATH', self.path), patch('main._verse_store', None), \
+                patch('main._verse_store_loaded', False), self.assertLogs('main', 'WARNING') as logs:
+            self.assertIsNone(main.get_verse_store())
+        
+        self.assertIn(self.path, logs.output[0])
+    
+    @patch('main.requests.get')
+    def test_fetch_public_scripture_text_reads_store_first(self, mock_get):
+        """Test the seeder uses the store and skips bible-api.com"""
+        self._build(VERSES)
+        with patch('main.KJV_STORE_PATH', self.path), patch('main._verse_store', None), \
+                patch('main._verse_store_loaded', False):
+            text = main.fetch_public_scripture_text('Gen 1:1-2')
+        
+        self.assertTrue(text.startswith('In the beginning'))
+        self.assertTrue(text.endswith('without form, and void;'))
+        mock_get.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
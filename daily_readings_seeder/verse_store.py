@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Local KJV Verse Store
+Compact, memory-mapped verse store packaged with the seeder so public domain
+scripture text can be read locally instead of from bible-api.com.
+
+File layout (little-endian):
+    header    magic 'KJVS', version (H), book count (H), chapter count (I), verse count (I)
+    books     per book: name length (B), UTF-8 name, first chapter index (I), chapter count (H)
+    chapters  per chapter: first verse slot (I), verse count (H)
+    offsets   verse count + 1 text offsets (I), 4-byte aligned
+    text      UTF-8 verse texts, back to back
+
+A verse is found by array arithmetic - book -> chapter row -> verse slot ->
+two offsets - so a lookup never scans or parses more than it returns, and
+opening the store only reads the small book/chapter tables.
+
+Build a store from a tab-separated "book<TAB>chapter<TAB>verse<TAB>text" file,
+or from a JSON array of books holding their chapters as lists of verse texts
+(the layout of en_kjv.json in github.com/thiagobodruk/bible), then check it:
+    python3 verse_store.py build kjv.tsv kjv.bin
+    python3 verse_store.py check kjv.bin
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import Iterable, List, Optional, Tuple
+
+MAGIC = b'KJVS'
+VERSION = 1
+_HEADER = struct.Struct('<4sHHII')
+_BOOK = struct.Struct('<IH')
+_CHAPTER = struct.Struct('<IH')
+_OFFSET = struct.Struct('<I')
+
+# The 66 KJV books in canonical order, for sources that don't name them
+KJV_BOOKS = (
+    'Genesis', 'Exodus', 'Leviticus', 'Numbers', 'Deuteronomy', 'Joshua', 'Judges', 'Ruth',
+    '1 Samuel', '2 Samuel', '1 Kings', '2 Kings', '1 Chronicles', '2 Chronicles', 'Ezra', 'Nehemiah',
+    'Esther', 'Job', 'Psalms', 'Proverbs', 'Ecclesiastes', 'Song of Solomon', 'Isaiah', 'Jeremiah',
+    'Lamentations', 'Ezekiel', 'Daniel', 'Hosea', 'Joel', 'Amos', 'Obadiah', 'Jonah', 'Micah', 'Nahum',
+    'Habakkuk', 'Zephaniah', 'Haggai', 'Zechariah', 'Malachi',
+    'Matthew', 'Mark', 'Luke', 'John', 'Acts', 'Romans', '1 Corinthians', '2 Corinthians', 'Galatians',
+    'Ephesians', 'Philippians', 'Colossians', '1 Thessalonians', '2 Thessalonians', '1 Timothy',
+    '2 Timothy', 'Titus', 'Philemon', 'Hebrews', 'James', '1 Peter', '2 Peter', '1 John', '2 John',
+    '3 John', 'Jude', 'Revelation',
+)
+# A complete KJV has 31,102 verses; fewer than this means a truncated source
+MIN_KJV_VERSES = 31000
+
+# Names bible-api.com / the lectionary use that differ from KJV book names
+BOOK_NAME_ALIASES = {
+    'songofsongs': 'songofsolomon',
+    'psalm': 'psalms',
+    'revelations': 'revelation',
+}
+
+
+def normalize_book_name(name: str) -> str:
+    """Normalize a book name for lookups ('1 Corinthians' -> '1corinthians')"""
+    key = name.lower().replace(' ', '')
+    return BOOK_NAME_ALIASES.get(key, key)
+
+
+class VerseStore:
+    """Read-only, memory-mapped verse store"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, book_count, chapter_count, verse_count = _HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"Not a version {VERSION} verse store: {path}")
+
+            # Book table -> {normalized name: (first chapter index, chapter count)}
+            self._books = {}
+            pos = _HEADER.size
+            for _ in range(book_count):
+                name_len = self._mm[pos]
+                name = self._mm[pos + 1:pos + 1 + name_len].decode('utf-8')
+                pos += 1 + name_len
+                self._books[normalize_book_name(name)] = _BOOK.unpack_from(self._mm, pos)
+                pos += _BOOK.size
+
+            self._chapters_pos = pos
+            pos += chapter_count * _CHAPTER.size
+            self._offsets_pos = pos + (-pos % 4)
+            self._text_pos = self._offsets_pos + (verse_count + 1) * _OFFSET.size
+            self.verse_count = verse_count
+        except Exception:
+            self._file.close()
+            raise
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _slot(self, book: str, chapter: int, verse: int) -> Optional[int]:
+        """Index of a verse in the offset array, or None if it doesn't exist"""
+        book_entry = self._books.get(normalize_book_name(book))
+        if book_entry is None:
+            return None
+        first_chapter, chapter_count = book_entry
+        if not 1 <= chapter <= chapter_count:
+            return None
+        first_verse, verse_count = _CHAPTER.unpack_from(
+            self._mm, self._chapters_pos + (first_chapter + chapter - 1) * _CHAPTER.size
+        )
+        if not 1 <= verse <= verse_count:
+            return None
+        return first_verse + verse - 1
+
+    def get(self, book: str, chapter: int, verse: int) -> Optional[str]:
+        """Text of a single verse, or None if the store doesn't have it"""
+        slot = self._slot(book, chapter, verse)
+        if slot is None:
+            return None
+        start, end = struct.unpack_from('<II', self._mm, self._offsets_pos + slot * _OFFSET.size)
+        return self._mm[self._text_pos + start:self._text_pos + end].decode('utf-8')
+
+    def passage(self, book: str, chapter: int, verses: Iterable[int]) -> Optional[str]:
+        """Texts of the given verses joined with spaces, or None if any verse is missing"""
+        texts = []
+        for verse in verses:
+            text = self.get(book, chapter, verse)
+            if text is None:
+                return None
+            texts.append(text)
+        return ' '.join(texts) if texts else None
+
+
+def build_verse_store(verses: Iterable[Tuple[str, int, int, str]], path: str) -> int:
+    """
+    Write a verse store file
+
+    Args:
+        verses: (book, chapter, verse, text) tuples in canonical order; chapters
+            and verses must be numbered consecutively from 1
+        path: Output file
+
+    Returns:
+        Number of verses written
+    """
+    books: List[Tuple[str, List[int]]] = []
+    texts: List[bytes] = []
+    for book, chapter, verse, text in verses:
+        if not books or books[-1][0] != book:
+            books.append((book, []))
+        chapter_counts = books[-1][1]
+        if chapter == len(chapter_counts) + 1 and verse == 1:
+            chapter_counts.append(0)
+        if chapter != len(chapter_counts) or verse != chapter_counts[-1] + 1:
+            raise ValueError(f"Verses out of order at {book} {chapter}:{verse}")
+        chapter_counts[-1] += 1
+        texts.append(' '.join(text.split()).encode('utf-8'))
+
+    chapter_count = sum(len(counts) for _, counts in books)
+    out = bytearray(_HEADER.pack(MAGIC, VERSION, len(books), chapter_count, len(texts)))
+
+    first_chapter = 0
+    for book, counts in books:
+        name = book.encode('utf-8')
+        out += struct.pack('<B', len(name)) + name + _BOOK.pack(first_chapter, len(counts))
+        first_chapter += len(counts)
+
+    first_verse = 0
+    for _, counts in books:
+        for count in counts:
+            out += _CHAPTER.pack(first_verse, count)
+            first_verse += count
+
+    out += b'\0' * (-len(out) % 4)
+    offset = 0
+    for text in texts:
+        out += _OFFSET.pack(offset)
+        offset += len(text)
+    out += _OFFSET.pack(offset)
+    for text in texts:
+        out += text
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(out)
+    os.replace(tmp_path, path)
+    return len(texts)
+
+
+def read_tsv(path: str) -> Iterable[Tuple[str, int, int, str]]:
+    """Read "book<TAB>chapter<TAB>verse<TAB>text" lines"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.rstrip('\n')
+            if not line or line.startswith('#'):
+                continue
+            parts = line.split('\t', 3)
+            if len(parts) != 4:
+                raise ValueError(f"{path}:{line_number}: expected 4 tab-separated columns")
+            book, chapter, verse, text = parts
+            yield book, int(chapter), int(verse), text
+
+
+def read_json(path: str) -> Iterable[Tuple[str, int, int, str]]:
+    """
+    Read a JSON array of books, each {"name"?, "chapters": [[verse text, ...], ...]}
+
+    Books without a name are named from KJV_BOOKS by position. Braces marking
+    the KJV's italic (supplied) words are dropped.
+    """
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        books = json.load(f)
+    for index, book in enumerate(books):
+        name = book.get('name') or KJV_BOOKS[index]
+        for chapter, verses in enumerate(book['chapters'], 1):
+            for verse, text in enumerate(verses, 1):
+                yield name, chapter, verse, text.replace('{', '').replace('}', '')
+
+
+def read_source(path: str) -> Iterable[Tuple[str, int, int, str]]:
+    """Verses from a .json or tab-separated source file"""
+    return read_json(path) if path.endswith('.json') else read_tsv(path)
+
+
+def check_verse_store(path: str, min_verses: int = MIN_KJV_VERSES) -> int:
+    """
+    Make sure a store is complete enough to deploy
+
+    Raises:
+        ValueError: The store is missing, truncated or can't serve John 3:16
+
+    Returns:
+        Number of verses in the store
+    """
+    if not os.path.exists(path):
+        raise ValueError(f"No verse store at {path}")
+    with VerseStore(path) as store:
+        if store.verse_count < min_verses:
+            raise ValueError(f"{path} has only {store.verse_count} verses (expected at least {min_verses})")
+        if not store.get('John', 3, 16):
+            raise ValueError(f"{path} has no John 3:16")
+        return store.verse_count
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 4 and sys.argv[1] == 'build':
+        count = build_verse_store(read_source(sys.argv[2]), sys.argv[3])
+        print(f"✅ Wrote {count} verses to {sys.argv[3]} ({os.path.getsize(sys.argv[3]) // 1024}KB)")
+    elif len(sys.argv) == 3 and sys.argv[1] == 'check':
+        try:
+            count = check_verse_store(sys.argv[2])
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        print(f"✅ {sys.argv[2]} has {count} verses")
+    else:
+        print("Usage: python3 verse_store.py build SOURCE.tsv|SOURCE.json OUTPUT.bin")
+        print("       python3 verse_store.py check STORE.bin")
+        sys.exit(1)
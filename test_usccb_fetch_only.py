@@ -8,6 +8,9 @@ from datetime import date
 # Add daily_readings_seeder to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'daily_readings_seeder'))
 
+# Keep USCCB pages between runs so repeat runs only revalidate (304 Not Modified)
+os.environ.setdefault('USCCB_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.usccb_cache'))
+
 from daily_readings_seeder.main import fetch_usccb_reading_data, fetch_public_scripture_text
 
 # Test date - November 23, 2025 (Sunday - should have 2nd reading)